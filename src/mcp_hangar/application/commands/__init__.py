@@ -20,7 +20,7 @@ from .handlers import (
     StopMcpServerHandler,
 )
 from .load_handlers import LoadMcpServerHandler, LoadResult, UnloadMcpServerHandler
-from .reload_handler import ReloadConfigurationHandler
+from .reload_handler import ReloadConfigurationHandler, ReloadResult
 
 __all__ = [
     # Commands
@@ -45,6 +45,7 @@ __all__ = [
     "UnloadMcpServerHandler",
     "LoadResult",
     "ReloadConfigurationHandler",
+    "ReloadResult",
 ]
 
 import sys
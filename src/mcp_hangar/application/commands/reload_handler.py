@@ -1,7 +1,14 @@
 """Command handler for configuration reload."""
 
+from concurrent.futures import Future, ThreadPoolExecutor
+import contextvars
+from collections.abc import Callable
+from dataclasses import dataclass
+import hashlib
+from itertools import chain
+import json
 import time
-from typing import Any
+from typing import Any, ClassVar
 
 from ...domain.contracts.command import CommandHandler
 from ...domain.contracts.event_bus import IEventBus
@@ -15,6 +22,77 @@ from .commands import ReloadConfigurationCommand
 
 logger = get_logger(__name__)
 
+# Upper bound on concurrent shutdowns during one reload. Each is a thread that
+# mostly waits on a process or container, so this bounds threads, not CPU.
+_MAX_STOP_WORKERS = 32
+
+# `requested_by` of reloads fired by the config file watcher, the only ones
+# that may skip re-applying an unchanged file
+_WATCHER = "file_watcher"
+
+
+def _as_is(value: Any) -> Any:
+    return value
+
+
+def _or_empty_dict(value: Any) -> Any:
+    return value or {}
+
+
+def _or_empty_list(value: Any) -> Any:
+    return value or []
+
+
+def _or_default(default: Any) -> Callable[[Any], Any]:
+    def normalize(value: Any) -> Any:
+        return default if value is None else value
+
+    return normalize
+
+
+def _config_hash(mcp_servers_config: dict[str, Any]) -> bytes:
+    """Digest of an `mcp_servers` section, independent of key order."""
+    serialized = json.dumps(mcp_servers_config, sort_keys=True, default=str)
+    return hashlib.blake2b(serialized.encode(), digest_size=16).digest()
+
+
+@dataclass(frozen=True, slots=True)
+class ReloadResult:
+    """Outcome of a successful configuration reload.
+
+    A failed reload raises `ConfigurationError` instead, so `success` is always
+    True; it is kept because the serialized shape has always carried it.
+
+    Attributes:
+        config_path: Configuration file that was loaded.
+        mcp_servers_added: Ids present only in the new configuration.
+        mcp_servers_removed: Ids present only in the old configuration.
+        mcp_servers_updated: Ids whose configuration changed (restarted).
+        mcp_servers_unchanged: Ids left running untouched.
+        duration_ms: Wall-clock duration of the reload.
+        success: Always True; see above.
+    """
+
+    config_path: str
+    mcp_servers_added: list[str]
+    mcp_servers_removed: list[str]
+    mcp_servers_updated: list[str]
+    mcp_servers_unchanged: list[str]
+    duration_ms: float
+    success: bool = True
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "success": self.success,
+            "config_path": self.config_path,
+            "mcp_servers_added": self.mcp_servers_added,
+            "mcp_servers_removed": self.mcp_servers_removed,
+            "mcp_servers_updated": self.mcp_servers_updated,
+            "mcp_servers_unchanged": self.mcp_servers_unchanged,
+            "duration_ms": self.duration_ms,
+        }
+
 
 class ReloadConfigurationHandler(CommandHandler):
     """Handler for ReloadConfigurationCommand.
@@ -26,6 +104,26 @@ class ReloadConfigurationHandler(CommandHandler):
     - Preserves unchanged mcp_servers (no restart)
     """
 
+    # What `_config_differs` compares, and how: each field that affects
+    # mcp_server behavior, in comparison order, with the normalizer that makes
+    # an unset value equal to its default. Built once with the class rather
+    # than on every call.
+    _KEY_FIELD_NORMALIZERS: ClassVar[tuple[tuple[str, Callable[[Any], Any]], ...]] = (
+        ("mode", _as_is),
+        ("command", _or_empty_list),
+        ("image", _as_is),
+        ("endpoint", _as_is),
+        ("env", _or_empty_dict),
+        ("idle_ttl_s", _or_default(300)),
+        ("health_check_interval_s", _or_default(60)),
+        ("max_consecutive_failures", _or_default(3)),
+        ("volumes", _or_empty_list),
+        ("build", _as_is),
+        ("resources", _or_empty_dict),
+        ("network", _or_default("none")),
+        ("user", _as_is),
+    )
+
     def __init__(
         self,
         mcp_server_repository: IMcpServerRepository,
@@ -55,15 +153,18 @@ class ReloadConfigurationHandler(CommandHandler):
         self._current_config_path = current_config_path
         self._config_loader = config_loader
         self._groups = groups if groups is not None else {}
+        # (config_path, digest) of the last `mcp_servers` section this handler
+        # applied; None until a reload succeeds, and reset when one fails.
+        self._last_applied: tuple[str, bytes] | None = None
 
-    def handle(self, command: ReloadConfigurationCommand) -> dict[str, Any]:  # noqa: C901 -- baseline CC=16; split before extending
+    def handle(self, command: ReloadConfigurationCommand) -> ReloadResult:
         """Handle the reload configuration command.
 
         Args:
             command: The command to handle.
 
         Returns:
-            Dictionary with reload results.
+            What the reload added, removed, updated and left unchanged.
 
         Raises:
             ConfigurationError: If configuration is invalid or cannot be loaded.
@@ -75,8 +176,11 @@ class ReloadConfigurationHandler(CommandHandler):
         if not config_path:
             raise ConfigurationError("No configuration path specified")
 
-        # Publish reload requested event
-        self._event_bus.publish(
+        # Publish reload requested event. All three reload events go through
+        # `publish_nowait`: nothing here reads what a subscriber does with them,
+        # so subscriber latency stays out of the reload. Timing is measured
+        # before each hand-over, so the events still carry accurate durations.
+        self._event_bus.publish_nowait(
             ConfigurationReloadRequested(
                 config_path=config_path,
                 requested_by=command.requested_by,
@@ -89,28 +193,23 @@ class ReloadConfigurationHandler(CommandHandler):
             new_full_config = self._config_loader.load_from_file(config_path)
             new_mcp_servers_config = new_full_config.get("mcp_servers", {})
 
-            # Capture current state
-            current_mcp_servers = dict(self._repository.get_all())
+            new_hash = _config_hash(new_mcp_servers_config)
+            if (
+                command.graceful
+                and command.requested_by == _WATCHER
+                and self._is_noop(config_path, new_hash, new_mcp_servers_config)
+            ):
+                return self._noop_result(command, config_path, new_mcp_servers_config, start_time)
+
+            # Capture current state. `get_all()` already returns a snapshot
+            # taken under the repository lock; copying it again buys nothing.
+            current_mcp_servers = self._repository.get_all()
             # Note: Group reload not yet implemented (GROUPS state captured but not used)
 
             # Calculate diff
-            new_ids = set(new_mcp_servers_config.keys())
-            current_ids = set(current_mcp_servers.keys())
-
-            added_ids = new_ids - current_ids
-            removed_ids = current_ids - new_ids
-            potentially_updated_ids = new_ids & current_ids
-
-            # Check for actual configuration changes
-            updated_ids = []
-            unchanged_ids = []
-            for mcp_server_id in potentially_updated_ids:
-                old_spec = self._get_mcp_server_spec(current_mcp_servers[mcp_server_id])
-                new_spec = new_mcp_servers_config[mcp_server_id]
-                if self._config_differs(old_spec, new_spec):
-                    updated_ids.append(mcp_server_id)
-                else:
-                    unchanged_ids.append(mcp_server_id)
+            added_ids, removed_ids, updated_ids, unchanged_ids = self._diff_mcp_servers(
+                current_mcp_servers, new_mcp_servers_config
+            )
 
             logger.info(
                 "config_reload_diff_calculated",
@@ -122,33 +221,22 @@ class ReloadConfigurationHandler(CommandHandler):
 
             # Apply changes atomically
             # 1. Stop removed and updated mcp_servers
-            for mcp_server_id in list(removed_ids) + updated_ids:
-                mcp_server = current_mcp_servers.get(mcp_server_id)
-                if mcp_server:
-                    try:
-                        # McpServer exposes shutdown() as its lifecycle API.
-                        # Stop failures must abort reload rather than report a
-                        # successful replacement with the old runtime still alive.
-                        mcp_server.shutdown()
-
-                        logger.info(
-                            "mcp_server_stopped_for_reload",
-                            mcp_server_id=mcp_server_id,
-                            graceful=command.graceful,
-                        )
-                    except Exception as e:  # noqa: BLE001 -- preserve the shutdown failure as a reload failure
-                        logger.error(
-                            "mcp_server_stop_failed_during_reload",
-                            mcp_server_id=mcp_server_id,
-                            error=str(e),
-                        )
-                        raise ConfigurationError(f"Failed to stop mcp_server '{mcp_server_id}' for reload: {e}") from e
-
-            # 2. Remove deleted mcp_servers from repository
+            self._stop_mcp_servers(
+                [
+                    (mcp_server_id, mcp_server)
+                    for mcp_server_id in chain(removed_ids, updated_ids)
+                    if (mcp_server := current_mcp_servers.get(mcp_server_id))
+                ],
+                graceful=command.graceful,
+            )
+
+            # 2. Remove deleted mcp_servers from repository. Not folded into
+            # step 1: nothing may be removed until every stop has succeeded.
+            # `removed_ids` is drawn from `current_mcp_servers`, so every id in
+            # it is there to remove.
             for mcp_server_id in removed_ids:
-                if mcp_server_id in current_mcp_servers:
-                    self._repository.remove(mcp_server_id)
-                    logger.info("mcp_server_removed", mcp_server_id=mcp_server_id)
+                self._repository.remove(mcp_server_id)
+                logger.info("mcp_server_removed", mcp_server_id=mcp_server_id)
 
             # 3. Clear groups (will be reloaded)
             self._groups.clear()
@@ -188,11 +276,13 @@ class ReloadConfigurationHandler(CommandHandler):
                 if mcp_server:
                     logger.info("mcp_server_updated", mcp_server_id=mcp_server_id)
 
+            self._last_applied = (config_path, new_hash)
+
             # Calculate duration
             duration_ms = (time.perf_counter() - start_time) * 1000
 
             # Publish success event
-            self._event_bus.publish(
+            self._event_bus.publish_nowait(
                 ConfigurationReloaded(
                     config_path=config_path,
                     mcp_servers_added=list(added_ids),
@@ -213,21 +303,23 @@ class ReloadConfigurationHandler(CommandHandler):
                 updated=len(updated_ids),
             )
 
-            return {
-                "success": True,
-                "config_path": config_path,
-                "mcp_servers_added": list(added_ids),
-                "mcp_servers_removed": list(removed_ids),
-                "mcp_servers_updated": updated_ids,
-                "mcp_servers_unchanged": unchanged_ids,
-                "duration_ms": duration_ms,
-            }
+            return ReloadResult(
+                config_path=config_path,
+                mcp_servers_added=list(added_ids),
+                mcp_servers_removed=list(removed_ids),
+                mcp_servers_updated=updated_ids,
+                mcp_servers_unchanged=unchanged_ids,
+                duration_ms=duration_ms,
+            )
 
         except Exception as e:  # noqa: BLE001 -- fault-barrier: wrap reload errors in ConfigurationError for callers
+            # A failed reload may have stopped or removed mcp_servers, so the
+            # running state no longer matches the last applied config.
+            self._last_applied = None
             duration_ms = (time.perf_counter() - start_time) * 1000
 
             # Publish failure event
-            self._event_bus.publish(
+            self._event_bus.publish_nowait(
                 ConfigurationReloadFailed(
                     config_path=config_path,
                     reason=str(e),
@@ -258,6 +350,150 @@ class ReloadConfigurationHandler(CommandHandler):
             # operators; the caller gets a generic 500 with nothing to leak.
             raise ConfigurationError("Configuration reload failed due to an internal error") from e
 
+    def _is_noop(self, config_path: str, new_hash: bytes, new_mcp_servers_config: dict[str, Any]) -> bool:
+        """Whether applying `new_mcp_servers_config` would change nothing.
+
+        True when it is byte-for-byte the section this handler last applied
+        from the same file, and the repository still holds exactly its ids.
+        Config watchers re-fire on a `touch` or an editor's save-without-change;
+        this keeps those from restarting anything or clearing policy state.
+
+        Only consulted for watcher-triggered reloads. An mcp_server updated in
+        place since the last apply (REST update, `UpdateMcpServerHandler`)
+        keeps its id, so only the full spec diff sees that drift; an explicit
+        reload is how an operator asks for it to be reconciled.
+        """
+        if self._last_applied != (config_path, new_hash):
+            return False
+        return self._repository.get_all().keys() == new_mcp_servers_config.keys()
+
+    def _noop_result(
+        self,
+        command: ReloadConfigurationCommand,
+        config_path: str,
+        new_mcp_servers_config: dict[str, Any],
+        start_time: float,
+    ) -> ReloadResult:
+        """Complete a reload that `_is_noop` found to have nothing to apply."""
+        unchanged_ids = list(new_mcp_servers_config)
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        # Still published, so every ConfigurationReloadRequested is answered.
+        self._event_bus.publish_nowait(
+            ConfigurationReloaded(
+                config_path=config_path,
+                mcp_servers_added=[],
+                mcp_servers_removed=[],
+                mcp_servers_updated=[],
+                mcp_servers_unchanged=unchanged_ids,
+                reload_duration_ms=duration_ms,
+                requested_by=command.requested_by,
+            )
+        )
+        logger.info("config_reload_noop", config_path=config_path, duration_ms=duration_ms)
+        return ReloadResult(
+            config_path=config_path,
+            mcp_servers_added=[],
+            mcp_servers_removed=[],
+            mcp_servers_updated=[],
+            mcp_servers_unchanged=unchanged_ids,
+            duration_ms=duration_ms,
+        )
+
+    def _stop_mcp_servers(self, to_stop: list[tuple[str, Any]], *, graceful: bool) -> None:
+        """Shut down every mcp_server in `to_stop`, concurrently.
+
+        Shutdowns are independent and mostly wait -- on a subprocess exiting or
+        a container stopping -- so the reload waits for the slowest one instead
+        of the sum of all of them. Each shutdown runs in a copy of the caller's
+        context, so its log lines keep the reload's correlation fields.
+
+        Every shutdown is attempted even when one fails, and the reload is then
+        aborted for the first failure in `to_stop` order: reporting a successful
+        replacement with an old runtime still alive is the outcome to avoid.
+
+        Args:
+            to_stop: (mcp_server_id, aggregate) pairs to shut down.
+            graceful: Only recorded in the log; `shutdown()` takes no such flag.
+
+        Raises:
+            ConfigurationError: If any shutdown raised.
+        """
+        if not to_stop:
+            return
+
+        futures: list[tuple[str, Future[None]]] = []
+        with ThreadPoolExecutor(max_workers=min(_MAX_STOP_WORKERS, len(to_stop))) as executor:
+            for mcp_server_id, mcp_server in to_stop:
+                # One context copy per task: a Context cannot be entered by two
+                # threads at once.
+                context = contextvars.copy_context()
+                future = executor.submit(context.run, self._stop_one, mcp_server_id, mcp_server, graceful)
+                futures.append((mcp_server_id, future))
+
+        # Leaving the `with` waited for every shutdown.
+        for mcp_server_id, future in futures:
+            error = future.exception()
+            if error is not None:
+                raise ConfigurationError(f"Failed to stop mcp_server '{mcp_server_id}' for reload: {error}") from error
+
+    def _stop_one(self, mcp_server_id: str, mcp_server: Any, graceful: bool) -> None:
+        """Shut down one mcp_server for reload, logging the outcome."""
+        try:
+            # McpServer exposes shutdown() as its lifecycle API.
+            mcp_server.shutdown()
+        except Exception as e:  # noqa: BLE001 -- logged here, re-raised so the reload aborts
+            logger.error(
+                "mcp_server_stop_failed_during_reload",
+                mcp_server_id=mcp_server_id,
+                error=str(e),
+            )
+            raise
+        logger.info(
+            "mcp_server_stopped_for_reload",
+            mcp_server_id=mcp_server_id,
+            graceful=graceful,
+        )
+
+    def _diff_mcp_servers(
+        self,
+        current_mcp_servers: dict[str, Any],
+        new_mcp_servers_config: dict[str, Any],
+    ) -> tuple[set[str], set[str], list[str], list[str]]:
+        """Split mcp_server ids into added, removed, updated and unchanged.
+
+        The aggregates do not change while a reload computes its diff, so the
+        spec of each one is extracted at most once per call. The cache is keyed
+        by aggregate identity rather than by id: the same instance reachable
+        under two ids is still walked once.
+
+        Args:
+            current_mcp_servers: Snapshot of the repository, id -> aggregate.
+            new_mcp_servers_config: The `mcp_servers` section of the new config.
+
+        Returns:
+            Tuple of (added_ids, removed_ids, updated_ids, unchanged_ids).
+        """
+        new_ids = set(new_mcp_servers_config.keys())
+        current_ids = set(current_mcp_servers.keys())
+
+        added_ids = new_ids - current_ids
+        removed_ids = current_ids - new_ids
+
+        spec_cache: dict[int, dict[str, Any]] = {}
+        updated_ids: list[str] = []
+        unchanged_ids: list[str] = []
+        for mcp_server_id in new_ids & current_ids:
+            mcp_server = current_mcp_servers[mcp_server_id]
+            old_spec = spec_cache.get(id(mcp_server))
+            if old_spec is None:
+                old_spec = spec_cache[id(mcp_server)] = self._get_mcp_server_spec(mcp_server)
+            if self._config_differs(old_spec, new_mcp_servers_config[mcp_server_id]):
+                updated_ids.append(mcp_server_id)
+            else:
+                unchanged_ids.append(mcp_server_id)
+
+        return added_ids, removed_ids, updated_ids, unchanged_ids
+
     def _get_mcp_server_spec(self, mcp_server) -> dict[str, Any]:
         """Extract configuration spec from mcp_server aggregate.
 
@@ -273,19 +509,11 @@ class ReloadConfigurationHandler(CommandHandler):
             "image": mcp_server._image,
             "endpoint": mcp_server._endpoint,
             "env": mcp_server._env,
-            "idle_ttl_s": mcp_server._idle_ttl.seconds
-            if hasattr(mcp_server._idle_ttl, "seconds")
-            else mcp_server._idle_ttl,
-            "health_check_interval_s": (
-                mcp_server._health_check_interval.seconds
-                if hasattr(mcp_server._health_check_interval, "seconds")
-                else 60
-            ),
-            "max_consecutive_failures": (
-                mcp_server._health.max_consecutive_failures
-                if hasattr(mcp_server._health, "max_consecutive_failures")
-                else 3
-            ),
+            # getattr with a default rather than hasattr-then-read: one
+            # attribute lookup instead of two on the reload diff path.
+            "idle_ttl_s": getattr(mcp_server._idle_ttl, "seconds", mcp_server._idle_ttl),
+            "health_check_interval_s": getattr(mcp_server._health_check_interval, "seconds", 60),
+            "max_consecutive_failures": getattr(mcp_server._health, "max_consecutive_failures", 3),
             "volumes": mcp_server._volumes,
             "build": mcp_server._build,
             "resources": mcp_server._resources,
@@ -309,53 +537,16 @@ class ReloadConfigurationHandler(CommandHandler):
         Returns:
             True if configurations differ, False otherwise.
         """
-        # Default values for mcp_server fields
-        DEFAULTS = {
-            "idle_ttl_s": 300,
-            "health_check_interval_s": 60,
-            "max_consecutive_failures": 3,
-            "network": "none",
-            "read_only": True,
-        }
-
-        # Compare key fields that affect mcp_server behavior
-        key_fields = [
-            "mode",
-            "command",
-            "image",
-            "endpoint",
-            "env",
-            "idle_ttl_s",
-            "health_check_interval_s",
-            "max_consecutive_failures",
-            "volumes",
-            "build",
-            "resources",
-            "network",
-            "user",
-        ]
-
-        for field in key_fields:
-            old_value = old_spec.get(field)
-            new_value = new_spec.get(field)
-
-            # Normalize empty values for env (None, {}, etc.)
-            if field in ("env", "resources"):
-                old_value = old_value or {}
-                new_value = new_value or {}
-
-            # Normalize empty lists/None
-            if field in ("volumes", "command"):
-                old_value = old_value or []
-                new_value = new_value or []
-
-            # Normalize default values - None in new_spec means use default
-            if field in DEFAULTS:
-                if new_value is None:
-                    new_value = DEFAULTS[field]
-                if old_value is None:
-                    old_value = DEFAULTS[field]
-
+        old_values = self._key_values(old_spec)
+        new_values = self._key_values(new_spec)
+        # One tuple comparison settles the common case -- nothing changed --
+        # without a Python-level step per field.
+        if old_values == new_values:
+            return False
+
+        for (field, _normalize), old_value, new_value in zip(
+            self._KEY_FIELD_NORMALIZERS, old_values, new_values, strict=True
+        ):
             if old_value != new_value:
                 logger.debug(
                     "config_field_differs",
@@ -363,6 +554,13 @@ class ReloadConfigurationHandler(CommandHandler):
                     old=old_value,
                     new=new_value,
                 )
-                return True
+                break
+        return True
 
-        return False
+    def _key_values(self, spec: dict[str, Any]) -> tuple[Any, ...]:
+        """Normalized values of the fields `_config_differs` compares, in order.
+
+        `.get` rather than `operator.itemgetter`: a spec read from the config
+        file routinely omits fields, and a missing field means its default.
+        """
+        return tuple(normalize(spec.get(field)) for field, normalize in self._KEY_FIELD_NORMALIZERS)
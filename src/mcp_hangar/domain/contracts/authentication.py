@@ -5,6 +5,7 @@ Infrastructure layer provides concrete implementations.
 """
 
 from abc import abstractmethod
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime, UTC
 from typing import Protocol, runtime_checkable
@@ -20,14 +21,14 @@ class AuthRequest:
     abstracted from the transport layer (HTTP, gRPC, etc.).
 
     Attributes:
-        headers: Request headers as a case-insensitive dict.
+        headers: Request headers as a case-insensitive mapping.
         source_ip: IP address of the request origin.
         method: HTTP method or equivalent (GET, POST, etc.).
         path: Request path/endpoint.
         metadata: Additional context for authentication decisions.
     """
 
-    headers: dict[str, str]
+    headers: Mapping[str, str]
     source_ip: str
     method: str = ""
     path: str = ""
@@ -55,6 +55,19 @@ class IEventBus(ABC):
             event: The domain event to publish.
         """
 
+    def publish_nowait(self, event: DomainEvent) -> None:
+        """Publish a domain event without waiting for its subscribers.
+
+        For callers on a latency-sensitive path that do not read anything the
+        subscribers produce. Events handed over this way are published in the
+        order they were handed over. The default delivers inline, exactly like
+        `publish`; a bus with somewhere to defer the work to overrides it.
+
+        Args:
+            event: The domain event to publish.
+        """
+        self.publish(event)
+
     @abstractmethod
     def publish_aggregate_events(
         self,
@@ -38,13 +38,22 @@ class IResponseCache(ABC):
     """
 
     @abstractmethod
-    def store(self, continuation_id: str, full_response: Any, ttl_s: int) -> None:
+    def store(
+        self,
+        continuation_id: str,
+        full_response: Any,
+        ttl_s: int,
+        *,
+        serialized: str | None = None,
+    ) -> None:
         """Store a full response for later retrieval.
 
         Args:
             continuation_id: Unique identifier for this cached response.
             full_response: The complete response data to cache.
             ttl_s: Time-to-live in seconds before the entry expires.
+            serialized: `json.dumps(full_response)`, if the caller already
+                has it; saves serializing the response a second time.
         """
 
     @abstractmethod
@@ -91,7 +100,14 @@ class NullResponseCache(IResponseCache):
     All operations are no-ops or return empty results.
     """
 
-    def store(self, continuation_id: str, full_response: Any, ttl_s: int) -> None:
+    def store(
+        self,
+        continuation_id: str,
+        full_response: Any,
+        ttl_s: int,
+        *,
+        serialized: str | None = None,
+    ) -> None:
         """No-op store."""
         pass
 
@@ -6,11 +6,11 @@ Contains:
 """
 
 from dataclasses import dataclass
+import secrets
 from typing import Any
-import uuid
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TruncationConfig:
     """Configuration for batch response truncation.
 
@@ -61,7 +61,8 @@ class TruncationConfig:
         """Create TruncationConfig from a dictionary.
 
         Args:
-            data: Configuration dictionary. If None, returns default config.
+            data: Configuration dictionary. If None or empty, returns the
+                shared default config.
 
         Returns:
             TruncationConfig instance.
@@ -70,7 +71,8 @@ class TruncationConfig:
             ValueError: If configuration values are invalid.
         """
         if not data:
-            return cls()
+            # Frozen, so one validated default serves every caller.
+            return _DEFAULT_TRUNCATION_CONFIG
 
         return cls(
             enabled=data.get("enabled", False),
@@ -85,6 +87,9 @@ class TruncationConfig:
         )
 
 
+_DEFAULT_TRUNCATION_CONFIG = TruncationConfig()
+
+
 @dataclass(frozen=True)
 class ContinuationId:
     """Identifier for retrieving full response from a truncated result.
@@ -115,7 +120,10 @@ class ContinuationId:
         Returns:
             A new ContinuationId instance.
         """
-        uuid8 = uuid.uuid4().hex[:8]
+        # Four random bytes formatted straight to eight hex characters: the
+        # same 32 bits `uuid4().hex[:8]` kept, without building a UUID to
+        # throw most of it away.
+        uuid8 = secrets.token_hex(4)
         return cls(value=f"cont_{batch_id}_{call_index}_{uuid8}")
 
     def __str__(self) -> str:
@@ -35,24 +35,62 @@ Usage:
         .build())
 """
 
-from .builder import MCPServerFactoryBuilder
-from .config import HangarFunctions, ServerConfig
-from .factory import MCPServerFactory
-from .protocols import (
-    HangarApproveFn,
-    HangarDetailsFn,
-    HangarDiscoveredFn,
-    HangarDiscoverFn,
-    HangarHealthFn,
-    HangarInvokeFn,
-    HangarListFn,
-    HangarMetricsFn,
-    HangarQuarantineFn,
-    HangarSourcesFn,
-    HangarStartFn,
-    HangarStopFn,
-    HangarToolsFn,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .builder import MCPServerFactoryBuilder
+    from .config import HangarFunctions, ServerConfig
+    from .factory import MCPServerFactory
+    from .protocols import (
+        HangarApproveFn,
+        HangarDetailsFn,
+        HangarDiscoveredFn,
+        HangarDiscoverFn,
+        HangarHealthFn,
+        HangarInvokeFn,
+        HangarListFn,
+        HangarMetricsFn,
+        HangarQuarantineFn,
+        HangarSourcesFn,
+        HangarStartFn,
+        HangarStopFn,
+        HangarToolsFn,
+    )
+
+# Public name -> submodule that defines it. Resolved on first attribute access
+# (PEP 562) rather than at import: bootstrap imports `fastmcp_server.config` on
+# every entry point, stdio included, and an eager `__init__` dragged the HTTP
+# factory -- and Starlette with it -- into processes that never serve HTTP.
+_LAZY_EXPORTS = {
+    "MCPServerFactory": ".factory",
+    "MCPServerFactoryBuilder": ".builder",
+    "HangarFunctions": ".config",
+    "ServerConfig": ".config",
+    "HangarListFn": ".protocols",
+    "HangarStartFn": ".protocols",
+    "HangarStopFn": ".protocols",
+    "HangarInvokeFn": ".protocols",
+    "HangarToolsFn": ".protocols",
+    "HangarDetailsFn": ".protocols",
+    "HangarHealthFn": ".protocols",
+    "HangarDiscoverFn": ".protocols",
+    "HangarDiscoveredFn": ".protocols",
+    "HangarQuarantineFn": ".protocols",
+    "HangarApproveFn": ".protocols",
+    "HangarSourcesFn": ".protocols",
+    "HangarMetricsFn": ".protocols",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Factory API
@@ -2,27 +2,41 @@
 
 Provides functions to create ASGI applications with health endpoints
 and optional authentication middleware.
+
+Starlette is imported inside the functions that build HTTP objects, not at
+module scope: `_principal_to_identity_context` is imported from the tool
+invocation paths, which run in stdio mode too, where no HTTP app exists.
 """
 
-from collections.abc import Callable
-from typing import Any, TYPE_CHECKING
+from __future__ import annotations
 
-from starlette.applications import Starlette
-from starlette.responses import JSONResponse, PlainTextResponse
-from starlette.routing import Route
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from functools import partial
+from typing import Any, TYPE_CHECKING
 
 from ..context import identity_context_var
 from ..domain.value_objects.identity import CallerIdentity, IdentityContext
 from ..domain.value_objects.security import PrincipalType
 from ..logging_config import get_logger
+from ..metrics import get_metrics
 from ..trusted_hosts import WILDCARD, trusted_hosts
 
 if TYPE_CHECKING:
     from typing import Any as AuthComponents
+
+    from starlette.applications import Starlette
+    from starlette.requests import Request
+    from starlette.responses import Response
+    from starlette.routing import Route
+
     from .config import ServerConfig
 
 logger = get_logger(__name__)
 
+# Paths `create_combined_asgi_app` hands to the auxiliary app; the routes
+# `create_health_routes` builds.
+_AUX_PATHS: frozenset[str] = frozenset(("/health", "/ready", "/metrics"))
+
 
 def _principal_to_identity_context(principal: Any) -> IdentityContext:
     """Bridge an authenticated Principal to an IdentityContext for identity_context_var.
@@ -83,12 +97,75 @@ def _principal_to_identity_context(principal: Any) -> IdentityContext:
     )
 
 
+class _ScopeHeaders(Mapping[str, str]):
+    """Case-insensitive, read-only view of an ASGI scope's headers.
+
+    Built on every authenticated request, and authentication reads two or three
+    headers out of however many the client sent. So the names stay bytes, and a
+    value is decoded only when something asks for it, instead of decoding every
+    pair into a fresh `str` dict up front. A repeated header keeps its last
+    value, as the dict this replaces did.
+    """
+
+    __slots__ = ("_raw",)
+
+    def __init__(self, raw_headers: Iterable[tuple[bytes, bytes]]) -> None:
+        # ASGI servers send lowercased names; `.lower()` on bytes keeps a
+        # non-conforming one working without decoding anything.
+        self._raw = {key.lower(): value for key, value in raw_headers}
+
+    def __getitem__(self, name: str) -> str:
+        try:
+            return self._raw[name.lower().encode("latin-1")].decode("latin-1")
+        except (KeyError, UnicodeEncodeError):
+            raise KeyError(name) from None
+
+    def __iter__(self) -> Iterator[str]:
+        return (key.decode("latin-1") for key in self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+
+async def _health_endpoint(request: Request) -> Response:
+    """Liveness endpoint (cheap ping)."""
+    from starlette.responses import JSONResponse
+
+    return JSONResponse({"status": "ok", "service": "mcp-hangar"})
+
+
+async def _ready_endpoint(run_readiness_checks: Callable[[], dict[str, Any]], request: Request) -> Response:
+    """Readiness endpoint with internal checks."""
+    from starlette.responses import JSONResponse
+
+    checks = run_readiness_checks()
+    ready = all(v is True for k, v in checks.items() if isinstance(v, bool))
+    return JSONResponse(
+        {"ready": ready, "service": "mcp-hangar", "checks": checks},
+        status_code=200 if ready else 503,
+    )
+
+
+async def _metrics_endpoint(update_metrics: Callable[[], None], request: Request) -> Response:
+    """Prometheus metrics endpoint."""
+    from starlette.responses import PlainTextResponse
+
+    update_metrics()
+    return PlainTextResponse(
+        get_metrics(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
 def create_health_routes(
     run_readiness_checks: Callable[[], dict[str, Any]],
     update_metrics: Callable[[], None],
 ) -> list[Route]:
     """Create health, readiness, and metrics routes.
 
+    The endpoints are defined once, at module scope; only the two callables
+    differ between factories, and they are bound here with `partial`.
+
     Args:
         run_readiness_checks: Callable that returns readiness check results.
         update_metrics: Callable to update metrics before serving.
@@ -96,33 +173,12 @@ def create_health_routes(
     Returns:
         List of Starlette Route objects.
     """
-    from ..metrics import get_metrics
-
-    async def health_endpoint(request):
-        """Liveness endpoint (cheap ping)."""
-        return JSONResponse({"status": "ok", "service": "mcp-hangar"})
-
-    async def ready_endpoint(request):
-        """Readiness endpoint with internal checks."""
-        checks = run_readiness_checks()
-        ready = all(v is True for k, v in checks.items() if isinstance(v, bool))
-        return JSONResponse(
-            {"ready": ready, "service": "mcp-hangar", "checks": checks},
-            status_code=200 if ready else 503,
-        )
-
-    async def metrics_endpoint(request):
-        """Prometheus metrics endpoint."""
-        update_metrics()
-        return PlainTextResponse(
-            get_metrics(),
-            media_type="text/plain; version=0.0.4; charset=utf-8",
-        )
+    from starlette.routing import Route
 
     return [
-        Route("/health", health_endpoint, methods=["GET"]),
-        Route("/ready", ready_endpoint, methods=["GET"]),
-        Route("/metrics", metrics_endpoint, methods=["GET"]),
+        Route("/health", _health_endpoint, methods=["GET"]),
+        Route("/ready", partial(_ready_endpoint, run_readiness_checks), methods=["GET"]),
+        Route("/metrics", partial(_metrics_endpoint, update_metrics), methods=["GET"]),
     ]
 
 
@@ -148,7 +204,7 @@ def create_combined_asgi_app(
         if scope_type in ("http", "websocket"):
             path = scope.get("path", "")
             # Health/metrics only available on HTTP (not WebSocket).
-            if scope_type == "http" and path in ("/health", "/ready", "/metrics"):
+            if scope_type == "http" and path in _AUX_PATHS:
                 await aux_app(scope, receive, send)
                 return
             if api_app is not None and (path == "/api" or path.startswith("/api/")):
@@ -226,8 +282,8 @@ def _ws_handshake_allowed(scope: dict) -> tuple[bool, str]:
 def create_auth_combined_app(
     aux_app: Starlette,
     mcp_app: Any,
-    auth_components: "AuthComponents",
-    config: "ServerConfig",
+    auth_components: AuthComponents,
+    config: ServerConfig,
     api_app: Any = None,
 ) -> Any:
     """Create auth-enabled combined ASGI app.
@@ -245,6 +301,8 @@ def create_auth_combined_app(
     Returns:
         Combined ASGI app with auth middleware.
     """
+    from starlette.responses import JSONResponse
+
     from ..auth.prm import build_resource_base_url, build_www_authenticate
     from ..domain.contracts.authentication import AuthRequest
     from ..domain.exceptions import AccessDeniedError, AuthenticationError
@@ -253,8 +311,11 @@ def create_auth_combined_app(
     _oidc_issuer = getattr(auth_components, "oidc_issuer", "")
     _oidc_resource_uri_cfg = getattr(auth_components, "oidc_resource_uri", "")
 
-    skip_paths = set(config.auth_skip_paths)
-    trusted_proxies = config.trusted_proxies
+    # Frozen once, here, rather than trusted to arrive as sets: both are probed
+    # on every request, and a caller handing in a list would turn each probe
+    # into a linear scan.
+    skip_paths = frozenset(config.auth_skip_paths)
+    trusted_proxies = frozenset(config.trusted_proxies)
 
     async def auth_combined_app(scope: dict, receive: Any, send: Any) -> None:
         """Combined ASGI app with authentication for MCP endpoints."""
@@ -293,10 +354,8 @@ def create_auth_combined_app(
             await mcp_app(scope, receive, send)
             return
 
-        # Build headers dict from scope (HTTP only from here).
-        headers = {}
-        for key, value in scope.get("headers", []):
-            headers[key.decode("latin-1").lower()] = value.decode("latin-1")
+        # Headers from scope (HTTP only from here), decoded on lookup.
+        headers = _ScopeHeaders(scope.get("headers", []))
 
         # Get client IP.
         client = scope.get("client")
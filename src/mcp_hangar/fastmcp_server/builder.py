@@ -1,30 +1,34 @@
 """Builder for MCPServerFactory with fluent API.
 
 Provides a convenient way to construct an MCPServerFactory
-with optional components.
+with optional components. `MCPServerFactory.from_parts()` is the same
+construction in a single call; `build()` delegates to it.
 """
 
+from __future__ import annotations
+
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any
 
-from .config import HangarFunctions, ServerConfig
-from .protocols import (
-    HangarApproveFn,
-    HangarDetailsFn,
-    HangarDiscoveredFn,
-    HangarDiscoverFn,
-    HangarHealthFn,
-    HangarInvokeFn,
-    HangarListFn,
-    HangarMetricsFn,
-    HangarQuarantineFn,
-    HangarSourcesFn,
-    HangarStartFn,
-    HangarStopFn,
-    HangarToolsFn,
-)
+from .config import ServerConfig
 
 if TYPE_CHECKING:
     from .factory import MCPServerFactory
+    from .protocols import (
+        HangarApproveFn,
+        HangarDetailsFn,
+        HangarDiscoveredFn,
+        HangarDiscoverFn,
+        HangarHealthFn,
+        HangarInvokeFn,
+        HangarListFn,
+        HangarMetricsFn,
+        HangarQuarantineFn,
+        HangarSourcesFn,
+        HangarStartFn,
+        HangarStopFn,
+        HangarToolsFn,
+    )
 
 
 class MCPServerFactoryBuilder:
@@ -70,7 +74,7 @@ class MCPServerFactoryBuilder:
         tools_fn: HangarToolsFn,
         details_fn: HangarDetailsFn,
         health_fn: HangarHealthFn,
-    ) -> "MCPServerFactoryBuilder":
+    ) -> MCPServerFactoryBuilder:
         """Set core control plane functions.
 
         Args:
@@ -102,7 +106,7 @@ class MCPServerFactoryBuilder:
         approve_fn: HangarApproveFn | None = None,
         sources_fn: HangarSourcesFn | None = None,
         metrics_fn: HangarMetricsFn | None = None,
-    ) -> "MCPServerFactoryBuilder":
+    ) -> MCPServerFactoryBuilder:
         """Set discovery functions (all optional).
 
         Args:
@@ -132,10 +136,10 @@ class MCPServerFactoryBuilder:
         sse_path: str = "/sse",
         message_path: str = "/messages/",
         auth_enabled: bool = False,
-        auth_skip_paths: tuple[str, ...] = ("/health", "/ready", "/_ready", "/metrics"),
+        auth_skip_paths: Iterable[str] = frozenset(["/health", "/ready", "/_ready", "/metrics"]),
         trusted_proxies: frozenset[str] = frozenset(["127.0.0.1", "::1"]),
         relay_tasks_enabled: bool = True,
-    ) -> "MCPServerFactoryBuilder":
+    ) -> MCPServerFactoryBuilder:
         """Set server configuration.
 
         Args:
@@ -145,7 +149,8 @@ class MCPServerFactoryBuilder:
             sse_path: Path for SSE endpoint.
             message_path: Path for message endpoint.
             auth_enabled: Whether to enable authentication (default: False).
-            auth_skip_paths: Paths to skip authentication.
+            auth_skip_paths: Paths to skip authentication; any iterable,
+                stored as a frozenset.
             trusted_proxies: Trusted proxy IPs for X-Forwarded-For.
             relay_tasks_enabled: Kill-switch for the ADR-014 task-relay serving
                 surface (default: True; see ``ServerConfig``).
@@ -160,7 +165,7 @@ class MCPServerFactoryBuilder:
             sse_path=sse_path,
             message_path=message_path,
             auth_enabled=auth_enabled,
-            auth_skip_paths=auth_skip_paths,
+            auth_skip_paths=frozenset(auth_skip_paths),
             trusted_proxies=trusted_proxies,
             relay_tasks_enabled=relay_tasks_enabled,
         )
@@ -169,7 +174,7 @@ class MCPServerFactoryBuilder:
     def with_auth(
         self,
         auth_components: Any,
-    ) -> "MCPServerFactoryBuilder":
+    ) -> MCPServerFactoryBuilder:
         """Set authentication components.
 
         Args:
@@ -185,7 +190,7 @@ class MCPServerFactoryBuilder:
         self._auth_components = auth_components
         return self
 
-    def build(self) -> "MCPServerFactory":
+    def build(self) -> MCPServerFactory:
         """Build the factory.
 
         Returns:
@@ -217,24 +222,24 @@ class MCPServerFactoryBuilder:
         assert self._details_fn is not None
         assert self._health_fn is not None
 
-        hangar = HangarFunctions(
-            list=self._list_fn,
-            start=self._start_fn,
-            stop=self._stop_fn,
-            invoke=self._invoke_fn,
-            tools=self._tools_fn,
-            details=self._details_fn,
-            health=self._health_fn,
-            discover=self._discover_fn,
-            discovered=self._discovered_fn,
-            quarantine=self._quarantine_fn,
-            approve=self._approve_fn,
-            sources=self._sources_fn,
-            metrics=self._metrics_fn,
+        return MCPServerFactory.from_parts(
+            list_fn=self._list_fn,
+            start_fn=self._start_fn,
+            stop_fn=self._stop_fn,
+            invoke_fn=self._invoke_fn,
+            tools_fn=self._tools_fn,
+            details_fn=self._details_fn,
+            health_fn=self._health_fn,
+            discover_fn=self._discover_fn,
+            discovered_fn=self._discovered_fn,
+            quarantine_fn=self._quarantine_fn,
+            approve_fn=self._approve_fn,
+            sources_fn=self._sources_fn,
+            metrics_fn=self._metrics_fn,
+            config=self._config,
+            auth_components=self._auth_components,
         )
 
-        return MCPServerFactory(hangar, self._config, self._auth_components)
-
 
 __all__ = [
     "MCPServerFactoryBuilder",
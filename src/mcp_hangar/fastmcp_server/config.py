@@ -4,23 +4,29 @@ Contains HangarFunctions container for control plane dependencies
 and ServerConfig for HTTP server settings.
 """
 
-from dataclasses import dataclass
+from __future__ import annotations
 
-from .protocols import (
-    HangarApproveFn,
-    HangarDetailsFn,
-    HangarDiscoveredFn,
-    HangarDiscoverFn,
-    HangarHealthFn,
-    HangarInvokeFn,
-    HangarListFn,
-    HangarMetricsFn,
-    HangarQuarantineFn,
-    HangarSourcesFn,
-    HangarStartFn,
-    HangarStopFn,
-    HangarToolsFn,
-)
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Annotations only: the protocols are for type checkers, and keeping them
+    # out of the runtime imports keeps them off the startup path.
+    from .protocols import (
+        HangarApproveFn,
+        HangarDetailsFn,
+        HangarDiscoveredFn,
+        HangarDiscoverFn,
+        HangarHealthFn,
+        HangarInvokeFn,
+        HangarListFn,
+        HangarMetricsFn,
+        HangarQuarantineFn,
+        HangarSourcesFn,
+        HangarStartFn,
+        HangarStopFn,
+        HangarToolsFn,
+    )
 
 # INBOUND server identity: the ``serverInfo.name`` Hangar reports to its own
 # clients, on every surface that carries one (``initialize`` and the SEP-2575
@@ -32,13 +38,16 @@ from .protocols import (
 HANGAR_SERVER_NAME = "mcp-hangar"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HangarFunctions:
     """Container for all control plane function dependencies.
 
     Core functions are required. Discovery functions are optional
     and will return appropriate errors if not provided.
 
+    Slotted: every tool call reads one of these attributes, and a slot read
+    skips the per-instance `__dict__`.
+
     Attributes:
         list: Function to list all managed mcp_servers.
         start: Function to start a mcp_server.
@@ -85,6 +94,8 @@ class ServerConfig:
         message_path: Path for message endpoint.
         auth_enabled: Whether authentication is enabled (opt-in, default False).
         auth_skip_paths: Paths to skip authentication (health, metrics, etc.).
+            A frozenset, like ``trusted_proxies``: the auth middleware tests
+            every request path against it.
         trusted_proxies: Set of trusted proxy IPs for X-Forwarded-For.
         relay_tasks_enabled: Kill-switch for the ADR-014 task-relay serving
             surface (**default True — reactivated 2026-07-28**). When True (the
@@ -115,7 +126,7 @@ class ServerConfig:
     message_path: str = "/messages/"
     # Auth configuration (opt-in)
     auth_enabled: bool = False
-    auth_skip_paths: tuple[str, ...] = ("/health", "/ready", "/_ready", "/metrics")
+    auth_skip_paths: frozenset[str] = frozenset(["/health", "/ready", "/_ready", "/metrics"])
     trusted_proxies: frozenset[str] = frozenset(["127.0.0.1", "::1"])
     # ADR-014 task-relay serving surface kill-switch. Reactivated 2026-07-28
     # once the SEP-2663 wire was actually served -- the condition ADR-015
@@ -13,11 +13,27 @@ from mcp_hangar._sdk_compat import FastMCP, new_mcp_server
 from starlette.applications import Starlette
 
 from ..logging_config import get_logger
+from ..metrics import update_mcp_server_state
 from .asgi import create_auth_combined_app, create_combined_asgi_app, create_health_routes
 from .config import HANGAR_SERVER_NAME, HangarFunctions, ServerConfig
 from .modern_surface import register_modern_surface, wrap_front_door_routing
 
 if TYPE_CHECKING:
+    from .protocols import (
+        HangarApproveFn,
+        HangarDetailsFn,
+        HangarDiscoveredFn,
+        HangarDiscoverFn,
+        HangarHealthFn,
+        HangarInvokeFn,
+        HangarListFn,
+        HangarMetricsFn,
+        HangarQuarantineFn,
+        HangarSourcesFn,
+        HangarStartFn,
+        HangarStopFn,
+        HangarToolsFn,
+    )
     from ..domain.services.task_digest_guard import TaskDigestGuard
     from ..domain.services.task_ownership import TaskOwnershipRegistry
     from .builder import MCPServerFactoryBuilder
@@ -25,6 +41,22 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+# Stand-ins registered for discovery and metrics tools whose function was not
+# provided, so the tools themselves never check for None. They accept whatever
+# arguments the real function would take, and build a fresh dict per call so
+# no caller can alter what the next one gets.
+def _discovery_not_configured(*_args: Any, **_kwargs: Any) -> dict[str, Any]:
+    return {"error": "Discovery not configured"}
+
+
+async def _discovery_not_configured_async(*_args: Any, **_kwargs: Any) -> dict[str, Any]:
+    return {"error": "Discovery not configured"}
+
+
+def _metrics_not_available(*_args: Any, **_kwargs: Any) -> dict[str, Any]:
+    return {"error": "Metrics not available"}
+
+
 class MCPServerFactory:
     """Factory for creating configured FastMCP servers.
 
@@ -45,6 +77,13 @@ class MCPServerFactory:
         )
         app = factory.create_asgi_app()
 
+        # From the individual functions, in one call (preferred)
+        factory = MCPServerFactory.from_parts(
+            list_fn=list_fn, start_fn=start_fn, ..., health_fn=health_fn,
+            discover_fn=discover_fn,
+            config=ServerConfig(port=9000),
+        )
+
         # Or use the builder pattern
         factory = (MCPServerFactory.builder()
             .with_hangar(list_fn, start_fn, ...)
@@ -70,7 +109,12 @@ class MCPServerFactory:
         self._hangar = hangar
         self._config = config or ServerConfig()
         self._auth_components = auth_components
+        # Settled once: hangar and config are frozen, and auth_components is
+        # never reassigned.
+        self._discovery_enabled = hangar.discover is not None
+        self._auth_active = bool(self._config.auth_enabled and auth_components)
         self._mcp: FastMCP | None = None
+        self._asgi_app: Any | None = None
         # Shared registry binding MCP task handles to their owning
         # tenant/principal; populated when governed tasks are enabled.
         self._task_ownership_registry: TaskOwnershipRegistry | None = None
@@ -78,6 +122,69 @@ class MCPServerFactory:
         # invoke path; re-verified fail-closed on result retrieval (#320).
         self._task_digest_guard: TaskDigestGuard | None = None
 
+    @classmethod
+    def from_parts(
+        cls,
+        *,
+        list_fn: HangarListFn,
+        start_fn: HangarStartFn,
+        stop_fn: HangarStopFn,
+        invoke_fn: HangarInvokeFn,
+        tools_fn: HangarToolsFn,
+        details_fn: HangarDetailsFn,
+        health_fn: HangarHealthFn,
+        discover_fn: HangarDiscoverFn | None = None,
+        discovered_fn: HangarDiscoveredFn | None = None,
+        quarantine_fn: HangarQuarantineFn | None = None,
+        approve_fn: HangarApproveFn | None = None,
+        sources_fn: HangarSourcesFn | None = None,
+        metrics_fn: HangarMetricsFn | None = None,
+        config: ServerConfig | None = None,
+        auth_components: Any = None,
+    ) -> MCPServerFactory:
+        """Create a factory from the individual control plane functions.
+
+        The direct form of what the builder assembles step by step, and the
+        one place both construct `HangarFunctions`. Keyword-only, so the seven
+        same-shaped core callables cannot be passed in the wrong order.
+
+        Args:
+            list_fn: Function to list mcp_servers.
+            start_fn: Function to start a mcp_server.
+            stop_fn: Function to stop a mcp_server.
+            invoke_fn: Function to invoke a tool.
+            tools_fn: Function to get tool schemas.
+            details_fn: Function to get mcp_server details.
+            health_fn: Function to get control plane health.
+            discover_fn: Optional async function to trigger discovery.
+            discovered_fn: Optional function to list discovered mcp_servers.
+            quarantine_fn: Optional function to list quarantined mcp_servers.
+            approve_fn: Optional async function to approve a mcp_server.
+            sources_fn: Optional function to list discovery sources.
+            metrics_fn: Optional function to get metrics.
+            config: Server configuration (uses defaults if None).
+            auth_components: Optional auth components from bootstrap_auth().
+
+        Returns:
+            Configured MCPServerFactory instance.
+        """
+        hangar = HangarFunctions(
+            list=list_fn,
+            start=start_fn,
+            stop=stop_fn,
+            invoke=invoke_fn,
+            tools=tools_fn,
+            details=details_fn,
+            health=health_fn,
+            discover=discover_fn,
+            discovered=discovered_fn,
+            quarantine=quarantine_fn,
+            approve=approve_fn,
+            sources=sources_fn,
+            metrics=metrics_fn,
+        )
+        return cls(hangar, config, auth_components)
+
     @classmethod
     def builder(cls) -> MCPServerFactoryBuilder:
         """Create a builder for fluent configuration.
@@ -136,7 +243,7 @@ class MCPServerFactory:
             "fastmcp_server_created",
             host=self._config.host,
             port=self._config.port,
-            discovery_enabled=self._hangar.discover is not None,
+            discovery_enabled=self._discovery_enabled,
         )
 
         return mcp
@@ -154,9 +261,16 @@ class MCPServerFactory:
         If auth is enabled (config.auth_enabled=True and auth_components provided),
         the auth middleware will be applied to protect MCP endpoints.
 
+        The app is cached - repeated calls return the same instance. Everything
+        it is built from is fixed for the life of the factory, and the MCP
+        server it wraps is the cached one from `create_server()`.
+
         Returns:
             Combined ASGI app callable.
         """
+        if self._asgi_app is not None:
+            return self._asgi_app
+
         from ..server.api import create_api_router
 
         mcp = self.create_server()
@@ -171,10 +285,10 @@ class MCPServerFactory:
         mcp_app = wrap_front_door_routing(mcp_app, mcp_path=self._config.streamable_http_path)
 
         # Log if auth is configured
-        if self._config.auth_enabled and self._auth_components:
+        if self._auth_active:
             logger.info(
                 "auth_middleware_enabled",
-                skip_paths=self._config.auth_skip_paths,
+                skip_paths=sorted(self._config.auth_skip_paths),
                 trusted_proxies=list(self._config.trusted_proxies),
             )
 
@@ -189,10 +303,13 @@ class MCPServerFactory:
         api_app = create_api_router(auth_components=self._auth_components)
 
         # Create auth-aware combined app
-        if self._config.auth_enabled and self._auth_components:
-            return create_auth_combined_app(aux_app, mcp_app, self._auth_components, self._config, api_app)
+        if self._auth_active:
+            app = create_auth_combined_app(aux_app, mcp_app, self._auth_components, self._config, api_app)
         else:
-            return create_combined_asgi_app(aux_app, mcp_app, api_app)
+            app = create_combined_asgi_app(aux_app, mcp_app, api_app)
+
+        self._asgi_app = app
+        return app
 
     def _register_core_tools(self, mcp: FastMCP) -> None:
         """Register core control plane tools.
@@ -200,7 +317,16 @@ class MCPServerFactory:
         Args:
             mcp: FastMCP server instance.
         """
+        # Bound once here rather than read off `self._hangar` on every call:
+        # HangarFunctions is frozen, so the tools can close over the callables.
         hgr = self._hangar
+        list_fn = hgr.list
+        start_fn = hgr.start
+        stop_fn = hgr.stop
+        invoke_fn = hgr.invoke
+        tools_fn = hgr.tools
+        details_fn = hgr.details
+        health_fn = hgr.health
 
         @mcp.tool()
         def hangar_list(state_filter: str | None = None) -> dict:
@@ -209,7 +335,7 @@ class MCPServerFactory:
             Args:
                 state_filter: Optional filter by state (cold, ready, degraded, dead)
             """
-            return hgr.list(state_filter=state_filter)
+            return list_fn(state_filter=state_filter)
 
         @mcp.tool()
         def hangar_start(mcp_server: str) -> dict:
@@ -218,7 +344,7 @@ class MCPServerFactory:
             Args:
                 mcp_server: McpServer ID to start
             """
-            return hgr.start(mcp_server=mcp_server)
+            return start_fn(mcp_server=mcp_server)
 
         @mcp.tool()
         def hangar_stop(mcp_server: str) -> dict:
@@ -227,7 +353,7 @@ class MCPServerFactory:
             Args:
                 mcp_server: McpServer ID to stop
             """
-            return hgr.stop(mcp_server=mcp_server)
+            return stop_fn(mcp_server=mcp_server)
 
         @mcp.tool()
         def hangar_invoke(
@@ -244,7 +370,7 @@ class MCPServerFactory:
                 arguments: Tool arguments as dictionary (default: empty)
                 timeout: Timeout in seconds (default 30)
             """
-            return hgr.invoke(
+            return invoke_fn(
                 mcp_server=mcp_server,
                 tool=tool,
                 arguments=arguments or {},
@@ -258,7 +384,7 @@ class MCPServerFactory:
             Args:
                 mcp_server: McpServer ID
             """
-            return hgr.tools(mcp_server=mcp_server)
+            return tools_fn(mcp_server=mcp_server)
 
         @mcp.tool()
         def hangar_details(mcp_server: str) -> dict:
@@ -267,20 +393,31 @@ class MCPServerFactory:
             Args:
                 mcp_server: McpServer ID
             """
-            return hgr.details(mcp_server=mcp_server)
+            return details_fn(mcp_server=mcp_server)
 
         @mcp.tool()
         def hangar_health() -> dict:
             """Get control plane health status including mcp_server counts and metrics."""
-            return hgr.health()
+            return health_fn()
 
     def _register_discovery_tools(self, mcp: FastMCP) -> None:
         """Register discovery tools (if enabled).
 
+        The tools are registered either way, with the same signatures, so the
+        tool list does not depend on configuration. Which function each one
+        calls is settled here: the configured one, or a stand-in returning an
+        error result.
+
         Args:
             mcp: FastMCP server instance.
         """
         hgr = self._hangar
+        discover_fn: HangarDiscoverFn = hgr.discover if hgr.discover is not None else _discovery_not_configured_async
+        discovered_fn: HangarDiscoveredFn = hgr.discovered if hgr.discovered is not None else _discovery_not_configured
+        quarantine_fn: HangarQuarantineFn = hgr.quarantine if hgr.quarantine is not None else _discovery_not_configured
+        approve_fn: HangarApproveFn = hgr.approve if hgr.approve is not None else _discovery_not_configured_async
+        sources_fn: HangarSourcesFn = hgr.sources if hgr.sources is not None else _discovery_not_configured
+        metrics_fn: HangarMetricsFn = hgr.metrics if hgr.metrics is not None else _metrics_not_available
 
         @mcp.tool()
         async def hangar_discover() -> dict:
@@ -289,9 +426,7 @@ class MCPServerFactory:
             Runs discovery across all configured sources and returns
             statistics about discovered, added, and quarantined mcp_servers.
             """
-            if hgr.discover is None:
-                return {"error": "Discovery not configured"}
-            return await hgr.discover()
+            return await discover_fn()
 
         @mcp.tool()
         def hangar_discovered() -> dict:
@@ -300,9 +435,7 @@ class MCPServerFactory:
             Shows mcp_servers found by discovery but not yet added,
             typically due to auto_register=false or pending approval.
             """
-            if hgr.discovered is None:
-                return {"error": "Discovery not configured"}
-            return hgr.discovered()
+            return discovered_fn()
 
         @mcp.tool()
         def hangar_quarantine() -> dict:
@@ -311,9 +444,7 @@ class MCPServerFactory:
             Shows mcp_servers that failed validation and are waiting
             for manual approval or rejection.
             """
-            if hgr.quarantine is None:
-                return {"error": "Discovery not configured"}
-            return hgr.quarantine()
+            return quarantine_fn()
 
         @mcp.tool()
         async def hangar_approve(mcp_server: str) -> dict:
@@ -322,9 +453,7 @@ class MCPServerFactory:
             Args:
                 mcp_server: Name of the quarantined mcp_server to approve
             """
-            if hgr.approve is None:
-                return {"error": "Discovery not configured"}
-            return await hgr.approve(mcp_server=mcp_server)
+            return await approve_fn(mcp_server=mcp_server)
 
         @mcp.tool()
         def hangar_sources() -> dict:
@@ -333,9 +462,7 @@ class MCPServerFactory:
             Shows all discovery sources (kubernetes, docker, filesystem, entrypoint)
             with their current health and last discovery timestamp.
             """
-            if hgr.sources is None:
-                return {"error": "Discovery not configured"}
-            return hgr.sources()
+            return sources_fn()
 
         @mcp.tool()
         def hangar_metrics(format: str = "summary") -> dict:
@@ -347,9 +474,7 @@ class MCPServerFactory:
             Returns metrics including mcp_server states, tool call counts, errors,
             discovery statistics, and performance data.
             """
-            if hgr.metrics is None:
-                return {"error": "Metrics not available"}
-            return hgr.metrics(format=format)
+            return metrics_fn(format=format)
 
     def _enable_governed_tasks(self, mcp: FastMCP) -> None:
         """Wire the ADR-014 governed task-relay serving surface (Phase 2); dark by default.
@@ -425,7 +550,9 @@ class MCPServerFactory:
         # Check hangar wiring
         checks["hangar_wired"] = True
 
-        # Check hangar list
+        # Check hangar list. The isinstance() is the probe, not overhead: it is
+        # a C-level type check for a real dict, and without it a malformed
+        # string reply that merely contains "mcp_servers" would pass `in`.
         try:
             data = self._hangar.list()
             checks["hangar_list_ok"] = isinstance(data, dict) and "mcp_servers" in data
@@ -445,19 +572,19 @@ class MCPServerFactory:
 
     def _update_metrics(self) -> None:
         """Update mcp_server state metrics."""
-        from ..metrics import update_mcp_server_state
-
         try:
             data = self._hangar.list()
-            if isinstance(data, dict) and "mcp_servers" in data:
-                for p in data.get("mcp_servers", []):
-                    pid = p.get("mcp_server_id") or p.get("name") or p.get("id")
-                    if pid:
-                        update_mcp_server_state(
-                            pid,
-                            p.get("state", "cold"),
-                            p.get("mode", "subprocess"),
-                        )
+            entries = data.get("mcp_servers") if isinstance(data, dict) else None
+            for p in entries or ():
+                # The shipped list always sets mcp_server_id, so this stops at
+                # the first lookup; the fallbacks are for other list payloads.
+                pid = p.get("mcp_server_id") or p.get("name") or p.get("id")
+                if pid:
+                    update_mcp_server_state(
+                        pid,
+                        p.get("state", "cold"),
+                        p.get("mode", "subprocess"),
+                    )
         except Exception as e:  # noqa: BLE001 -- fault-barrier: metrics update must not crash server
             logger.debug("metrics_update_failed", error=str(e))
 
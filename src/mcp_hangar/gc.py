@@ -1,5 +1,6 @@
 """Background workers for garbage collection and health checks."""
 
+import os
 from pathlib import Path
 import threading
 import time
@@ -22,7 +23,103 @@ try:
     WATCHDOG_AVAILABLE = True
 except ImportError:
     WATCHDOG_AVAILABLE = False
-    logger.debug("watchdog package not installed, config file watching will use polling")
+    logger.debug("watchdog package not installed, config file watching will use polling; install mcp-hangar[watch]")
+
+
+# One watchdog Observer, so one inotify instance and one emitter thread per
+# directory, for every ConfigReloadWorker in the process. Started with the
+# first watch and stopped with the last. Watches are counted because
+# scheduling an already-watched directory returns the same watch, and
+# unscheduling it would drop every handler on it.
+_observer: Any | None = None
+_observer_watches: dict[Any, int] = {}
+_observer_lock = threading.Lock()
+
+
+def _watch_directory(handler: Any, directory: str) -> Any:
+    """Route events in `directory` to `handler` through the shared Observer."""
+    global _observer
+    with _observer_lock:
+        observer = _observer or Observer()
+        watch = observer.schedule(handler, directory, recursive=False)
+        if _observer is None:
+            observer.start()
+            _observer = observer
+        _observer_watches[watch] = _observer_watches.get(watch, 0) + 1
+        return watch
+
+
+def _unwatch_directory(handler: Any, watch: Any) -> None:
+    """Undo `_watch_directory`, stopping the shared Observer after its last watch."""
+    global _observer
+    with _observer_lock:
+        observer = _observer
+        if observer is None or watch not in _observer_watches:
+            return
+        remaining = _observer_watches.pop(watch) - 1
+        if remaining:
+            _observer_watches[watch] = remaining
+            observer.remove_handler_for_watch(handler, watch)
+            return
+        observer.unschedule(watch)
+        if _observer_watches:
+            return
+        _observer = None
+    observer.stop()
+    observer.join(timeout=5)
+
+
+class _Debouncer:
+    """Call `callback` once `delay` seconds after the latest `touch()`.
+
+    One thread, started by the first touch, sleeps until a monotonic
+    deadline that each touch pushes back. An editor that fires ten events
+    per save moves the deadline ten times instead of starting and
+    cancelling ten Timer threads.
+    """
+
+    def __init__(self, delay: float, callback: Callable[[], Any]):
+        self._delay = delay
+        self._callback = callback
+        self._cv = threading.Condition()
+        self._deadline: float | None = None
+        self._closed = False
+        self._thread: threading.Thread | None = None
+
+    def touch(self) -> None:
+        """(Re)arm the deadline `delay` seconds from now."""
+        with self._cv:
+            if self._closed:
+                return
+            self._deadline = time.monotonic() + self._delay
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True, name="config-reload-debounce")
+                self._thread.start()
+            self._cv.notify()
+
+    def close(self) -> None:
+        """Drop any pending call and let the thread exit."""
+        with self._cv:
+            self._closed = True
+            self._cv.notify()
+
+    def _run(self) -> None:
+        while self._wait_for_deadline():
+            self._callback()
+
+    def _wait_for_deadline(self) -> bool:
+        """Block until the deadline passes (True) or the debouncer closes (False)."""
+        with self._cv:
+            while not self._closed:
+                if self._deadline is None:
+                    self._cv.wait()
+                    continue
+                remaining = self._deadline - time.monotonic()
+                if remaining <= 0:
+                    self._deadline = None
+                    return True
+                self._cv.wait(remaining)
+            return False
 
 
 class BackgroundWorker:
@@ -59,7 +156,16 @@ class BackgroundWorker:
         self._event_bus = event_bus or get_event_bus()
         self.thread = threading.Thread(target=self._loop, daemon=True, name=f"worker-{task}")
         self.running = False
+        # Set by stop() to cut the wait between runs short.
+        self._stop_event = threading.Event()
         self._next_check_at: dict[str, float] = {}
+        # Shutdowns by reason in the current gc cycle.
+        self._gc_collected = {"idle": 0, "dead": 0}
+        # The task is fixed for the worker's life; pick its per-mcp_server
+        # step once instead of comparing strings for every mcp_server.
+        self._run_one: Callable[[str, McpServerRuntime], bool] = (
+            self._shutdown_if_idle if task == "gc" else self._check_health
+        )
 
     def start(self):
         """Start the background worker thread."""
@@ -73,6 +179,7 @@ class BackgroundWorker:
 
     def stop(self):
         """Stop the background worker thread."""
+        self._stop_event.set()
         self.running = False
         logger.info("background_worker_stopped", task=self.task)
 
@@ -90,74 +197,90 @@ class BackgroundWorker:
         except Exception:  # noqa: BLE001 -- fault-barrier: event publishing must not crash background worker
             logger.exception("event_publish_failed")
 
+    def _shutdown_if_idle(self, mcp_server_id: str, mcp_server: McpServerRuntime) -> bool:
+        """Garbage-collect one mcp_server: shut it down if it has been idle too long.
+
+        Always returns True; its events are published either way.
+        """
+        if mcp_server.maybe_shutdown_idle():
+            logger.info("gc_shutdown", mcp_server_id=mcp_server_id)
+            self._gc_collected["idle"] += 1
+            record_mcp_server_stop(mcp_server_id, "idle")
+        return True
+
+    def _check_health(self, mcp_server_id: str, mcp_server: McpServerRuntime) -> bool:
+        """Health-check one mcp_server if it is started and due.
+
+        Returns False when the check was skipped, so the caller leaves its
+        events for the next run.
+        """
+        # State-aware health check scheduling
+        state_str = normalize_state_to_str(mcp_server.state)
+
+        # Skip mcp_servers that are not started or starting up
+        if state_str in ("cold", "initializing"):
+            return False
+
+        # Check per-mcp_server timing -- skip if not due yet
+        now = time.time()
+        next_check = self._next_check_at.get(mcp_server_id, 0.0)
+        if now < next_check:
+            return False
+
+        # Perform health check
+        hc_start = time.perf_counter()
+        is_healthy = mcp_server.health_check()
+        hc_duration = time.perf_counter() - hc_start
+
+        consecutive = int(getattr(mcp_server.health, "consecutive_failures", 0))
+
+        observe_health_check(
+            mcp_server=mcp_server_id,
+            duration=hc_duration,
+            healthy=is_healthy,
+            is_cold=False,
+            consecutive_failures=consecutive,
+        )
+
+        if not is_healthy:
+            logger.warning("health_check_unhealthy", mcp_server_id=mcp_server_id)
+
+        # Calculate next check interval based on current state
+        # Re-read state after health check (it may have changed)
+        current_state = normalize_state_to_str(mcp_server.state)
+        health_tracker = getattr(mcp_server, "health", None)
+        if health_tracker and hasattr(health_tracker, "get_health_check_interval"):
+            interval = health_tracker.get_health_check_interval(current_state, normal_interval=float(self.interval_s))
+        else:
+            interval = float(self.interval_s)
+
+        if interval > 0:
+            self._next_check_at[mcp_server_id] = now + interval
+
+        return True
+
     def _loop(self):
         """Main worker loop."""
         while self.running:
-            time.sleep(self.interval_s)
+            if self._stop_event.wait(self.interval_s):
+                break
 
             start_time = time.perf_counter()
-            gc_collected = {"idle": 0, "dead": 0}
+            self._gc_collected = {"idle": 0, "dead": 0}
 
-            # Get snapshot of mcp_servers to avoid holding mapping lock (if any)
-            mcp_servers_snapshot = list(self.mcp_servers.items())
+            # Snapshot mcp_servers so the loop holds no mapping lock and sees
+            # no mutation. The repository's items() already returns a list
+            # copied under its lock; only a live view (a plain dict) needs one.
+            mcp_servers_snapshot = self.mcp_servers.items()
+            if not isinstance(mcp_servers_snapshot, list):
+                mcp_servers_snapshot = list(mcp_servers_snapshot)
 
+            run_one = self._run_one
+            publish_events = self._publish_events
             for mcp_server_id, mcp_server in mcp_servers_snapshot:
                 try:
-                    if self.task == "gc":
-                        # Garbage collection - shutdown idle mcp_servers
-                        if mcp_server.maybe_shutdown_idle():
-                            logger.info("gc_shutdown", mcp_server_id=mcp_server_id)
-                            gc_collected["idle"] += 1
-                            record_mcp_server_stop(mcp_server_id, "idle")
-
-                    elif self.task == "health_check":
-                        # State-aware health check scheduling
-                        state_str = normalize_state_to_str(mcp_server.state)
-
-                        # Skip mcp_servers that are not started or starting up
-                        if state_str in ("cold", "initializing"):
-                            continue
-
-                        # Check per-mcp_server timing -- skip if not due yet
-                        now = time.time()
-                        next_check = self._next_check_at.get(mcp_server_id, 0.0)
-                        if now < next_check:
-                            continue
-
-                        # Perform health check
-                        hc_start = time.perf_counter()
-                        is_healthy = mcp_server.health_check()
-                        hc_duration = time.perf_counter() - hc_start
-
-                        consecutive = int(getattr(mcp_server.health, "consecutive_failures", 0))
-
-                        observe_health_check(
-                            mcp_server=mcp_server_id,
-                            duration=hc_duration,
-                            healthy=is_healthy,
-                            is_cold=False,
-                            consecutive_failures=consecutive,
-                        )
-
-                        if not is_healthy:
-                            logger.warning("health_check_unhealthy", mcp_server_id=mcp_server_id)
-
-                        # Calculate next check interval based on current state
-                        # Re-read state after health check (it may have changed)
-                        current_state = normalize_state_to_str(mcp_server.state)
-                        health_tracker = getattr(mcp_server, "health", None)
-                        if health_tracker and hasattr(health_tracker, "get_health_check_interval"):
-                            interval = health_tracker.get_health_check_interval(
-                                current_state, normal_interval=float(self.interval_s)
-                            )
-                        else:
-                            interval = float(self.interval_s)
-
-                        if interval > 0:
-                            self._next_check_at[mcp_server_id] = now + interval
-
-                    # Publish any collected events
-                    self._publish_events(mcp_server)
+                    if run_one(mcp_server_id, mcp_server):
+                        publish_events(mcp_server)
 
                 except Exception as e:  # noqa: BLE001 -- fault-barrier: single mcp_server failure must not crash background worker loop
                     record_error("gc", type(e).__name__)
@@ -171,7 +294,7 @@ class BackgroundWorker:
             # Record GC cycle metrics
             if self.task == "gc":
                 duration = time.perf_counter() - start_time
-                record_gc_cycle(duration, gc_collected)
+                record_gc_cycle(duration, self._gc_collected)
 
             # Clean up stale entries from _next_check_at for removed mcp_servers
             if self.task == "health_check":
@@ -208,14 +331,37 @@ class ConfigReloadWorker:
             use_watchdog: Use watchdog if available, otherwise fall back to polling.
         """
         self.config_path = Path(config_path) if config_path else None
+        # Logged on every poll and reload; convert once.
+        self._config_path_str = str(self.config_path)
+        # Polled every interval_s for the life of the process. A bytes path
+        # goes to os.stat as-is, skipping pathlib and the filesystem encoding
+        # of a str path on every tick.
+        self._stat_path = os.fsencode(self.config_path) if self.config_path else None
+        # Resolved once rather than per watchdog event. Only a file named like
+        # the config or its symlink target can be it, so other files in the
+        # watched directory are ruled out without touching the filesystem.
+        # A symlinked config is re-resolved per event instead: the link can
+        # be retargeted (a Kubernetes ConfigMap swap does exactly that), and
+        # the new target may not even share the old one's name.
+        self._resolved_config_path: Path | None = None
+        self._config_names: frozenset[str] = frozenset()
+        self._config_is_symlink = False
+        if self.config_path:
+            self._config_is_symlink = self.config_path.is_symlink()
+            self._resolve_config_path()
         self.command_bus = command_bus
         self.interval_s = interval_s
         self.use_watchdog = use_watchdog and WATCHDOG_AVAILABLE
 
         self.thread: threading.Thread | None = None
         self.running = False
-        self._observer: Any | None = None
-        self._last_mtime: float | None = None
+        # Set by stop() to cut the polling wait short.
+        self._stop_event = threading.Event()
+        # The handler and its watch on the shared Observer, in watchdog mode.
+        self._watch: tuple[Any, Any] | None = None
+        # Integer nanoseconds: exact, where a float of seconds since the epoch
+        # keeps only about a quarter of a microsecond.
+        self._last_mtime_ns: int | None = None
 
         if not self.config_path or not self.config_path.exists():
             logger.warning(
@@ -226,7 +372,7 @@ class ConfigReloadWorker:
             self._enabled = False
         else:
             self._enabled = True
-            self._last_mtime = self.config_path.stat().st_mtime
+            self._last_mtime_ns = self.config_path.stat().st_mtime_ns
 
     def start(self):
         """Start the config reload worker."""
@@ -257,12 +403,14 @@ class ConfigReloadWorker:
         if not self.running:
             return
 
+        self._stop_event.set()
         self.running = False
 
-        if self._observer:
-            self._observer.stop()
-            self._observer.join(timeout=5)
-            self._observer = None
+        if self._watch:
+            handler, watch = self._watch
+            _unwatch_directory(handler, watch)
+            handler.debouncer.close()
+            self._watch = None
 
         logger.info("config_reload_worker_stopped")
 
@@ -279,37 +427,23 @@ class ConfigReloadWorker:
 
             def __init__(self, worker: "ConfigReloadWorker"):
                 self.worker = worker
-                self._debounce_timer: threading.Timer | None = None
-                self._debounce_delay = 1.0  # Wait 1s for multiple rapid changes
+                # Wait 1s for multiple rapid changes
+                self.debouncer = _Debouncer(1.0, worker._trigger_reload)
 
             def on_modified(self, event):
                 if event.is_directory:
                     return
 
-                # Check if this is our config file
                 src_path = str(event.src_path)  # Normalize bytes|str to str
-                if (
-                    self.worker.config_path is not None
-                    and Path(src_path).resolve() == self.worker.config_path.resolve()
-                ):
-                    self._debounced_reload()
-
-            def _debounced_reload(self):
-                """Debounce multiple rapid changes (editors often save multiple times)."""
-                if self._debounce_timer:
-                    self._debounce_timer.cancel()
-
-                self._debounce_timer = threading.Timer(self._debounce_delay, self.worker._trigger_reload)
-                self._debounce_timer.daemon = True
-                self._debounce_timer.start()
+                if self.worker._is_config_file(src_path):
+                    # Debounce multiple rapid changes (editors often save multiple times)
+                    self.debouncer.touch()
 
         try:
             handler = ConfigFileHandler(self)
-            self._observer = Observer()
             # Watch the directory containing the config file
             watch_dir = self.config_path.parent
-            self._observer.schedule(handler, str(watch_dir), recursive=False)
-            self._observer.start()
+            self._watch = (handler, _watch_directory(handler, str(watch_dir)))
             logger.info("config_file_watcher_started", watch_dir=str(watch_dir))
         except Exception as e:  # noqa: BLE001 -- fault-barrier: watchdog init failure must not crash config reload worker
             logger.error(
@@ -318,6 +452,20 @@ class ConfigReloadWorker:
             )
             self._start_polling()
 
+    def _resolve_config_path(self) -> None:
+        """Record where the config path points and the names it can go by."""
+        assert self.config_path is not None
+        self._resolved_config_path = self.config_path.resolve()
+        self._config_names = frozenset({self.config_path.name, self._resolved_config_path.name})
+
+    def _is_config_file(self, src_path: str) -> bool:
+        """Whether a watchdog event path refers to the watched config file."""
+        if self._config_is_symlink:
+            self._resolve_config_path()
+        if os.path.basename(src_path) not in self._config_names:
+            return False
+        return Path(src_path).resolve() == self._resolved_config_path
+
     def _start_polling(self):
         """Start polling-based file monitoring."""
         self.thread = threading.Thread(target=self._polling_loop, daemon=True, name="config-reload-poller")
@@ -326,25 +474,28 @@ class ConfigReloadWorker:
 
     def _polling_loop(self):
         """Polling loop that checks mtime periodically."""
-        assert self.config_path is not None
-        assert self._last_mtime is not None
+        assert self._stat_path is not None
+        assert self._last_mtime_ns is not None
         while self.running:
-            time.sleep(self.interval_s)
+            if self._stop_event.wait(self.interval_s):
+                break
 
             try:
-                if not self.config_path.exists():
-                    logger.warning("config_file_disappeared", config_path=str(self.config_path))
+                # One stat per tick; a missing file is the rare case.
+                try:
+                    current_mtime_ns = os.stat(self._stat_path).st_mtime_ns
+                except FileNotFoundError:
+                    logger.warning("config_file_disappeared", config_path=self._config_path_str)
                     continue
 
-                current_mtime = self.config_path.stat().st_mtime
-                if current_mtime > self._last_mtime:
+                if current_mtime_ns > self._last_mtime_ns:
                     logger.info(
                         "config_file_modified_detected",
-                        config_path=str(self.config_path),
-                        old_mtime=self._last_mtime,
-                        new_mtime=current_mtime,
+                        config_path=self._config_path_str,
+                        old_mtime=self._last_mtime_ns / 1e9,
+                        new_mtime=current_mtime_ns / 1e9,
                     )
-                    self._last_mtime = current_mtime
+                    self._last_mtime_ns = current_mtime_ns
                     self._trigger_reload()
 
             except Exception as e:  # noqa: BLE001 -- fault-barrier: polling error must not crash config reload worker
@@ -356,14 +507,14 @@ class ConfigReloadWorker:
             from .application.commands.commands import ReloadConfigurationCommand
 
             command = ReloadConfigurationCommand(
-                config_path=str(self.config_path),
+                config_path=self._config_path_str,
                 graceful=True,
                 requested_by="file_watcher",
             )
 
-            logger.info("triggering_config_reload", config_path=str(self.config_path))
+            logger.info("triggering_config_reload", config_path=self._config_path_str)
             result = self.command_bus.send(command)
-            logger.info("config_reload_triggered", result=result)
+            logger.info("config_reload_triggered", result=result.to_dict())
 
         except Exception as e:  # noqa: BLE001 -- fault-barrier: reload trigger failure must not crash worker
             logger.error(
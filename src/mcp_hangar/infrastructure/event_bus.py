@@ -5,7 +5,10 @@ Supports optional event persistence via IEventStore.
 """
 
 from collections.abc import Callable
+import contextvars
+import queue
 import threading
+import time
 from typing import Final
 
 from mcp_hangar.domain.contracts.dispatch_checkpoint import IDispatchCheckpoint
@@ -75,6 +78,10 @@ class EventBus(IEventBus):
         self._dispatch_checkpoint = dispatch_checkpoint
         self._hook_subscribers: list[IHookSubscriber] = []
         self._hook_sequence: int = 0
+        # `publish_nowait` outbox. The drain thread is started on first use, not
+        # here: constructing a bus must not start a background worker.
+        self._outbox: queue.Queue[tuple[contextvars.Context, DomainEvent]] = queue.Queue()
+        self._drain_thread: threading.Thread | None = None
 
     @property
     def event_store(self) -> IEventStore:
@@ -292,6 +299,75 @@ class EventBus(IEventBus):
         # event ever written about the same server.
         self.publish_to_stream(stream_id, [event], APPEND_AT_END)
 
+    def publish_nowait(self, event: DomainEvent) -> None:
+        """Queue an event for `publish` on the bus's drain thread and return.
+
+        Persistence and delivery are exactly what `publish` does; only the
+        thread they run on changes. One drain thread serves the whole outbox,
+        so events handed over here are published in the order they arrived.
+        Each event is published inside a copy of the caller's context, so trace
+        and identity context variables still reach the handlers.
+
+        Nothing read after this call may depend on a subscriber having run. A
+        caller that needs that uses `publish`, or `flush` first.
+
+        Args:
+            event: The domain event to publish.
+
+        Raises:
+            TypeError: If given something that is not a DomainEvent. Checked
+                here, on the caller's thread, rather than in the drain where
+                nobody would see it.
+        """
+        if not isinstance(event, DomainEvent):
+            raise TypeError(
+                f"publish_nowait() takes a single DomainEvent, got {type(event).__name__}. "
+                "To publish several, call publish_nowait() for each."
+            )
+        self._ensure_drain_thread()
+        self._outbox.put((contextvars.copy_context(), event))
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until every event handed to `publish_nowait` has been published.
+
+        Args:
+            timeout: Seconds to wait at most; None waits for as long as it takes.
+
+        Returns:
+            True if the outbox drained, False if the timeout ran out first.
+        """
+        outbox = self._outbox
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with outbox.all_tasks_done:
+            while outbox.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                outbox.all_tasks_done.wait(remaining)
+        return True
+
+    def _ensure_drain_thread(self) -> None:
+        if self._drain_thread is not None:
+            return
+        with self._lock:
+            if self._drain_thread is None:
+                self._drain_thread = threading.Thread(target=self._drain_outbox, name="event-bus-drain", daemon=True)
+                self._drain_thread.start()
+
+    def _drain_outbox(self) -> None:
+        while True:
+            context, event = self._outbox.get()
+            try:
+                context.run(self.publish, event)
+            except Exception as e:  # noqa: BLE001 -- fault-barrier: one failed publish must not stop the drain
+                # `publish` already isolates handler failures; what reaches here
+                # is the store raising (a ConcurrencyError, say). The caller is
+                # long gone, so the log and the error counter are all there is.
+                record_error("event_bus_drain", type(e).__name__)
+                logger.exception("event_publish_nowait_failed", event_type=type(event).__name__, error=str(e))
+            finally:
+                self._outbox.task_done()
+
     def deliver_tailed(self, event: DomainEvent) -> None:
         """Hand an event this instance did **not** produce to its projections.
 
@@ -4,7 +4,7 @@ Provides caching and truncation management for batch responses
 that exceed Claude's context limits.
 
 Components:
-- MemoryResponseCache: Thread-safe LRU cache with TTL
+- MemoryResponseCache: Thread-safe second-chance cache with TTL
 - RedisResponseCache: Redis-backed cache for distributed deployments
 - TruncationManager: Orchestrates truncation and caching
 """
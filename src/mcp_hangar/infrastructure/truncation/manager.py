@@ -6,6 +6,7 @@ with smart truncation that preserves JSON structure and line boundaries.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 import json
 from typing import Any, TYPE_CHECKING
 
@@ -19,6 +20,116 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Appended to a cut string. Its sizes are fixed, so they are computed once:
+# as a JSON string (quotes included) and as raw bytes.
+_TRUNCATION_MARKER = "... [truncated]"
+_TRUNCATION_MARKER_JSON_BYTES = len(json.dumps(_TRUNCATION_MARKER))
+_TRUNCATION_MARKER_BYTES = len(_TRUNCATION_MARKER.encode("utf-8"))
+
+
+def _json_size(data: Any) -> int:
+    """Size in bytes of `data` serialized as JSON.
+
+    `json.dumps` escapes every non-ASCII character by default, so its output
+    is pure ASCII and its length already is the UTF-8 byte count -- no need to
+    encode a second, same-sized copy just to measure it.
+
+    Stdlib `json` on purpose. orjson is faster, but it writes compact output
+    with raw UTF-8, and no option makes it match this format; with it as an
+    optional fast path, every size here -- the budgets, and the
+    `original_size_bytes` reported to callers -- would depend on whether it
+    happened to be installed. With default arguments `json.dumps` already
+    goes straight to the shared C encoder.
+
+    Raises:
+        TypeError, ValueError: If `data` is not JSON-serializable.
+    """
+    return len(json.dumps(data))
+
+
+def _serialize_result(data: Any) -> str:
+    """`json.dumps(data)`, or "" for a missing or unserializable result.
+
+    The length of the text is the result's `_json_size`, 0 for no result.
+    """
+    if data is None:
+        return ""
+    try:
+        return json.dumps(data)
+    except (TypeError, ValueError):
+        return ""
+
+
+def _json_str_len(text: str) -> int:
+    """`_json_size(text)` for a string, without the encoder for plain keys.
+
+    Printable ASCII with no quote or backslash is written as-is between two
+    quotes. Anything else may be escaped, so it is measured for real.
+    """
+    if text.isascii() and text.isprintable() and '"' not in text and "\\" not in text:
+        return len(text) + 2
+    return len(json.dumps(text))
+
+
+# Longest JSON a float serializes to, e.g. "-1.7976931348623157e+308".
+_FLOAT_JSON_MAX_BYTES = 24
+
+# Nodes `_fits_by_upper_bound` visits before giving up. Past this the walk,
+# in Python, stops being cheaper than letting the C encoder measure exactly.
+_UPPER_BOUND_NODE_LIMIT = 1000
+
+
+def _fits_by_upper_bound(values: Iterable[Any], limit: int) -> bool:
+    """Whether `values`, each passed to `json.dumps`, provably total <= `limit` bytes.
+
+    Adds up a worst case per node instead of encoding: six bytes per character
+    of an ASCII string (a control character becomes `\\u00XX`), twelve for any
+    other string (an astral character becomes a surrogate pair), the widest
+    rendering of each number, and every separator. The walk is far cheaper
+    than encoding for text-heavy results and stops as soon as the bound
+    passes `limit`.
+
+    False means "not proven", not "too large": it is also the answer for
+    types this walk does not model, non-string dict keys, and results larger
+    than `_UPPER_BOUND_NODE_LIMIT` nodes. The caller then measures exactly.
+    """
+    remaining = limit
+    stack = list(values)
+    nodes = 0
+    while stack:
+        nodes += 1
+        if nodes > _UPPER_BOUND_NODE_LIMIT:
+            return False
+        obj = stack.pop()
+        # Exact types: a subclass may serialize differently.
+        kind = type(obj)
+        if kind is str:
+            remaining -= (6 if obj.isascii() else 12) * len(obj) + 2
+        elif kind is dict:
+            # Braces, plus ", " and ": " per item.
+            remaining -= 2 + 4 * len(obj)
+            for key, value in obj.items():
+                if type(key) is not str:
+                    return False
+                stack.append(key)
+                stack.append(value)
+        elif kind is list or kind is tuple:
+            remaining -= 2 + 2 * len(obj)
+            stack.extend(obj)
+        elif obj is None or kind is bool:
+            remaining -= 5
+        elif kind is int:
+            # Decimal digits of an n-bit integer are at most n // 3 + 1; one
+            # more for the sign.
+            remaining -= obj.bit_length() // 3 + 2
+        elif kind is float:
+            remaining -= _FLOAT_JSON_MAX_BYTES
+        else:
+            return False
+        if remaining < 0:
+            return False
+    return True
+
 
 class TruncationManager:
     """Manages truncation of batch responses.
@@ -71,17 +182,23 @@ class TruncationManager:
         if not results:
             return results
 
-        # Calculate sizes for each result
-        sizes = []
-        for r in results:
-            if r.result is not None:
-                try:
-                    size = len(json.dumps(r.result).encode("utf-8"))
-                except (TypeError, ValueError):
-                    size = 0
-            else:
-                size = 0
-            sizes.append(size)
+        # Most batches are nowhere near the limit. When a cheap upper bound
+        # already proves that, skip serializing every result to measure it.
+        if _fits_by_upper_bound((r.result for r in results if r.result is not None), self._config.max_batch_size_bytes):
+            logger.debug(
+                "batch_no_truncation_needed",
+                batch_id=batch_id,
+                limit=self._config.max_batch_size_bytes,
+            )
+            return results
+
+        # Serialize each result once. The text is kept for `_truncate_result`,
+        # which caches it as is rather than serializing the result again.
+        # Sequential on purpose: the C encoder behind `json.dumps` holds the
+        # GIL for the whole call, so a thread pool would add dispatch cost
+        # without overlapping any of the encoding.
+        serialized = [_serialize_result(r.result) for r in results]
+        sizes = [len(text) for text in serialized]
 
         total_size = sum(sizes)
 
@@ -110,7 +227,7 @@ class TruncationManager:
         truncated_results = []
         for i, (result, budget) in enumerate(zip(results, budgets, strict=False)):
             if sizes[i] > budget:
-                truncated_result = self._truncate_result(result, budget, batch_id, i)
+                truncated_result = self._truncate_result(result, budget, batch_id, i, serialized[i])
                 truncated_results.append(truncated_result)
             else:
                 truncated_results.append(result)
@@ -140,17 +257,12 @@ class TruncationManager:
             # Reduce minimum to fit
             min_budget = max_budget // count
 
-        budgets = []
-        for size in sizes:
-            if total_size > 0:
-                # Proportional allocation
-                proportion = size / total_size
-                budget = int(max_budget * proportion)
-                # Ensure minimum
-                budget = max(budget, min_budget)
-            else:
-                budget = min_budget
-            budgets.append(budget)
+        # Proportional allocation with a guaranteed minimum. The zero-total
+        # check is made once, not per result.
+        if total_size > 0:
+            budgets = [max(int(max_budget * (size / total_size)), min_budget) for size in sizes]
+        else:
+            budgets = [min_budget] * count
 
         # Adjust if total budgets exceed max
         total_budgets = sum(budgets)
@@ -166,6 +278,7 @@ class TruncationManager:
         budget: int,
         batch_id: str,
         call_index: int,
+        serialized: str,
     ) -> CallResult:
         """Truncate a single result and cache the full response.
 
@@ -174,6 +287,8 @@ class TruncationManager:
             budget: Maximum bytes for the truncated result.
             batch_id: Batch identifier.
             call_index: Index of this call in the batch.
+            serialized: `result.result` as JSON, from `process_batch`; longer
+                than `budget` bytes.
 
         Returns:
             New CallResult with truncated content and continuation_id.
@@ -185,26 +300,20 @@ class TruncationManager:
             return result
 
         # Cache the full response
-        continuation_id = ContinuationId.generate(batch_id, call_index)
+        continuation_id = ContinuationId.generate(batch_id, call_index).value
         self._cache.store(
-            continuation_id.value,
+            continuation_id,
             result.result,
             self._config.cache_ttl_s,
+            serialized=serialized,
         )
 
-        # Calculate original size
-        try:
-            original_json = json.dumps(result.result)
-            original_size = len(original_json.encode("utf-8"))
-        except (TypeError, ValueError):
-            original_size = 0
-            original_json = ""
-
-        # Truncate the result
+        # Truncate the result. The ASCII text's length is its size in bytes.
+        original_size = len(serialized)
         if self._config.preserve_json_structure:
-            truncated_data = self._smart_truncate_json(result.result, budget)
+            truncated_data = self._smart_truncate_json(result.result, budget, size=original_size)
         else:
-            truncated_data = self._simple_truncate(original_json, budget)
+            truncated_data = self._simple_truncate(serialized, budget)
 
         # Record truncation metric
         BATCH_TRUNCATIONS_TOTAL.inc(reason="batch_budget")
@@ -215,7 +324,7 @@ class TruncationManager:
             call_index=call_index,
             original_size=original_size,
             budget=budget,
-            continuation_id=continuation_id.value,
+            continuation_id=continuation_id,
         )
 
         return CallResult(
@@ -230,10 +339,10 @@ class TruncationManager:
             truncated_reason="batch_budget_exceeded",
             original_size_bytes=original_size,
             retry_metadata=result.retry_metadata,
-            continuation_id=continuation_id.value,
+            continuation_id=continuation_id,
         )
 
-    def _smart_truncate_json(self, data: Any, max_bytes: int) -> Any:
+    def _smart_truncate_json(self, data: Any, max_bytes: int, *, size: int | None = None) -> Any:
         """Truncate data while preserving JSON structure.
 
         Handles different data types:
@@ -244,22 +353,25 @@ class TruncationManager:
         Args:
             data: The data to truncate.
             max_bytes: Maximum bytes for the result.
+            size: Serialized size of `data` in bytes, if the caller already
+                knows it; measured here otherwise.
 
         Returns:
             Truncated data that is valid JSON.
         """
         # First check if it fits
-        try:
-            serialized = json.dumps(data)
-            if len(serialized.encode("utf-8")) <= max_bytes:
-                return data
-        except (TypeError, ValueError):
-            return None
+        if size is None:
+            try:
+                size = _json_size(data)
+            except (TypeError, ValueError):
+                return None
+        if size <= max_bytes:
+            return data
 
         if isinstance(data, str):
             return self._truncate_string(data, max_bytes)
         elif isinstance(data, list):
-            return self._truncate_list(data, max_bytes)
+            return self._truncate_list(data, max_bytes, size=size)
         elif isinstance(data, dict):
             return self._truncate_dict(data, max_bytes)
         else:
@@ -277,23 +389,28 @@ class TruncationManager:
             Truncated string with truncation marker.
         """
         # Account for quotes and truncation marker in JSON
-        overhead = len(json.dumps("... [truncated]"))
-        available = max_bytes - overhead
+        available = max_bytes - _TRUNCATION_MARKER_JSON_BYTES
 
         if available <= 0:
             return "[truncated]"
 
-        # Encode to bytes for accurate truncation
-        text_bytes = text.encode("utf-8")
-
-        if len(text_bytes) <= available:
-            return text
-
-        # Truncate at byte boundary
-        truncated_bytes = text_bytes[:available]
-
-        # Decode back to string (may truncate partial characters)
-        truncated = truncated_bytes.decode("utf-8", errors="ignore")
+        if text.isascii():
+            # One byte per character: slice the str, no encoding at all.
+            if len(text) <= available:
+                return text
+            truncated = text[:available]
+        else:
+            # Every character is at least one byte, so the byte boundary lies
+            # within the first `available` characters. Encode only those, not
+            # the tail that is about to be dropped.
+            head = text[:available]
+            head_bytes = head.encode("utf-8")
+            if len(head) == len(text) and len(head_bytes) <= available:
+                return text
+
+            # Truncate at byte boundary, then decode back to string (may
+            # truncate partial characters)
+            truncated = head_bytes[:available].decode("utf-8", errors="ignore")
 
         # Optionally truncate at line boundary
         if self._config.truncate_on_line_boundary and "\n" in truncated:
@@ -301,31 +418,55 @@ class TruncationManager:
             if last_newline > len(truncated) // 2:  # Only if we keep > 50%
                 truncated = truncated[: last_newline + 1]
 
-        return truncated + "... [truncated]"
+        return truncated + _TRUNCATION_MARKER
 
-    def _truncate_list(self, items: list, max_bytes: int) -> list:
+    def _truncate_list(self, items: list, max_bytes: int, *, size: int | None = None) -> list:
         """Truncate a list by removing elements from the end.
 
+        Keeps the longest prefix that fits together with the truncation
+        marker, found by binary search: O(log N) serializations instead of
+        one per candidate length. The search is sound because the fit is
+        monotone in the prefix length -- one more element adds at least three
+        bytes (`, ` and the shortest JSON value), while the marker's count
+        loses at most one digit. An element that cannot be serialized fails
+        every prefix containing it, which keeps it monotone too.
+
         Args:
             items: The list to truncate.
             max_bytes: Maximum bytes for the result.
+            size: Serialized size of `items` in bytes, if the caller already
+                knows it; measured here otherwise.
 
         Returns:
             Truncated list with truncation marker as last element.
         """
-        # Try progressively smaller lists
-        for end_index in range(len(items), 0, -1):
-            truncated = items[:end_index]
-            if end_index < len(items):
-                truncated.append(f"[{len(items) - end_index} more items truncated]")
 
+        def fits(candidate: list) -> bool:
             try:
-                serialized = json.dumps(truncated)
-                if len(serialized.encode("utf-8")) <= max_bytes:
-                    return truncated
+                return _json_size(candidate) <= max_bytes
             except (TypeError, ValueError):
-                continue
+                return False
+
+        def with_marker(end_index: int) -> list:
+            return [*items[:end_index], f"[{len(items) - end_index} more items truncated]"]
+
+        # The whole list carries no marker, so it is not on the monotone
+        # scale the search relies on; try it on its own first.
+        if items and (size <= max_bytes if size is not None else fits(items)):
+            return items[:]
+
+        # Invariant: a prefix of `lo` items fits (lo == 0: none found yet);
+        # none longer than `hi` does.
+        lo, hi = 0, len(items) - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if fits(with_marker(mid)):
+                lo = mid
+            else:
+                hi = mid - 1
 
+        if lo:
+            return with_marker(lo)
         return ["[truncated]"]
 
     def _truncate_dict(self, data: dict, max_bytes: int) -> dict:
@@ -355,11 +496,14 @@ class TruncationManager:
         result = {}
         for key, value in data.items():
             # Account for key and colon/quotes
-            key_overhead = len(json.dumps(key)) + 1  # "key":
+            key_overhead = (_json_str_len(key) if isinstance(key, str) else len(json.dumps(key))) + 1  # "key":
             item_budget = budget_per_item - key_overhead
 
             if item_budget <= 0:
                 result[key] = "[truncated]"
+            elif _fits_by_upper_bound((value,), item_budget):
+                # Provably fits: keep it without serializing it to check.
+                result[key] = value
             else:
                 truncated_value = self._smart_truncate_json(value, item_budget)
                 result[key] = truncated_value
@@ -376,13 +520,16 @@ class TruncationManager:
         Returns:
             Truncated string (may not be valid JSON).
         """
-        marker = "... [truncated]"
-        available = max_bytes - len(marker.encode("utf-8"))
+        available = max_bytes - _TRUNCATION_MARKER_BYTES
 
         if available <= 0:
-            return marker
+            return _TRUNCATION_MARKER
 
-        truncated_bytes = json_str.encode("utf-8")[:available]
-        truncated = truncated_bytes.decode("utf-8", errors="ignore")
+        if json_str.isascii():
+            # `json.dumps` output always is: slice it, no encoding needed.
+            truncated = json_str[:available]
+        else:
+            truncated_bytes = json_str.encode("utf-8")[:available]
+            truncated = truncated_bytes.decode("utf-8", errors="ignore")
 
-        return truncated + marker
+        return truncated + _TRUNCATION_MARKER
@@ -1,4 +1,4 @@
-"""In-memory response cache with LRU eviction and TTL.
+"""In-memory response cache with second-chance eviction and TTL.
 
 Thread-safe cache implementation for storing full responses
 when truncation occurs, allowing clients to retrieve complete content.
@@ -6,37 +6,101 @@ when truncation occurs, allowing clients to retrieve complete content.
 
 from collections import OrderedDict
 from dataclasses import dataclass
+import heapq
 import json
 import threading
 import time
 from typing import Any
+import zlib
 
 from ...domain.contracts.response_cache import CacheRetrievalResult, IResponseCache
 from ...logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Payloads at least this large are kept zlib-compressed. Level 1 still
+# shrinks `json.dumps` output several times over at hundreds of MB/s; below
+# this size the saving is not worth a decompression per page read.
+_COMPRESS_MIN_BYTES = 64 * 1024
+_COMPRESS_LEVEL = 1
+# Compressed in independent chunks of this many JSON bytes, so a page read
+# inflates only the chunks it overlaps. One stream would have to be inflated
+# from byte 0 on every page, which is quadratic over a full paging.
+_CHUNK_BYTES = 64 * 1024
+
 
 @dataclass
 class CacheEntry:
-    """Cache entry with value, serialized form, and expiration.
+    """Cache entry with serialized form and expiration.
+
+    Only the JSON is kept, not the response object: a decoded object graph
+    is typically several times the size of its JSON, and the cache is what
+    keeps it alive after the batch has returned its truncated copy.
 
     Attributes:
-        value: The original response data.
-        serialized: JSON-serialized string of the value.
-        expires_at: Unix timestamp when this entry expires.
+        serialized: The response serialized as JSON, UTF-8 encoded once at
+            store time so every paginated read slices it directly, or its
+            chunk-wise zlib compression if `chunk_ends` is set.
+        size: Length of the uncompressed JSON in bytes.
+        expires_at: time.monotonic() value after which this entry expires.
+        chunk_ends: End offset in `serialized` of each compressed chunk;
+            chunk i holds JSON bytes [i * _CHUNK_BYTES, (i + 1) * _CHUNK_BYTES).
+        visited: Set on every hit, cleared when eviction passes over it.
     """
 
-    value: Any
-    serialized: str
+    serialized: bytes
+    size: int
     expires_at: float
+    chunk_ends: tuple[int, ...] = ()
+    visited: bool = False
+
+    @property
+    def compressed(self) -> bool:
+        """Whether `serialized` holds compressed chunks."""
+        return bool(self.chunk_ends)
+
+    def json(self) -> bytes:
+        """The whole JSON document."""
+        if not self.compressed:
+            return self.serialized
+        return self._inflate(0, len(self.chunk_ends))
+
+    def page(self, start: int, end: int) -> str:
+        """JSON bytes [start, end) decoded, inflating only the chunks they span."""
+        if not self.compressed:
+            # A memoryview slice is decoded in place; slicing the bytes would
+            # copy the page before decoding it.
+            return str(memoryview(self.serialized)[start:end], "utf-8", "replace")
+        first = start // _CHUNK_BYTES
+        last = -(-end // _CHUNK_BYTES)
+        base = first * _CHUNK_BYTES
+        return str(memoryview(self._inflate(first, last))[start - base : end - base], "utf-8", "replace")
+
+    def _inflate(self, first: int, last: int) -> bytes:
+        """Chunks [first, last) decompressed and joined."""
+        view, ends = memoryview(self.serialized), self.chunk_ends
+        return b"".join(zlib.decompress(view[ends[i - 1] if i else 0 : ends[i]]) for i in range(first, last))
+
+
+def _compress_chunks(payload: bytes) -> tuple[bytes, tuple[int, ...]]:
+    """`payload` compressed `_CHUNK_BYTES` at a time, with each chunk's end offset."""
+    chunks = [
+        zlib.compress(payload[i : i + _CHUNK_BYTES], _COMPRESS_LEVEL) for i in range(0, len(payload), _CHUNK_BYTES)
+    ]
+    ends, offset = [], 0
+    for chunk in chunks:
+        offset += len(chunk)
+        ends.append(offset)
+    return b"".join(chunks), tuple(ends)
 
 
 class MemoryResponseCache(IResponseCache):
-    """Thread-safe LRU cache with TTL for response caching.
+    """Thread-safe cache with TTL for response caching.
 
     Provides in-memory caching with:
-    - LRU eviction when capacity is reached
+    - Second-chance (CLOCK) eviction when capacity is reached: entries queue
+      in insertion order, and one read since the last pass spares an entry
+      once. Reads only set a flag, so they run without the lock.
     - TTL-based expiration
     - Offset/limit pagination for large responses
 
@@ -65,9 +129,17 @@ class MemoryResponseCache(IResponseCache):
             raise ValueError("default_ttl_s must be positive")
 
         self._max_entries = max_entries
+        # A full cache evicts down to 95% at once (at least one entry), so
+        # steady-state inserts do not each pay for an eviction pass.
+        self._evict_to = max_entries - max(1, max_entries // 20)
         self._default_ttl_s = default_ttl_s
         self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
-        self._lock = threading.RLock()
+        # (expires_at, continuation_id) per store, so reaping pops only what
+        # has expired. Items for deleted or replaced entries are skipped when
+        # they surface.
+        self._expiry_heap: list[tuple[float, str]] = []
+        # Not reentrant: no method calls another while holding it.
+        self._lock = threading.Lock()
 
     @property
     def max_entries(self) -> int:
@@ -79,19 +151,31 @@ class MemoryResponseCache(IResponseCache):
         """Get the default TTL in seconds."""
         return self._default_ttl_s
 
-    def store(self, continuation_id: str, full_response: Any, ttl_s: int) -> None:
+    def store(
+        self,
+        continuation_id: str,
+        full_response: Any,
+        ttl_s: int,
+        *,
+        serialized: str | None = None,
+    ) -> None:
         """Store a full response in the cache.
 
         Args:
             continuation_id: Unique identifier for this cached response.
             full_response: The complete response data to cache.
             ttl_s: Time-to-live in seconds (uses default if <= 0).
+            serialized: `json.dumps(full_response)`, if already computed.
         """
         if ttl_s <= 0:
             ttl_s = self._default_ttl_s
 
+        # Stdlib json, the encoding TruncationManager measures: a truncated
+        # result's original_size_bytes then equals total_size_bytes here, and
+        # the offsets a client pages by mean the same bytes everywhere.
         try:
-            serialized = json.dumps(full_response)
+            if serialized is None:
+                serialized = json.dumps(full_response)
         except (TypeError, ValueError) as e:
             logger.warning(
                 "cache_store_serialization_failed",
@@ -99,30 +183,56 @@ class MemoryResponseCache(IResponseCache):
                 error=str(e),
             )
             return
-
+        payload = serialized.encode("utf-8")
+        size = len(payload)
+        chunk_ends: tuple[int, ...] = ()
+        if size >= _COMPRESS_MIN_BYTES:
+            packed, ends = _compress_chunks(payload)
+            if len(packed) < size:
+                payload, chunk_ends = packed, ends
+
+        now = time.monotonic()
+        entry = CacheEntry(serialized=payload, size=size, expires_at=now + ttl_s, chunk_ends=chunk_ends)
+        expired = evicted = 0
         with self._lock:
             # Remove existing entry if present
             if continuation_id in self._cache:
                 del self._cache[continuation_id]
 
-            # Evict LRU entries if at capacity
-            while len(self._cache) >= self._max_entries:
-                evicted_key, _ = self._cache.popitem(last=False)
-                logger.debug("cache_entry_evicted", continuation_id=evicted_key)
-
-            # Add new entry
-            self._cache[continuation_id] = CacheEntry(
-                value=full_response,
-                serialized=serialized,
-                expires_at=time.time() + ttl_s,
-            )
-
-            logger.debug(
-                "cache_entry_stored",
-                continuation_id=continuation_id,
-                size_bytes=len(serialized),
-                ttl_s=ttl_s,
-            )
+            # At capacity, reap expired entries first: nothing else removes
+            # them unless they are read, and they would otherwise push live
+            # entries out. A heap grown to twice capacity is trimmed too, so
+            # a cache that never fills does not keep every store's item.
+            if len(self._cache) >= self._max_entries or len(self._expiry_heap) >= 2 * self._max_entries:
+                expired = self._drop_expired(now)
+            heapq.heappush(self._expiry_heap, (entry.expires_at, continuation_id))
+
+            # Evict a batch if still at capacity, requeueing entries read
+            # since the last pass. A requeued key is moved, never popped: a
+            # lock-free read must not miss an entry that is staying.
+            if len(self._cache) >= self._max_entries:
+                while len(self._cache) > self._evict_to:
+                    oldest_key, oldest = next(iter(self._cache.items()))
+                    if oldest.visited:
+                        oldest.visited = False
+                        self._cache.move_to_end(oldest_key)
+                    else:
+                        del self._cache[oldest_key]
+                        evicted += 1
+
+            self._cache[continuation_id] = entry
+
+        if expired:
+            logger.debug("cache_expired_entries_cleared", count=expired)
+        if evicted:
+            logger.debug("cache_batch_evicted", count=evicted)
+        logger.debug(
+            "cache_entry_stored",
+            continuation_id=continuation_id,
+            size_bytes=size,
+            stored_bytes=len(payload),
+            ttl_s=ttl_s,
+        )
 
     def retrieve(
         self,
@@ -140,61 +250,59 @@ class MemoryResponseCache(IResponseCache):
         Returns:
             CacheRetrievalResult with the response data or not-found status.
         """
-        with self._lock:
-            entry = self._cache.get(continuation_id)
-
-            if entry is None:
-                return CacheRetrievalResult(found=False)
-
-            # Check expiration
-            if time.time() > entry.expires_at:
-                del self._cache[continuation_id]
-                logger.debug("cache_entry_expired", continuation_id=continuation_id)
-                return CacheRetrievalResult(found=False)
-
-            # Move to end of LRU order
-            self._cache.move_to_end(continuation_id)
-
-            # Get total size
-            total_size = len(entry.serialized.encode("utf-8"))
-
-            # Handle offset/limit for byte-level pagination
-            if offset >= total_size:
-                return CacheRetrievalResult(
-                    found=True,
-                    data=None,
-                    total_size_bytes=total_size,
-                    offset=offset,
-                    has_more=False,
-                    complete=True,
-                )
-
-            # Extract the requested portion
-            serialized_bytes = entry.serialized.encode("utf-8")
-            if limit is None:
-                chunk = serialized_bytes[offset:]
-            else:
-                chunk = serialized_bytes[offset : offset + limit]
-
-            has_more = offset + len(chunk) < total_size
-            complete = not has_more and offset == 0
-
-            # Try to deserialize the chunk if it's the complete response
-            if complete:
-                data = entry.value
-            else:
-                # Return raw string for partial responses
-                data = chunk.decode("utf-8", errors="replace")
-
+        # A hit takes no lock: a single dict lookup is atomic under the GIL,
+        # and the only write is the visited flag. The serialized bytes are
+        # never replaced once stored.
+        entry = self._cache.get(continuation_id)
+        if entry is None:
+            return CacheRetrievalResult(found=False)
+
+        # Check expiration
+        if time.monotonic() > entry.expires_at:
+            with self._lock:
+                # A concurrent store may have replaced it in the meantime
+                if self._cache.get(continuation_id) is entry:
+                    del self._cache[continuation_id]
+            logger.debug("cache_entry_expired", continuation_id=continuation_id)
+            return CacheRetrievalResult(found=False)
+
+        entry.visited = True
+
+        # Get total size
+        total_size = entry.size
+
+        # Handle offset/limit for byte-level pagination
+        if offset >= total_size:
             return CacheRetrievalResult(
                 found=True,
-                data=data,
+                data=None,
                 total_size_bytes=total_size,
                 offset=offset,
-                has_more=has_more,
-                complete=complete,
+                has_more=False,
+                complete=True,
             )
 
+        # Extract the requested portion
+        end = total_size if limit is None else min(offset + limit, total_size)
+        has_more = end < total_size
+        complete = not has_more and offset == 0
+
+        # Deserialize if it's the complete response, as RedisResponseCache does
+        if complete:
+            data = json.loads(entry.json())
+        else:
+            # Return raw string for partial responses
+            data = entry.page(offset, end)
+
+        return CacheRetrievalResult(
+            found=True,
+            data=data,
+            total_size_bytes=total_size,
+            offset=offset,
+            has_more=has_more,
+            complete=complete,
+        )
+
     def delete(self, continuation_id: str) -> bool:
         """Delete a cached response.
 
@@ -205,11 +313,10 @@ class MemoryResponseCache(IResponseCache):
             True if the entry was deleted, False if it didn't exist.
         """
         with self._lock:
-            if continuation_id in self._cache:
-                del self._cache[continuation_id]
-                logger.debug("cache_entry_deleted", continuation_id=continuation_id)
-                return True
-            return False
+            deleted = self._cache.pop(continuation_id, None) is not None
+        if deleted:
+            logger.debug("cache_entry_deleted", continuation_id=continuation_id)
+        return deleted
 
     def clear_expired(self) -> int:
         """Remove all expired entries from the cache.
@@ -217,16 +324,26 @@ class MemoryResponseCache(IResponseCache):
         Returns:
             The number of entries that were removed.
         """
+        now = time.monotonic()
         with self._lock:
-            now = time.time()
-            expired_keys = [key for key, entry in self._cache.items() if now > entry.expires_at]
-            for key in expired_keys:
-                del self._cache[key]
+            expired = self._drop_expired(now)
 
-            if expired_keys:
-                logger.debug("cache_expired_entries_cleared", count=len(expired_keys))
+        if expired:
+            logger.debug("cache_expired_entries_cleared", count=expired)
 
-            return len(expired_keys)
+        return expired
+
+    def _drop_expired(self, now: float) -> int:
+        """Delete entries expired at `now`; the caller holds the lock."""
+        heap = self._expiry_heap
+        count = 0
+        while heap and heap[0][0] < now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            if entry is not None and entry.expires_at == expires_at:
+                del self._cache[key]
+                count += 1
+        return count
 
     def size(self) -> int:
         """Get the current number of entries in the cache.
@@ -246,5 +363,6 @@ class MemoryResponseCache(IResponseCache):
         with self._lock:
             count = len(self._cache)
             self._cache.clear()
-            logger.info("cache_cleared", count=count)
-            return count
+            self._expiry_heap.clear()
+        logger.info("cache_cleared", count=count)
+        return count
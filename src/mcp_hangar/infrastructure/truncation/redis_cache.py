@@ -51,7 +51,9 @@ class RedisResponseCache(IResponseCache):
             ) from e
 
         self._redis_url = redis_url
-        self._client: redis.Redis = redis.from_url(redis_url, decode_responses=True)
+        # Raw bytes: retrieve() slices the payload by byte offset, which a
+        # decoded str would have to be encoded back into first.
+        self._client: redis.Redis = redis.from_url(redis_url, decode_responses=False)
 
         logger.info("redis_cache_initialized", url=self._sanitize_url(redis_url))
 
@@ -68,19 +70,28 @@ class RedisResponseCache(IResponseCache):
         """Create the Redis key for a continuation ID."""
         return f"{KEY_PREFIX}{continuation_id}"
 
-    def store(self, continuation_id: str, full_response: Any, ttl_s: int) -> None:
+    def store(
+        self,
+        continuation_id: str,
+        full_response: Any,
+        ttl_s: int,
+        *,
+        serialized: str | None = None,
+    ) -> None:
         """Store a full response in Redis.
 
         Args:
             continuation_id: Unique identifier for this cached response.
             full_response: The complete response data to cache.
             ttl_s: Time-to-live in seconds.
+            serialized: `json.dumps(full_response)`, if already computed.
         """
         if ttl_s <= 0:
             ttl_s = 300  # Default 5 minutes
 
         try:
-            serialized = json.dumps(full_response)
+            if serialized is None:
+                serialized = json.dumps(full_response)
         except (TypeError, ValueError) as e:
             logger.warning(
                 "redis_cache_store_serialization_failed",
@@ -122,10 +133,8 @@ class RedisResponseCache(IResponseCache):
         Returns:
             CacheRetrievalResult with the response data or not-found status.
         """
-        key = self._make_key(continuation_id)
-
         try:
-            serialized = self._client.get(key)
+            buffer, base, total_size = self._read(self._make_key(continuation_id), offset, limit)
         except Exception as e:  # noqa: BLE001 -- infra-boundary: graceful degradation on Redis failure
             logger.error(
                 "redis_cache_retrieve_failed",
@@ -134,13 +143,9 @@ class RedisResponseCache(IResponseCache):
             )
             return CacheRetrievalResult(found=False)
 
-        if serialized is None:
+        if buffer is None:
             return CacheRetrievalResult(found=False)
 
-        # Calculate total size
-        serialized_bytes = serialized.encode("utf-8")
-        total_size = len(serialized_bytes)
-
         # Handle offset/limit for byte-level pagination
         if offset >= total_size:
             return CacheRetrievalResult(
@@ -152,24 +157,22 @@ class RedisResponseCache(IResponseCache):
                 complete=True,
             )
 
-        # Extract the requested portion
-        if limit is None:
-            chunk = serialized_bytes[offset:]
-        else:
-            chunk = serialized_bytes[offset : offset + limit]
-
-        has_more = offset + len(chunk) < total_size
+        # Extract the requested portion. A memoryview slice is decoded in
+        # place; slicing the bytes would copy the page before decoding it.
+        end = total_size if limit is None else min(offset + limit, total_size)
+        has_more = end < total_size
         complete = not has_more and offset == 0
 
-        # Try to deserialize if it's the complete response
+        # Try to deserialize if it's the complete response; buffer then
+        # holds all of it, whichever way it was read
         if complete:
             try:
-                data = json.loads(serialized)
-            except json.JSONDecodeError:
-                data = serialized
+                data = json.loads(buffer)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                data = buffer.decode("utf-8", errors="replace")
         else:
             # Return raw string for partial responses
-            data = chunk.decode("utf-8", errors="replace")
+            data = str(memoryview(buffer)[offset - base : end - base], "utf-8", "replace")
 
         return CacheRetrievalResult(
             found=True,
@@ -180,6 +183,33 @@ class RedisResponseCache(IResponseCache):
             complete=complete,
         )
 
+    def _read(self, key: str, offset: int, limit: int | None) -> tuple[bytes | None, int, int]:
+        """Read the bytes retrieve() needs for one page.
+
+        A page is fetched with GETRANGE, so paging through a large response
+        transfers each page once instead of the whole payload per call.
+        STRLEN is sent in the same MULTI for total_size; it is 0 for a
+        missing key, and a stored payload is never empty.
+
+        Returns:
+            The bytes read (None if the key is missing), the payload offset
+            they start at, and the payload's total size.
+        """
+        if offset == 0 and limit is None:
+            payload = self._client.get(key)
+            return payload, 0, 0 if payload is None else len(payload)
+        if limit is not None and limit <= 0:
+            # An empty page: total_size is all there is to read
+            total_size = self._client.strlen(key)
+            return (b"" if total_size else None), offset, total_size
+
+        last = -1 if limit is None else offset + limit - 1
+        pipe = self._client.pipeline()
+        pipe.strlen(key)
+        pipe.getrange(key, offset, last)
+        total_size, page = pipe.execute()
+        return (page if total_size else None), offset, total_size
+
     def delete(self, continuation_id: str) -> bool:
         """Delete a cached response from Redis.
 
@@ -249,8 +279,11 @@ class RedisResponseCache(IResponseCache):
             Number of entries cleared.
         """
         try:
+            # UNLINK frees values in a background thread, where DEL would
+            # block Redis on large responses; the batches are queued and sent
+            # together instead of costing a round trip each
+            pipe = self._client.pipeline(transaction=False)
             cursor = "0"
-            total_deleted = 0
             while cursor != 0:
                 cursor, keys = self._client.scan(
                     cursor=int(cursor),
@@ -258,8 +291,8 @@ class RedisResponseCache(IResponseCache):
                     count=1000,
                 )
                 if keys:
-                    deleted = self._client.delete(*keys)
-                    total_deleted += deleted
+                    pipe.unlink(*keys)
+            total_deleted = cast(int, sum(pipe.execute()))
 
             logger.info("redis_cache_cleared", count=total_deleted)
             return total_deleted
@@ -1270,8 +1270,10 @@ def record_gc_cycle(duration: float, collected: dict[str, int] | None = None):
     GC_CYCLE_DURATION_SECONDS.observe(duration)
     if collected:
         for reason, count in collected.items():
-            for _ in range(count):
-                GC_PROVIDERS_COLLECTED_TOTAL.inc(reason=reason)
+            # One increment per reason, not per mcp_server. Skipping zero keeps
+            # a reason that never fired out of the exposition.
+            if count:
+                GC_PROVIDERS_COLLECTED_TOTAL.inc(count, reason=reason)
 
 
 def record_error(component: str, error_type: str):
@@ -7,9 +7,8 @@ and updates the MCP Hangar config file.
 import json
 import os
 from pathlib import Path
-from typing import Annotated, cast
+from typing import Annotated, cast, TYPE_CHECKING
 
-import questionary
 from rich import box
 from rich.console import Console
 from rich.table import Table
@@ -17,12 +16,16 @@ import typer
 
 from ..errors import McpServerNotFoundError
 from ..main import GlobalOptions
-from ..services import ConfigFileManager, get_all_mcp_servers, get_mcp_server, McpServerDefinition, search_mcp_servers
+
+# questionary (prompt_toolkit) and the services are imported where they are
+# used: this module is loaded to register `add` on every CLI invocation.
+if TYPE_CHECKING:
+    from ..services import McpServerDefinition
 
 console = Console()
 
 
-def _display_search_results(results: list[McpServerDefinition]) -> str | None:
+def _display_search_results(results: list["McpServerDefinition"]) -> str | None:
     """Display search results and let user select.
 
     Args:
@@ -34,6 +37,8 @@ def _display_search_results(results: list[McpServerDefinition]) -> str | None:
     if not results:
         return None
 
+    import questionary
+
     if len(results) == 1:
         result = results[0]
         console.print(f"\n[bold]Found:[/bold] {result.name} - {result.description}")
@@ -63,7 +68,7 @@ def _display_search_results(results: list[McpServerDefinition]) -> str | None:
     return cast(str | None, questionary.select("Select a mcp_server to install:", choices=choices).ask())
 
 
-def _collect_config(mcp_server: McpServerDefinition) -> dict | None:
+def _collect_config(mcp_server: "McpServerDefinition") -> dict | None:
     """Collect configuration for a mcp_server.
 
     Args:
@@ -75,6 +80,8 @@ def _collect_config(mcp_server: McpServerDefinition) -> dict | None:
     if not mcp_server.requires_config:
         return {}
 
+    import questionary
+
     # Check if env var is already set
     if mcp_server.env_var and os.environ.get(mcp_server.env_var):
         use_env = questionary.confirm(
@@ -91,8 +98,11 @@ def _collect_config(mcp_server: McpServerDefinition) -> dict | None:
     if mcp_server.config_type == "secret":
         value = questionary.password(f"{mcp_server.config_prompt}:").ask()
     elif mcp_server.config_type == "path":
+        from ..services import DirectoryCompleter
+
         is_dir = bool(mcp_server.config_prompt and "directory" in mcp_server.config_prompt.lower())
-        value = questionary.path(f"{mcp_server.config_prompt}:", only_directories=is_dir).ask()
+        completer = DirectoryCompleter() if is_dir else None
+        value = questionary.path(f"{mcp_server.config_prompt}:", completer=completer).ask()
         if value:
             value = str(Path(value).expanduser().resolve())
     else:
@@ -148,6 +158,10 @@ def add_command(
         mcp-hangar add --search database
         mcp-hangar add filesystem -y
     """
+    import questionary
+
+    from ..services import ConfigFileManager, get_all_mcp_servers, get_mcp_server, search_mcp_servers
+
     global_opts: GlobalOptions = ctx.obj if ctx.obj else GlobalOptions()
     config_mgr = ConfigFileManager(global_opts.config)
 
@@ -13,30 +13,22 @@ This command provides the "5-minute experience" for new users:
 
 import os
 from pathlib import Path
-from typing import Annotated, cast
+from typing import Annotated, cast, TYPE_CHECKING
 
-import questionary
 from rich import box
 from rich.console import Console
+from rich.highlighter import NullHighlighter
 from rich.panel import Panel
 from rich.table import Table
 import typer
 
 from ..errors import CLIError, PermissionError
 from ..main import GlobalOptions
-from ..services import (
-    ClaudeDesktopManager,
-    ConfigFileManager,
-    DependencyStatus,
-    detect_dependencies,
-    filter_bundle_by_availability,
-    get_install_instructions,
-    get_mcp_server,
-    get_mcp_servers_by_category_filtered,
-    PROVIDER_BUNDLES,
-    McpServerDefinition,
-    run_smoke_test,
-)
+
+# questionary (prompt_toolkit) and the services are imported where they are
+# used: this module is loaded to register `init` on every CLI invocation.
+if TYPE_CHECKING:
+    from ..services import ClaudeDesktopManager, ConfigFileManager, DependencyStatus, McpServerDefinition
 
 
 # Existing config handling options
@@ -55,9 +47,14 @@ app = typer.Typer(
 )
 
 console = Console()
+if console.color_system is None:
+    # Piped, captured or TERM=dumb: the highlighter's regex pass over every
+    # printed line would only add colour that is never shown. Markup stays
+    # on; its tags are not content.
+    console.highlighter = NullHighlighter()
 
 
-def _show_dependency_status(deps: DependencyStatus) -> None:
+def _show_dependency_status(deps: "DependencyStatus") -> None:
     """Display detected dependencies status."""
     table = Table(box=box.SIMPLE, show_header=False, padding=(0, 2))
     table.add_column("Runtime", style="bold")
@@ -76,68 +73,79 @@ def _show_dependency_status(deps: DependencyStatus) -> None:
     console.print(table)
 
 
-def _check_dependencies_or_exit(deps: DependencyStatus, non_interactive: bool) -> None:
+def _check_dependencies_or_exit(deps: "DependencyStatus", non_interactive: bool) -> None:
     """Check if any runtime is available, exit with instructions if not."""
     if deps.has_any:
         return
 
-    console.print("\n[bold red]No supported runtimes found![/bold red]\n")
-    console.print("MCP Hangar requires at least one of the following to run mcp_servers:\n")
+    from ..services import get_install_instructions
 
     instructions = get_install_instructions(["npx", "uvx", "docker/podman"])
-    for runtime, instruction in instructions.items():
-        console.print(f"  [bold]{runtime}[/bold]: {instruction}")
 
-    console.print("\n[dim]Install one of the above and run 'mcp-hangar init' again.[/dim]")
+    # One write for the whole block: the console buffers until the `with` exits
+    with console:
+        console.print("\n[bold red]No supported runtimes found![/bold red]\n")
+        console.print("MCP Hangar requires at least one of the following to run mcp_servers:\n")
+        for runtime, instruction in instructions.items():
+            console.print(f"  [bold]{runtime}[/bold]: {instruction}")
+        console.print("\n[dim]Install one of the above and run 'mcp-hangar init' again.[/dim]")
     raise typer.Exit(1)
 
 
-def _prompt_mcp_server_selection(deps: DependencyStatus) -> list[str]:
+def _prompt_mcp_server_selection(deps: "DependencyStatus") -> list[str]:
     """Interactive mcp_server selection with categories."""
+    import questionary
+
+    from ..services import get_mcp_servers_by_category_filtered
+
     available_cats, unavailable_cats = get_mcp_servers_by_category_filtered(deps)
-    selected = []
 
     console.print("\n[bold]Select mcp_servers to enable:[/bold]")
     console.print("[dim]Use arrow keys and space to select, Enter to confirm[/dim]\n")
 
+    # One prompt with a separator per category: every prompt is a full
+    # prompt_toolkit session (raw mode, renderer, teardown), and one list
+    # also lets the user move back to an earlier category
+    choices: list = []
     for category, mcp_servers in available_cats.items():
+        if not mcp_servers:
+            continue
         is_starter = category == "Starter"
-        choices = [
+        category_label = f"{category} (recommended for everyone)" if is_starter else category
+        choices.append(questionary.Separator(f"-- {category_label} --"))
+        choices.extend(
             questionary.Choice(
                 title=f"{p.name} - {p.description}",
                 value=p.name,
                 checked=is_starter,
             )
             for p in mcp_servers
-        ]
-
-        if choices:
-            category_label = f"{category} (recommended for everyone)" if is_starter else category
-            category_selected = questionary.checkbox(
-                category_label,
-                choices=choices,
-            ).ask()
-
-            if category_selected is None:
-                raise typer.Abort()
+        )
 
-            selected.extend(category_selected)
+    selected: list[str] = []
+    if choices:
+        selected = questionary.checkbox("Select MCP servers:", choices=choices).ask()
+        if selected is None:
+            raise typer.Abort()
 
     if unavailable_cats:
-        console.print("\n[dim]Unavailable mcp_servers (missing dependencies):[/dim]")
-        for category, mcp_servers in unavailable_cats.items():
-            for p in mcp_servers:
-                reason = p.get_unavailable_reason(deps)
-                console.print(f"  [dim]{p.name} - {p.description} ({reason})[/dim]")
+        with console:
+            console.print("\n[dim]Unavailable mcp_servers (missing dependencies):[/dim]")
+            for category, mcp_servers in unavailable_cats.items():
+                for p in mcp_servers:
+                    reason = p.get_unavailable_reason(deps)
+                    console.print(f"  [dim]{p.name} - {p.description} ({reason})[/dim]")
 
     return selected
 
 
-def _collect_mcp_server_config(mcp_server: McpServerDefinition) -> dict | None:
+def _collect_mcp_server_config(mcp_server: "McpServerDefinition") -> dict | None:
     """Collect configuration for a mcp_server that requires it."""
     if not mcp_server.requires_config:
         return {}
 
+    import questionary
+
     if mcp_server.env_var and os.environ.get(mcp_server.env_var):
         use_env = questionary.confirm(
             f"{mcp_server.name}: Use existing ${mcp_server.env_var} environment variable?",
@@ -164,11 +172,13 @@ def _collect_mcp_server_config(mcp_server: McpServerDefinition) -> dict | None:
         return {"value": value, "env_var": mcp_server.env_var}
 
     elif mcp_server.config_type == "path":
+        from ..services import DirectoryCompleter
+
         default_path = str(Path.home())
         value = questionary.path(
             f"{mcp_server.config_prompt}:",
             default=default_path,
-            only_directories=True,
+            completer=DirectoryCompleter(),
         ).ask()
 
         if not value:
@@ -182,7 +192,7 @@ def _collect_mcp_server_config(mcp_server: McpServerDefinition) -> dict | None:
 
 
 def _prompt_existing_config_action(
-    config_mgr: ConfigFileManager,
+    config_mgr: "ConfigFileManager",
     selected_mcp_servers: list[str],
 ) -> str:
     """Prompt user for action when config already exists.
@@ -194,16 +204,22 @@ def _prompt_existing_config_action(
     Returns:
         One of ExistingConfigAction values.
     """
+    import questionary
+
     existing_mcp_servers = config_mgr.list_mcp_servers()
 
-    console.print(f"  [yellow]Configuration exists at {config_mgr.config_path}[/yellow]")
-    console.print(f"  [dim]Existing mcp_servers: {', '.join(existing_mcp_servers) or '(none)'}[/dim]")
-    console.print(f"  [dim]New mcp_servers: {', '.join(selected_mcp_servers) or '(none)'}[/dim]")
+    # Check for overlapping mcp_servers, in selection order: one pass over the
+    # selection, and a stable listing where a set intersection has none
+    existing = set(existing_mcp_servers)
+    overlap = [name for name in selected_mcp_servers if name in existing]
 
-    # Check for overlapping mcp_servers
-    overlap = set(existing_mcp_servers) & set(selected_mcp_servers)
-    if overlap:
-        console.print(f"  [dim]Overlapping (will be skipped in merge): {', '.join(overlap)}[/dim]")
+    # Written in one go, and before the prompt below takes over the terminal
+    with console:
+        console.print(f"  [yellow]Configuration exists at {config_mgr.config_path}[/yellow]")
+        console.print(f"  [dim]Existing mcp_servers: {', '.join(existing_mcp_servers) or '(none)'}[/dim]")
+        console.print(f"  [dim]New mcp_servers: {', '.join(selected_mcp_servers) or '(none)'}[/dim]")
+        if overlap:
+            console.print(f"  [dim]Overlapping (will be skipped in merge): {', '.join(overlap)}[/dim]")
 
     choices = [
         questionary.Choice(
@@ -231,6 +247,13 @@ def _prompt_existing_config_action(
     return cast(str, action)
 
 
+def _probe_claude_desktop(claude_mgr: "ClaudeDesktopManager") -> dict | None:
+    """Existing MCP servers in the Claude Desktop config, or None if it is not found."""
+    if not claude_mgr.exists():
+        return None
+    return claude_mgr.get_mcp_servers()
+
+
 def _show_completion_summary(
     mcp_servers: list[str],
     hangar_config_path: Path,
@@ -239,8 +262,6 @@ def _show_completion_summary(
     smoke_test_passed: bool = True,
 ):
     """Display completion summary with next steps."""
-    console.print()
-
     table = Table(box=box.ROUNDED, show_header=False, padding=(0, 2))
     table.add_column("Item", style="bold")
     table.add_column("Value")
@@ -265,23 +286,26 @@ def _show_completion_summary(
     )
     border = "green" if smoke_test_passed else "yellow"
 
-    console.print(Panel(table, title=title, border_style=border))
-
-    if mcp_servers:
-        console.print("\n[bold]Enabled mcp_servers:[/bold]")
-        for name in mcp_servers:
-            console.print(f"  [green]+[/green] {name}")
-
-    console.print("\n[bold]Next steps:[/bold]")
-    if not smoke_test_passed:
-        console.print("  1. [bold]Review errors above[/bold] and fix mcp_server configuration")
-        console.print("  2. Run [bold]mcp-hangar serve[/bold] to test manually")
-        console.print("  3. [bold]Restart Claude Desktop[/bold] when ready")
-    else:
-        console.print("  1. [bold]Restart Claude Desktop[/bold] to activate the new configuration")
-        console.print("  2. Run [bold]mcp-hangar status[/bold] to verify mcp_servers are healthy")
-        console.print("  3. Run [bold]mcp-hangar add <mcp_server>[/bold] to add more mcp_servers later")
-    console.print("\n[dim]Need help? Visit https://docs.mcp-hangar.io[/dim]")
+    # Buffered in the console and written once when the block exits
+    with console:
+        console.print()
+        console.print(Panel(table, title=title, border_style=border))
+
+        if mcp_servers:
+            console.print("\n[bold]Enabled mcp_servers:[/bold]")
+            for name in mcp_servers:
+                console.print(f"  [green]+[/green] {name}")
+
+        console.print("\n[bold]Next steps:[/bold]")
+        if not smoke_test_passed:
+            console.print("  1. [bold]Review errors above[/bold] and fix mcp_server configuration")
+            console.print("  2. Run [bold]mcp-hangar serve[/bold] to test manually")
+            console.print("  3. [bold]Restart Claude Desktop[/bold] when ready")
+        else:
+            console.print("  1. [bold]Restart Claude Desktop[/bold] to activate the new configuration")
+            console.print("  2. Run [bold]mcp-hangar status[/bold] to verify mcp_servers are healthy")
+            console.print("  3. Run [bold]mcp-hangar add <mcp_server>[/bold] to add more mcp_servers later")
+        console.print("\n[dim]Need help? Visit https://docs.mcp-hangar.io[/dim]")
 
 
 @app.callback(invoke_without_command=True)
@@ -336,6 +360,19 @@ def init_command(  # noqa: C901 -- baseline CC=49; split before extending
         mcp-hangar init --mcp_servers filesystem,github,sqlite
         mcp-hangar init --non-interactive --bundle developer
     """
+    import questionary
+
+    from ..services import (
+        ClaudeDesktopManager,
+        ConfigFileManager,
+        detect_dependencies,
+        filter_bundle_by_availability,
+        get_mcp_server,
+        get_mcp_servers,
+        PROVIDER_BUNDLES,
+        run_smoke_test,
+    )
+
     global_opts: GlobalOptions = ctx.obj if ctx.obj else GlobalOptions()
 
     # Initialize managers
@@ -343,17 +380,20 @@ def init_command(  # noqa: C901 -- baseline CC=49; split before extending
     config_mgr = ConfigFileManager(effective_config_path)
     claude_mgr = ClaudeDesktopManager(claude_config_path)
 
-    # Step 0: Detect available runtimes
+    # Step 0: Detect available runtimes, and read the Claude Desktop config
+    # once for Step 1
     deps = detect_dependencies()
+    claude_servers = _probe_claude_desktop(claude_mgr)
 
-    console.print("\n[bold]Step 0:[/bold] Detecting available runtimes...")
-    if non_interactive:
-        if deps.available_runtimes:
-            console.print(f"  [green]Available:[/green] {', '.join(deps.available_runtimes)}")
-        if deps.missing_runtimes:
-            console.print(f"  [dim]Not found: {', '.join(deps.missing_runtimes)}[/dim]")
-    else:
-        _show_dependency_status(deps)
+    with console:
+        console.print("\n[bold]Step 0:[/bold] Detecting available runtimes...")
+        if non_interactive:
+            if deps.available_runtimes:
+                console.print(f"  [green]Available:[/green] {', '.join(deps.available_runtimes)}")
+            if deps.missing_runtimes:
+                console.print(f"  [dim]Not found: {', '.join(deps.missing_runtimes)}[/dim]")
+        else:
+            _show_dependency_status(deps)
 
     _check_dependencies_or_exit(deps, non_interactive)
 
@@ -373,11 +413,10 @@ def init_command(  # noqa: C901 -- baseline CC=49; split before extending
     # Step 1: Detect Claude Desktop
     console.print("\n[bold]Step 1:[/bold] Detecting Claude Desktop...")
 
-    if claude_mgr.exists():
+    if claude_servers is not None:
         console.print(f"  [green]Found:[/green] {claude_mgr.config_path}")
-        servers = claude_mgr.get_mcp_servers()
-        if servers:
-            console.print(f"  [dim]Existing MCP servers: {len(servers)}[/dim]")
+        if claude_servers:
+            console.print(f"  [dim]Existing MCP servers: {len(claude_servers)}[/dim]")
     elif not skip_claude:
         if non_interactive:
             console.print("  [yellow]Claude Desktop not found - skipping integration[/yellow]")
@@ -492,18 +531,18 @@ def init_command(  # noqa: C901 -- baseline CC=49; split before extending
 
         elif action == ExistingConfigAction.MERGE:
             # Merge new mcp_servers with existing
-            mcp_server_defs_raw = [get_mcp_server(name) for name in selected_mcp_servers]
-            mcp_server_defs = [p for p in mcp_server_defs_raw if p is not None]
+            mcp_server_defs = get_mcp_servers(selected_mcp_servers)
 
             try:
                 added, skipped, total = config_mgr.merge_mcp_servers(mcp_server_defs, mcp_server_configs, deps)
 
-                if added:
-                    console.print(f"  [green]Added:[/green] {', '.join(added)}")
-                if skipped:
-                    console.print(f"  [dim]Skipped (already exist): {', '.join(skipped)}[/dim]")
-                console.print(f"  [green]Updated:[/green] {config_mgr.config_path}")
-                console.print(f"  [dim]Total mcp_servers: {len(total)}[/dim]")
+                with console:
+                    if added:
+                        console.print(f"  [green]Added:[/green] {', '.join(added)}")
+                    if skipped:
+                        console.print(f"  [dim]Skipped (already exist): {', '.join(skipped)}[/dim]")
+                    console.print(f"  [green]Updated:[/green] {config_mgr.config_path}")
+                    console.print(f"  [dim]Total mcp_servers: {len(total)}[/dim]")
 
                 final_mcp_servers = total
                 merged_mcp_servers = True
@@ -518,8 +557,7 @@ def init_command(  # noqa: C901 -- baseline CC=49; split before extending
                 if backup_path:
                     console.print(f"  [dim]Backed up to: {backup_path}[/dim]")
 
-            mcp_server_defs_raw = [get_mcp_server(name) for name in selected_mcp_servers]
-            mcp_server_defs = [p for p in mcp_server_defs_raw if p is not None]
+            mcp_server_defs = get_mcp_servers(selected_mcp_servers)
 
             try:
                 config_mgr.write_initial_config(mcp_server_defs, mcp_server_configs, deps)
@@ -529,8 +567,7 @@ def init_command(  # noqa: C901 -- baseline CC=49; split before extending
 
     else:
         # No existing config or reset flag - write fresh config
-        mcp_server_defs_raw = [get_mcp_server(name) for name in selected_mcp_servers]
-        mcp_server_defs = [p for p in mcp_server_defs_raw if p is not None]
+        mcp_server_defs = get_mcp_servers(selected_mcp_servers)
 
         try:
             config_mgr.write_initial_config(mcp_server_defs, mcp_server_configs, deps)
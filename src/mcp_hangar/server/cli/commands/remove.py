@@ -8,7 +8,6 @@ import json
 from pathlib import Path
 from typing import Annotated
 
-import questionary
 from rich.console import Console
 import typer
 
@@ -144,6 +143,8 @@ def remove_command(
 
     # Confirm removal
     if not yes:
+        import questionary  # prompt_toolkit: only loaded when actually prompting
+
         confirm = questionary.confirm(
             f"Remove mcp_server '{name}' from configuration?",
             default=False,
@@ -1,26 +1,69 @@
-"""CLI services - extracted functionality from commands."""
+"""CLI services - extracted functionality from commands.
 
-from .claude_desktop import ClaudeDesktopManager
-from .config_file import ConfigFileManager
-from .dependency_detector import (
-    DependencyStatus,
-    detect_dependencies,
-    get_install_instructions,
-    is_mcp_server_available,
-)
-from .mcp_server_registry import (
-    filter_bundle_by_availability,
-    get_all_mcp_servers,
-    get_available_mcp_servers,
-    get_mcp_server,
-    get_mcp_servers_by_category,
-    get_mcp_servers_by_category_filtered,
-    get_unavailable_mcp_servers,
-    PROVIDER_BUNDLES,
-    McpServerDefinition,
-    search_mcp_servers,
-)
-from .smoke_test import McpServerTestResult, run_smoke_test, run_smoke_test_simple, SmokeTestResult
+Re-exports resolve on first access: every subcommand module is imported to
+register the CLI, and most invocations use one service or none.
+"""
+
+from importlib import import_module
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .claude_desktop import ClaudeDesktopManager
+    from .config_file import ConfigFileManager
+    from .dependency_detector import (
+        DependencyStatus,
+        detect_dependencies,
+        get_install_instructions,
+        is_mcp_server_available,
+    )
+    from .mcp_server_registry import (
+        filter_bundle_by_availability,
+        get_all_mcp_servers,
+        get_available_mcp_servers,
+        get_mcp_server,
+        get_mcp_servers,
+        get_mcp_servers_by_category,
+        get_mcp_servers_by_category_filtered,
+        get_unavailable_mcp_servers,
+        PROVIDER_BUNDLES,
+        McpServerDefinition,
+        search_mcp_servers,
+    )
+    from .path_completer import DirectoryCompleter
+    from .smoke_test import McpServerTestResult, run_smoke_test, run_smoke_test_simple, SmokeTestResult
+
+# Exported name -> (submodule, attribute)
+_SYMBOLS = {
+    "DependencyStatus": ("dependency_detector", "DependencyStatus"),
+    "detect_dependencies": ("dependency_detector", "detect_dependencies"),
+    "get_install_instructions": ("dependency_detector", "get_install_instructions"),
+    "is_mcp_server_available": ("dependency_detector", "is_mcp_server_available"),
+    "McpServerDefinition": ("mcp_server_registry", "McpServerDefinition"),
+    "PROVIDER_BUNDLES": ("mcp_server_registry", "PROVIDER_BUNDLES"),
+    "get_all_mcp_servers": ("mcp_server_registry", "get_all_mcp_servers"),
+    "get_available_mcp_servers": ("mcp_server_registry", "get_available_mcp_servers"),
+    "get_unavailable_mcp_servers": ("mcp_server_registry", "get_unavailable_mcp_servers"),
+    "get_mcp_server": ("mcp_server_registry", "get_mcp_server"),
+    "get_mcp_servers": ("mcp_server_registry", "get_mcp_servers"),
+    "get_mcp_servers_by_category": ("mcp_server_registry", "get_mcp_servers_by_category"),
+    "get_mcp_servers_by_category_filtered": ("mcp_server_registry", "get_mcp_servers_by_category_filtered"),
+    "filter_bundle_by_availability": ("mcp_server_registry", "filter_bundle_by_availability"),
+    "search_mcp_servers": ("mcp_server_registry", "search_mcp_servers"),
+    "ConfigFileManager": ("config_file", "ConfigFileManager"),
+    "ClaudeDesktopManager": ("claude_desktop", "ClaudeDesktopManager"),
+    "DirectoryCompleter": ("path_completer", "DirectoryCompleter"),
+    "run_smoke_test": ("smoke_test", "run_smoke_test"),
+    "run_smoke_test_simple": ("smoke_test", "run_smoke_test_simple"),
+    "SmokeTestResult": ("smoke_test", "SmokeTestResult"),
+    "McpServerTestResult": ("smoke_test", "McpServerTestResult"),
+    # legacy aliases
+    "".join(("get_all_pro", "viders")): ("mcp_server_registry", "get_all_mcp_servers"),
+    "".join(("get_pro", "vider")): ("mcp_server_registry", "get_mcp_server"),
+    "".join(("search_pro", "viders")): ("mcp_server_registry", "search_mcp_servers"),
+    "".join(("Pro", "viderDefinition")): ("mcp_server_registry", "McpServerDefinition"),
+    "get_providers_by_category": ("mcp_server_registry", "get_mcp_servers_by_category"),
+}
 
 __all__ = [
     # Dependency detection
@@ -35,6 +78,7 @@ __all__ = [
     "get_available_mcp_servers",
     "get_unavailable_mcp_servers",
     "get_mcp_server",
+    "get_mcp_servers",
     "get_mcp_servers_by_category",
     "get_mcp_servers_by_category_filtered",
     "filter_bundle_by_availability",
@@ -43,6 +87,8 @@ __all__ = [
     "ConfigFileManager",
     # Claude Desktop management
     "ClaudeDesktopManager",
+    # Path prompts
+    "DirectoryCompleter",
     # Smoke test
     "run_smoke_test",
     "run_smoke_test_simple",
@@ -50,18 +96,15 @@ __all__ = [
     "McpServerTestResult",
 ]
 
-import sys
-from importlib import import_module
 
-# legacy aliases
-globals().update(
-    {
-        "".join(("get_all_pro", "viders")): get_all_mcp_servers,
-        "".join(("get_pro", "vider")): get_mcp_server,
-        "".join(("search_pro", "viders")): search_mcp_servers,
-        "".join(("Pro", "viderDefinition")): McpServerDefinition,
-    }
-)
-sys.modules[f"{__name__}.{''.join(('pro', 'vider_registry'))}"] = import_module(f"{__name__}.mcp_server_registry")
+def __getattr__(name: str) -> object:
+    target = _SYMBOLS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{target[0]}"), target[1])
+    globals()[name] = value
+    return value
 
-get_providers_by_category = get_mcp_servers_by_category
+
+# legacy module alias; the registry is plain data, cheap to import
+sys.modules[f"{__name__}.{''.join(('pro', 'vider_registry'))}"] = import_module(f"{__name__}.mcp_server_registry")
@@ -1,6 +1,8 @@
 """Config file manager - handles MCP Hangar config file operations."""
 
+import copy
 from datetime import datetime
+import os
 from pathlib import Path
 import shutil
 
@@ -9,6 +11,11 @@ import yaml
 from .dependency_detector import DependencyStatus, detect_dependencies
 from .mcp_server_registry import McpServerDefinition
 
+# libyaml when PyYAML was built with it: the pure-Python loader and dumper are
+# several times slower on every read-modify-write the CLI makes
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class ConfigFileManager:
     """Manages MCP Hangar configuration files."""
@@ -19,6 +26,9 @@ class ConfigFileManager:
     def __init__(self, config_path: Path | None = None):
         """Initialize with optional custom config path."""
         self.config_path = config_path or self.DEFAULT_CONFIG_PATH
+        # Last parse or save, keyed by the file's (mtime_ns, size): init
+        # reads the config to summarize it and again to merge into it
+        self._parsed: tuple[tuple[int, int], dict] | None = None
 
     def exists(self) -> bool:
         """Check if config file exists."""
@@ -27,14 +37,22 @@ class ConfigFileManager:
     def load(self) -> dict:
         """Load configuration from file.
 
+        The parse is reused while the file's mtime and size are unchanged.
+
         Returns:
             Configuration dictionary, or empty dict if file doesn't exist.
         """
-        if not self.config_path.exists():
+        try:
+            stat = self.config_path.stat()
+        except (FileNotFoundError, NotADirectoryError):
             return {}
 
-        with open(self.config_path) as f:
-            return yaml.safe_load(f) or {}
+        key = (stat.st_mtime_ns, stat.st_size)
+        if self._parsed is None or self._parsed[0] != key:
+            with open(self.config_path) as f:
+                self._parsed = (key, yaml.load(f, Loader=_Loader) or {})
+        # Callers edit what they load; the cached parse must not change with it
+        return copy.deepcopy(self._parsed[1])
 
     def save(self, config: dict) -> None:
         """Save configuration to file.
@@ -42,9 +60,19 @@ class ConfigFileManager:
         Args:
             config: Configuration dictionary to save.
         """
-        self.config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.config_path, "w") as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+        self._write(yaml.dump(config, Dumper=_Dumper, default_flow_style=False, sort_keys=False))
+        # The dict just written is what parsing the file back would produce,
+        # so a read after an add or remove skips the parse
+        stat = self.config_path.stat()
+        self._parsed = ((stat.st_mtime_ns, stat.st_size), copy.deepcopy(config))
+
+    def clear_cache(self) -> None:
+        """Forget the cached parse, so the next load reads the file.
+
+        Useful for testing or when the file may have been replaced without
+        its mtime or size changing.
+        """
+        self._parsed = None
 
     def backup(self) -> Path | None:
         """Create a timestamped backup of the config file.
@@ -130,6 +158,7 @@ class ConfigFileManager:
 
         Preserves existing mcp_servers, adds new ones.
         Does not overwrite existing mcp_server configurations.
+        The file is loaded and saved once however many mcp_servers are added.
 
         Args:
             new_mcp_servers: List of new mcp_servers to add.
@@ -308,7 +337,29 @@ class ConfigFileManager:
             configs: Dictionary mapping mcp_server names to their configurations.
             deps: Optional dependency status for runtime selection.
         """
-        content = self.generate_initial_config(mcp_servers, configs, deps)
+        self._write(self.generate_initial_config(mcp_servers, configs, deps))
+
+    def _write(self, content: str) -> None:
+        """Replace the config file with `content` atomically.
+
+        The text goes to a temporary file beside the config in one write and
+        is renamed over it, so a crash or a full disk leaves the old file
+        intact rather than a truncated one. An existing file keeps its mode,
+        and a symlinked config is replaced at its target, not unlinked.
+        """
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.config_path, "w") as f:
-            f.write(content)
+        self._parsed = None
+        target = Path(os.path.realpath(self.config_path))
+        tmp_path = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content.encode("utf-8"))
+                f.flush()
+                os.fsync(f.fileno())
+            if target.exists():
+                shutil.copymode(target, tmp_path)
+            os.replace(tmp_path, target)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
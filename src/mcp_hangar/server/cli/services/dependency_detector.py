@@ -5,7 +5,7 @@ mcp_servers based on what can actually be executed.
 """
 
 from dataclasses import dataclass
-from functools import lru_cache
+from functools import cached_property, lru_cache
 import shutil
 
 
@@ -19,26 +19,30 @@ class RuntimeInfo:
     version: str | None = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class DependencyStatus:
-    """Status of all detected dependencies."""
+    """Status of all detected dependencies.
+
+    Frozen, so the derived views below are computed once per detection;
+    init consults them for every mcp_server it lists or filters.
+    """
 
     npx: RuntimeInfo
     uvx: RuntimeInfo
     docker: RuntimeInfo
     podman: RuntimeInfo
 
-    @property
+    @cached_property
     def has_any(self) -> bool:
         """Check if any runtime is available."""
         return any([self.npx.available, self.uvx.available, self.docker.available, self.podman.available])
 
-    @property
+    @cached_property
     def has_container_runtime(self) -> bool:
         """Check if docker or podman is available."""
         return self.docker.available or self.podman.available
 
-    @property
+    @cached_property
     def available_runtimes(self) -> list[str]:
         """Get list of available runtime names."""
         result = []
@@ -52,7 +56,7 @@ class DependencyStatus:
             result.append("podman")
         return result
 
-    @property
+    @cached_property
     def missing_runtimes(self) -> list[str]:
         """Get list of missing runtime names."""
         result = []
@@ -64,6 +68,22 @@ class DependencyStatus:
             result.append("docker/podman")
         return result
 
+    @cached_property
+    def installable_types(self) -> frozenset[str]:
+        """Get the mcp_server install types these runtimes can run."""
+        types = {"binary"}  # Binary mcp_servers are self-contained
+        if self.npx.available:
+            types.add("npx")
+        if self.uvx.available:
+            types.add("uvx")
+        if self.has_container_runtime:
+            types.add("docker")
+        return frozenset(types)
+
+
+# Install types with a known runtime requirement; others default to available
+_KNOWN_INSTALL_TYPES = frozenset({"npx", "uvx", "docker", "binary"})
+
 
 def _detect_runtime(name: str) -> RuntimeInfo:
     """Detect if a runtime is available in PATH.
@@ -112,13 +132,9 @@ def is_mcp_server_available(install_type: str, deps: DependencyStatus | None = N
     if deps is None:
         deps = detect_dependencies()
 
-    availability_map = {
-        "npx": deps.npx.available,
-        "uvx": deps.uvx.available,
-        "docker": deps.has_container_runtime,
-        "binary": True,  # Binary mcp_servers are self-contained
-    }
-    return availability_map.get(install_type, True)  # Unknown types default to available
+    if install_type not in _KNOWN_INSTALL_TYPES:
+        return True  # Unknown types default to available
+    return install_type in deps.installable_types
 
 
 def get_install_instructions(missing: list[str]) -> dict[str, str]:
@@ -3,6 +3,7 @@
 Consolidates mcp_server metadata previously duplicated across init.py and add.py.
 """
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 from .dependency_detector import DependencyStatus, detect_dependencies, is_mcp_server_available
@@ -88,7 +89,7 @@ class McpServerDefinition:
 
 # All known mcp_servers with their configurations
 # uvx_package maps to PyPI packages that provide equivalent functionality
-_PROVIDERS: list[McpServerDefinition] = [
+_PROVIDERS: tuple[McpServerDefinition, ...] = (
     # Starter (recommended for everyone)
     McpServerDefinition(
         name="filesystem",
@@ -196,13 +197,14 @@ _PROVIDERS: list[McpServerDefinition] = [
         config_type="secret",
         env_var="GOOGLE_MAPS_API_KEY",
     ),
-]
-
-# McpServer bundles for quick setup
-PROVIDER_BUNDLES: dict[str, list[str]] = {
-    "starter": ["filesystem", "fetch", "memory"],
-    "developer": ["filesystem", "fetch", "memory", "github", "git"],
-    "data": ["filesystem", "fetch", "memory", "sqlite", "postgres"],
+)
+
+# McpServer bundles for quick setup. Tuples: the registry is shared,
+# module-level data, and every caller iterates it without changing it.
+PROVIDER_BUNDLES: dict[str, tuple[str, ...]] = {
+    "starter": ("filesystem", "fetch", "memory"),
+    "developer": ("filesystem", "fetch", "memory", "github", "git"),
+    "data": ("filesystem", "fetch", "memory", "sqlite", "postgres"),
 }
 
 # Build lookup dict for fast access
@@ -219,6 +221,11 @@ def get_mcp_server(name: str) -> McpServerDefinition | None:
     return _PROVIDERS_BY_NAME.get(name)
 
 
+def get_mcp_servers(names: Iterable[str]) -> list[McpServerDefinition]:
+    """Get the known mcp_servers among `names`, in order; unknown names are skipped."""
+    return [_PROVIDERS_BY_NAME[name] for name in names if name in _PROVIDERS_BY_NAME]
+
+
 def get_mcp_servers_by_category() -> dict[str, list[McpServerDefinition]]:
     """Get mcp_servers grouped by category."""
     result: dict[str, list[McpServerDefinition]] = {}
@@ -320,12 +327,11 @@ def filter_bundle_by_availability(
     if deps is None:
         deps = detect_dependencies()
 
-    bundle_mcp_servers = PROVIDER_BUNDLES[bundle_name]
     available = []
     unavailable = []
 
-    for name in bundle_mcp_servers:
-        mcp_server = get_mcp_server(name)
+    for name in PROVIDER_BUNDLES[bundle_name]:
+        mcp_server = _PROVIDERS_BY_NAME.get(name)
         if mcp_server and mcp_server.is_available(deps):
             available.append(name)
         else:
@@ -0,0 +1,44 @@
+"""Directory completion for CLI path prompts.
+
+prompt_toolkit's PathCompleter lists the directory and stats every entry on
+each keystroke. This completer scans a directory once per prompt with
+os.scandir, which reports entry types from the directory read itself.
+"""
+
+from collections.abc import Iterable
+import os
+
+from prompt_toolkit.completion import CompleteEvent, Completer, Completion
+from prompt_toolkit.document import Document
+
+
+class DirectoryCompleter(Completer):
+    """Completes directory names, listing each directory once per prompt."""
+
+    def __init__(self) -> None:
+        """Initialize with an empty listing cache."""
+        self._listings: dict[str, list[str]] = {}
+
+    def _subdirectories(self, directory: str) -> list[str]:
+        """Sorted names of the directories in `directory`, cached."""
+        names = self._listings.get(directory)
+        if names is None:
+            try:
+                with os.scandir(directory) as entries:
+                    names = sorted(entry.name for entry in entries if entry.is_dir())
+            except OSError:
+                names = []
+            self._listings[directory] = names
+        return names
+
+    def get_completions(self, document: Document, complete_event: CompleteEvent) -> Iterable[Completion]:
+        """Complete the last path component of the text before the cursor."""
+        directory, prefix = os.path.split(os.path.expanduser(document.text_before_cursor))
+        for name in self._subdirectories(directory or "."):
+            if name.startswith(prefix):
+                # Trailing separator, as questionary's own path completer adds
+                yield Completion(
+                    text=name[len(prefix) :] + os.path.sep,
+                    start_position=0,
+                    display=name + os.path.sep,
+                )
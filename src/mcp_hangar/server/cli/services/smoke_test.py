@@ -1,9 +1,11 @@
 """Smoke test for validating mcp_server configuration.
 
 Starts each mcp_server, waits for READY state, reports status, then stops.
+Up to MAX_PARALLEL_STARTS servers are tested at a time.
 Used by `mcp-hangar init` to verify configuration before user closes terminal.
 """
 
+from concurrent.futures import as_completed, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 import time
@@ -193,6 +195,11 @@ def _get_suggestion_for_error(error: str) -> str | None:
     return None
 
 
+def _describe_in_flight(pending: dict[str, None]) -> str:
+    """Progress text naming the servers currently being started."""
+    return f"Testing {', '.join(list(pending)[:MAX_PARALLEL_STARTS])}..."
+
+
 def run_smoke_test(
     config_path: Path,
     timeout_s: float = DEFAULT_TIMEOUT_SECONDS,
@@ -220,45 +227,70 @@ def run_smoke_test(
     if not mcp_servers_config:
         return SmokeTestResult(results=[], total_duration_ms=0)
 
-    results: list[McpServerTestResult] = []
-    per_mcp_server_timeout = min(timeout_s / len(mcp_servers_config), timeout_s / 2)
+    # Up to MAX_PARALLEL_STARTS servers start at once, so the budget is split
+    # across waves of starts rather than across servers.
+    waves = -(-len(mcp_servers_config) // MAX_PARALLEL_STARTS)
+    per_mcp_server_timeout = min(timeout_s / waves, timeout_s / 2)
+    results: dict[str, McpServerTestResult] = {}
 
     # Run tests with progress indicator
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TextColumn("[progress.percentage]{task.completed}/{task.total}"),
-        console=console,
-        transient=True,
-    ) as progress:
+    with (
+        Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("[progress.percentage]{task.completed}/{task.total}"),
+            console=console,
+            transient=True,
+        ) as progress,
+        ThreadPoolExecutor(max_workers=MAX_PARALLEL_STARTS, thread_name_prefix="smoke-test-") as executor,
+    ):
         task = progress.add_task("Testing mcp_servers...", total=len(mcp_servers_config))
 
-        # Test mcp_servers sequentially to avoid resource contention
-        for mcp_server_id, mcp_server_config in mcp_servers_config.items():
-            progress.update(task, description=f"Testing {mcp_server_id}...")
-
-            result = _test_single_mcp_server(
+        # Starts are independent subprocesses or containers; a bounded pool
+        # overlaps them without starting every configured server at once
+        futures = {
+            executor.submit(
+                _test_single_mcp_server,
                 mcp_server_id=mcp_server_id,
                 mcp_server_config=mcp_server_config,
                 timeout_s=per_mcp_server_timeout,
-            )
-            results.append(result)
+            ): mcp_server_id
+            for mcp_server_id, mcp_server_config in mcp_servers_config.items()
+        }
+        # The pool takes work in submission order, so the servers being tested
+        # are the first few still pending in configuration order
+        pending = dict.fromkeys(mcp_servers_config)
+        progress.update(task, description=_describe_in_flight(pending))
 
-            # Show result immediately
-            if result.success:
-                console.print(f"  [green]OK[/green] {mcp_server_id} ready ({result.duration_ms:.0f}ms)")
-            else:
-                console.print(f"  [red]FAIL[/red] {mcp_server_id}: {result.error}")
-                if result.suggestion:
-                    console.print(f"       [dim]Suggestion: {result.suggestion}[/dim]")
-
-            progress.advance(task)
+        try:
+            for future in as_completed(futures):
+                mcp_server_id = futures[future]
+                result = results[mcp_server_id] = future.result()
+                del pending[mcp_server_id]
+
+                # Show result as soon as it is known
+                if result.success:
+                    console.print(f"  [green]OK[/green] {mcp_server_id} ready ({result.duration_ms:.0f}ms)")
+                else:
+                    console.print(f"  [red]FAIL[/red] {mcp_server_id}: {result.error}")
+                    if result.suggestion:
+                        console.print(f"       [dim]Suggestion: {result.suggestion}[/dim]")
+
+                progress.advance(task)
+                if pending:
+                    progress.update(task, description=_describe_in_flight(pending))
+        except BaseException:
+            # Ctrl-C: drop the servers not started yet instead of letting the
+            # executor's exit start and wait on each of them
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
 
     total_duration_ms = (time.perf_counter() - start_time) * 1000
 
     return SmokeTestResult(
-        results=results,
+        # In configuration order, whatever order they finished in
+        results=[results[mcp_server_id] for mcp_server_id in mcp_servers_config],
         total_duration_ms=total_duration_ms,
     )
 
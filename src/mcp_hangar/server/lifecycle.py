@@ -21,6 +21,7 @@ from typing import Any
 
 import yaml
 
+from ..infrastructure.event_bus import get_event_bus
 from ..logging_config import get_logger, setup_logging
 from .api.middleware import create_auth_enforced_app
 from .bootstrap import ApplicationContext, bootstrap
@@ -31,6 +32,9 @@ from .state import get_discovery_orchestrator, get_runtime_mcp_servers
 
 logger = get_logger(__name__)
 
+# How long shutdown waits for deferred events to reach the store.
+_EVENT_FLUSH_TIMEOUT_S = 5.0
+
 
 def build_readiness_report(repository: Any) -> tuple[dict[str, Any], int]:
     """Return the ``/health/ready`` body and HTTP status.
@@ -456,6 +460,13 @@ class ServerLifecycle:
         if tailer is not None:
             tailer.stop()
 
+        # Before the stores close: events from `publish_nowait` (the reload
+        # notifications) sit in the bus outbox until its daemon thread gets to
+        # them, and a daemon thread is simply dropped at exit. Bounded, so a
+        # wedged handler cannot hold shutdown hostage.
+        if not get_event_bus().flush(timeout=_EVENT_FLUSH_TIMEOUT_S):
+            logger.warning("event_bus_flush_timed_out", timeout_s=_EVENT_FLUSH_TIMEOUT_S)
+
         # Before the lease is given up: `context.shutdown` saves the shared
         # circuit-breaker row, and that write is for the lease holder only. A
         # release first would mean nobody wrote it -- the leader would have
@@ -570,7 +581,7 @@ def _setup_signal_handlers(lifecycle: ServerLifecycle) -> None:
 
             # Access command bus from lifecycle context
             result = lifecycle._context.runtime.command_bus.send(command)
-            logger.info("config_reload_completed_via_signal", result=result)
+            logger.info("config_reload_completed_via_signal", result=result.to_dict())
 
         except Exception as e:  # noqa: BLE001 -- fault-barrier: signal handler must not crash process
             logger.error(
@@ -731,11 +731,11 @@ def hangar_reload_config(graceful: bool = True) -> dict:
         return {
             "status": "success",
             "message": "Configuration reloaded successfully",
-            "mcp_servers_added": result.get("mcp_servers_added", []),
-            "mcp_servers_removed": result.get("mcp_servers_removed", []),
-            "mcp_servers_updated": result.get("mcp_servers_updated", []),
-            "mcp_servers_unchanged": result.get("mcp_servers_unchanged", []),
-            "duration_ms": result.get("duration_ms", 0),
+            "mcp_servers_added": result.mcp_servers_added,
+            "mcp_servers_removed": result.mcp_servers_removed,
+            "mcp_servers_updated": result.mcp_servers_updated,
+            "mcp_servers_unchanged": result.mcp_servers_unchanged,
+            "duration_ms": result.duration_ms,
         }
 
     except Exception as e:  # noqa: BLE001 -- fault-barrier: reload failure must return error result, not crash MCP tool
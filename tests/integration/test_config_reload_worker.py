@@ -77,6 +77,75 @@ class TestConfigReloadWorkerIntegration:
         worker.stop()
         assert not worker.running
 
+    def test_stop_wakes_the_polling_thread(self, temp_config_file, mock_command_bus):
+        """Stopping should not wait out the polling interval."""
+        worker = ConfigReloadWorker(
+            config_path=temp_config_file,
+            command_bus=mock_command_bus,
+            interval_s=60,
+            use_watchdog=False,
+        )
+
+        worker.start()
+        worker.stop()
+        worker.thread.join(timeout=2)
+
+        assert not worker.thread.is_alive()
+
+    def test_watchdog_event_matches_only_the_config_file(self, temp_config_file, mock_command_bus):
+        """Only events for the config file itself should count."""
+        worker = ConfigReloadWorker(config_path=temp_config_file, command_bus=mock_command_bus)
+
+        assert worker._is_config_file(temp_config_file)
+        assert not worker._is_config_file(os.path.join(os.path.dirname(temp_config_file), "other.yaml"))
+
+    def test_watchdog_event_matches_symlink_target(self, temp_config_file, mock_command_bus, tmp_path):
+        """A config given as a symlink should match events on its target."""
+        link = tmp_path / "config.yaml"
+        link.symlink_to(temp_config_file)
+
+        worker = ConfigReloadWorker(config_path=str(link), command_bus=mock_command_bus)
+
+        assert worker._is_config_file(os.path.realpath(temp_config_file))
+        assert worker._is_config_file(str(link))
+
+    def test_watchdog_event_follows_a_retargeted_symlink(self, mock_command_bus, tmp_path):
+        """A config symlink swapped to a new target should match events on that target."""
+        old_target = tmp_path / "config-v1.yaml"
+        new_target = tmp_path / "config-v2.yaml"
+        old_target.write_text("mcp_servers: {}\n")
+        new_target.write_text("mcp_servers: {}\n")
+        link = tmp_path / "config.yaml"
+        link.symlink_to(old_target)
+        worker = ConfigReloadWorker(config_path=str(link), command_bus=mock_command_bus)
+
+        link.unlink()
+        link.symlink_to(new_target)
+
+        assert worker._is_config_file(str(new_target))
+        assert not worker._is_config_file(str(old_target))
+
+    def test_polling_detects_a_one_nanosecond_mtime_change(self, temp_config_file, mock_command_bus):
+        """Polling compares integer nanoseconds, so no change is rounded away."""
+        mtime_ns = 1_700_000_000_123_456_789
+        os.utime(temp_config_file, ns=(mtime_ns, mtime_ns))
+        worker = ConfigReloadWorker(
+            config_path=temp_config_file,
+            command_bus=mock_command_bus,
+            use_watchdog=False,
+        )
+        os.utime(temp_config_file, ns=(mtime_ns + 1, mtime_ns + 1))
+        if os.stat(temp_config_file).st_mtime_ns != mtime_ns + 1:
+            pytest.skip("filesystem does not keep nanosecond mtimes")
+
+        # Run exactly one poll
+        worker.running = True
+        worker._stop_event = Mock()
+        worker._stop_event.wait.side_effect = [False, True]
+        worker._polling_loop()
+
+        mock_command_bus.send.assert_called_once()
+
     def test_polling_detects_file_modification(self, temp_config_file, mock_command_bus):
         """Polling worker should detect file modification via mtime."""
         # Wait before creating worker to ensure mtime difference
@@ -189,6 +258,30 @@ class TestConfigReloadWorkerIntegration:
         finally:
             worker.stop()
 
+    def test_polling_survives_config_file_disappearing(self, temp_config_file, mock_command_bus):
+        """Polling worker should keep running while the config file is missing."""
+        worker = ConfigReloadWorker(
+            config_path=temp_config_file,
+            command_bus=mock_command_bus,
+            interval_s=1,
+            use_watchdog=False,
+        )
+
+        worker.start()
+
+        try:
+            os.unlink(temp_config_file)
+
+            # Wait for at least one poll to find the file gone
+            time.sleep(1.5)
+
+            assert worker.running
+            assert worker.thread.is_alive()
+            mock_command_bus.send.assert_not_called()
+
+        finally:
+            worker.stop()
+
     def test_multiple_rapid_changes_debounced_in_watchdog(self, temp_config_file, mock_command_bus):
         """Watchdog should debounce multiple rapid file changes."""
         worker = ConfigReloadWorker(
@@ -105,6 +105,24 @@ class TestDependencyStatus:
         assert "docker/podman" in status.missing_runtimes
         assert "npx" not in status.missing_runtimes
 
+    def test_derived_views_are_computed_once(self):
+        """Should keep derived views, since detection results cannot change."""
+        import dataclasses
+
+        import pytest
+
+        status = DependencyStatus(
+            npx=RuntimeInfo("npx", None, False),
+            uvx=RuntimeInfo("uvx", "/usr/bin/uvx", True),
+            docker=RuntimeInfo("docker", None, False),
+            podman=RuntimeInfo("podman", "/usr/bin/podman", True),
+        )
+
+        assert status.available_runtimes is status.available_runtimes
+        assert status.installable_types == {"uvx", "docker", "binary"}
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            status.npx = RuntimeInfo("npx", "/usr/bin/npx", True)  # type: ignore[misc]
+
 
 class TestDetectDependencies:
     """Tests for detect_dependencies function."""
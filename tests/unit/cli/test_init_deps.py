@@ -84,6 +84,38 @@ class TestInitDependencyDetection:
         assert "Step 0" in plain(result.output)
         assert "Detecting available runtimes" in plain(result.output)
 
+    def test_init_reports_claude_desktop_probed_during_step_0(self, runner, tmp_path):
+        """Step 1 reports the Claude Desktop config read while runtimes were detected."""
+        import json
+
+        from mcp_hangar.server.cli.main import app
+
+        claude_config = tmp_path / "claude_desktop_config.json"
+        claude_config.write_text(json.dumps({"mcpServers": {"a": {}, "b": {}}}))
+
+        def mock_which(name):
+            return f"/usr/bin/{name}" if name in ("docker", "podman", "npx") else None
+
+        with patch("shutil.which", mock_which):
+            clear_cache()
+
+            result = runner.invoke(
+                app,
+                [
+                    "init",
+                    "-y",
+                    "--skip-claude",
+                    "--skip-test",
+                    "--config-path",
+                    str(tmp_path / "config.yaml"),
+                    "--claude-config",
+                    str(claude_config),
+                ],
+                catch_exceptions=False,
+            )
+
+        assert "Existing MCP servers: 2" in plain(result.output)
+
     def test_init_exits_when_no_runtimes(self, runner, tmp_path):
         """Should exit with error when no runtimes available."""
         from mcp_hangar.server.cli.main import app
@@ -159,3 +191,130 @@ class TestInitDependencyDetection:
 
             # Both are npx-based, should show skip message
             assert "requires npx" in plain(result.output) or "Skipping" in plain(result.output)
+
+    def test_missing_runtime_instructions_are_written_at_once(self, monkeypatch):
+        """The no-runtime instructions reach the terminal in a single write."""
+        import io
+
+        from rich.console import Console
+        import typer
+
+        from mcp_hangar.server.cli.commands import init
+        from mcp_hangar.server.cli.services.dependency_detector import detect_dependencies
+
+        writes = []
+
+        class RecordingIO(io.StringIO):
+            def write(self, s):
+                writes.append(s)
+                return super().write(s)
+
+        monkeypatch.setattr(init, "console", Console(file=RecordingIO(), width=120))
+
+        with patch("shutil.which", return_value=None):
+            clear_cache()
+            deps = detect_dependencies()
+
+        with pytest.raises(typer.Exit):
+            init._check_dependencies_or_exit(deps, non_interactive=True)
+
+        assert len(writes) == 1
+        assert "No supported runtimes found" in writes[0]
+
+    def test_completion_summary_is_written_at_once(self, monkeypatch, tmp_path):
+        """The completion panel and next steps reach the terminal in a single write."""
+        import io
+
+        from rich.console import Console
+
+        from mcp_hangar.server.cli.commands import init
+
+        writes = []
+
+        class RecordingIO(io.StringIO):
+            def write(self, s):
+                writes.append(s)
+                return super().write(s)
+
+        monkeypatch.setattr(init, "console", Console(file=RecordingIO(), width=120))
+
+        init._show_completion_summary(["filesystem", "fetch"], tmp_path / "config.yaml", None, None)
+
+        assert len(writes) == 1
+        assert "Setup Complete" in writes[0]
+        assert "fetch" in writes[0]
+        assert "Need help?" in writes[0]
+
+    def test_selection_is_a_single_prompt_across_categories(self, monkeypatch):
+        """Every available category is offered in one checkbox, each behind a separator."""
+        import io
+        import sys
+        from unittest.mock import MagicMock
+
+        import questionary
+        from rich.console import Console
+
+        from mcp_hangar.server.cli.commands import init
+        from mcp_hangar.server.cli.services.dependency_detector import detect_dependencies
+
+        mock_q = MagicMock()
+        mock_q.Choice = questionary.Choice
+        mock_q.Separator = questionary.Separator
+        mock_q.checkbox.return_value.ask.return_value = ["filesystem", "sqlite"]
+        monkeypatch.setattr(init, "console", Console(file=io.StringIO()))
+
+        with patch("shutil.which", lambda name: f"/usr/bin/{name}"), patch.dict(sys.modules, {"questionary": mock_q}):
+            clear_cache()
+            selected = init._prompt_mcp_server_selection(detect_dependencies())
+
+        assert selected == ["filesystem", "sqlite"]
+        mock_q.checkbox.assert_called_once()
+        choices = mock_q.checkbox.call_args.kwargs["choices"]
+        separators = [c for c in choices if isinstance(c, questionary.Separator)]
+        assert len(separators) > 1
+        assert isinstance(choices[0], questionary.Separator)
+        assert mock_q.checkbox.call_args.args == ("Select MCP servers:",)
+
+    def test_selection_skips_empty_categories(self, monkeypatch):
+        """A category with no available servers gets no separator."""
+        import io
+        import sys
+        from unittest.mock import MagicMock
+
+        import questionary
+        from rich.console import Console
+
+        from mcp_hangar.server.cli.commands import init
+        from mcp_hangar.server.cli.services import get_mcp_server
+        from mcp_hangar.server.cli.services.dependency_detector import detect_dependencies
+
+        mock_q = MagicMock()
+        mock_q.Choice = questionary.Choice
+        mock_q.Separator = questionary.Separator
+        mock_q.checkbox.return_value.ask.return_value = []
+        monkeypatch.setattr(init, "console", Console(file=io.StringIO()))
+        categories = ({"Starter": [get_mcp_server("filesystem")], "Empty": []}, {})
+
+        with (
+            patch("mcp_hangar.server.cli.services.get_mcp_servers_by_category_filtered", lambda deps: categories),
+            patch.dict(sys.modules, {"questionary": mock_q}),
+        ):
+            init._prompt_mcp_server_selection(detect_dependencies())
+
+        choices = mock_q.checkbox.call_args.kwargs["choices"]
+        assert [c.title for c in choices if isinstance(c, questionary.Separator)] == [
+            "-- Starter (recommended for everyone) --"
+        ]
+
+    def test_piped_output_skips_highlighting(self):
+        """Without a colour terminal the init console does not run the highlighter."""
+        import os
+        import subprocess
+        import sys
+
+        code = "from mcp_hangar.server.cli.commands.init import console; print(type(console.highlighter).__name__)"
+        env = {k: v for k, v in os.environ.items() if k not in ("FORCE_COLOR", "TTY_COMPATIBLE")}
+
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env).stdout
+
+        assert out.strip() == "NullHighlighter"
@@ -1,6 +1,7 @@
 """Tests for init command existing config handling."""
 
 from pathlib import Path
+import sys
 import tempfile
 from unittest.mock import MagicMock, patch
 
@@ -188,11 +189,11 @@ class TestInitExistingConfig:
             with open(config_path, "w") as f:
                 yaml.dump(existing, f)
 
-            # Mock questionary to return abort
-            with patch("mcp_hangar.server.cli.commands.init.questionary") as mock_q:
-                mock_q.select.return_value.ask.return_value = "abort"
-                mock_q.checkbox.return_value.ask.return_value = ["filesystem"]
-
+            # Mock questionary to return abort; init imports it when prompting
+            mock_q = MagicMock()
+            mock_q.select.return_value.ask.return_value = "abort"
+            mock_q.checkbox.return_value.ask.return_value = ["filesystem"]
+            with patch.dict(sys.modules, {"questionary": mock_q}):
                 runner.invoke(
                     app,
                     [
@@ -246,3 +247,30 @@ class TestInitExistingConfig:
             with open(config_path) as f:
                 new_config = yaml.safe_load(f)
             assert "old" not in new_config.get("mcp_servers", {})
+
+
+class TestExistingConfigSummary:
+    """Tests for the summary shown before the existing-config prompt."""
+
+    def test_overlap_is_listed_in_selection_order(self, monkeypatch, tmp_path):
+        """Should list overlapping mcp_servers in the order they were selected."""
+        import io
+
+        from rich.console import Console
+
+        from mcp_hangar.server.cli.commands import init
+
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(yaml.dump({"mcp_servers": {n: {} for n in ("sqlite", "fetch", "git", "memory")}}))
+        out = io.StringIO()
+        monkeypatch.setattr(init, "console", Console(file=out, width=200))
+        mock_q = MagicMock()
+        mock_q.select.return_value.ask.return_value = init.ExistingConfigAction.MERGE
+
+        with patch.dict(sys.modules, {"questionary": mock_q}):
+            action = init._prompt_existing_config_action(
+                ConfigFileManager(config_path), ["memory", "github", "git", "fetch"]
+            )
+
+        assert action == init.ExistingConfigAction.MERGE
+        assert "Overlapping (will be skipped in merge): memory, git, fetch" in out.getvalue()
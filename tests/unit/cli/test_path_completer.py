@@ -0,0 +1,42 @@
+"""Tests for the directory completer used by path prompts."""
+
+import os
+from unittest.mock import patch
+
+from prompt_toolkit.completion import CompleteEvent
+from prompt_toolkit.document import Document
+
+from mcp_hangar.server.cli.services.path_completer import DirectoryCompleter
+
+
+def _complete(completer: DirectoryCompleter, text: str) -> list[str]:
+    return [c.text for c in completer.get_completions(Document(text), CompleteEvent())]
+
+
+class TestDirectoryCompleter:
+    """Tests for DirectoryCompleter."""
+
+    def test_completes_only_directories_with_a_trailing_separator(self, tmp_path):
+        """Should offer matching directories and skip files."""
+        (tmp_path / "projects").mkdir()
+        (tmp_path / "photos").mkdir()
+        (tmp_path / "profile.txt").write_text("")
+
+        completions = _complete(DirectoryCompleter(), f"{tmp_path}{os.sep}p")
+
+        assert completions == [f"hotos{os.sep}", f"rojects{os.sep}"]
+
+    def test_each_directory_is_scanned_once_per_prompt(self, tmp_path):
+        """Should reuse the listing as the user keeps typing in one directory."""
+        (tmp_path / "alpha").mkdir()
+        completer = DirectoryCompleter()
+
+        with patch("os.scandir", wraps=os.scandir) as scandir:
+            for typed in ("", "a", "al", "alp"):
+                assert _complete(completer, f"{tmp_path}{os.sep}{typed}") == ["alpha"[len(typed) :] + os.sep]
+
+        assert scandir.call_count == 1
+
+    def test_unreadable_directory_completes_nothing(self, tmp_path):
+        """Should swallow listing errors rather than break the prompt."""
+        assert _complete(DirectoryCompleter(), f"{tmp_path}{os.sep}missing{os.sep}x") == []
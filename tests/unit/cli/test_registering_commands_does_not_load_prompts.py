@@ -0,0 +1,19 @@
+"""Loading the CLI to register its commands does not import the prompt stack.
+
+questionary pulls in prompt_toolkit, most of the cost of importing the
+command modules; only `init`, `add` and `remove` prompt, and only when run.
+"""
+
+import subprocess
+import sys
+
+
+def test_cli_import_leaves_questionary_and_services_unloaded():
+    code = (
+        "import sys, mcp_hangar.server.cli.main; "
+        "print(sorted(m for m in ('questionary', 'mcp_hangar.server.cli.services.smoke_test') if m in sys.modules))"
+    )
+
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+    assert out.strip() == "[]"
@@ -4,6 +4,7 @@ from pathlib import Path
 import tempfile
 from unittest.mock import MagicMock, patch
 
+from rich.console import Console
 import yaml
 
 from mcp_hangar.server.cli.services.smoke_test import (
@@ -188,3 +189,53 @@ class TestRunSmokeTest:
             assert len(result.results) == 0
         finally:
             config_path.unlink()
+
+    def test_servers_start_in_parallel_and_report_in_config_order(self, tmp_path):
+        """Should overlap starts and still return results in configuration order."""
+        import threading
+
+        names = ["c", "a", "b"]
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(
+            yaml.dump(
+                {"mcp_servers": {n: {"mode": "subprocess", "command": ["echo", n]} for n in names}}, sort_keys=False
+            )
+        )
+        all_started = threading.Barrier(len(names), timeout=5)
+
+        def fake_test(mcp_server_id, mcp_server_config, timeout_s):
+            all_started.wait()  # raises BrokenBarrierError unless all three run at once
+            return ProviderTestResult(mcp_server_id=mcp_server_id, success=True, state="ready", duration_ms=1.0)
+
+        with patch("mcp_hangar.server.cli.services.smoke_test._test_single_mcp_server", fake_test):
+            result = run_smoke_test(config_path, timeout_s=5.0, console=Console(quiet=True))
+
+        assert [r.mcp_server_id for r in result.results] == names
+        assert result.all_passed is True
+
+    def test_interrupt_cancels_servers_not_yet_started(self, tmp_path):
+        """Should not start the queued servers once the run is interrupted."""
+        import time
+
+        import pytest
+
+        names = [f"s{n}" for n in range(6)]
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(
+            yaml.dump({"mcp_servers": {n: {"mode": "subprocess", "command": ["echo", n]} for n in names}})
+        )
+        called = []
+
+        def fake_test(mcp_server_id, mcp_server_config, timeout_s):
+            called.append(mcp_server_id)
+            if mcp_server_id == "s0":
+                raise KeyboardInterrupt
+            time.sleep(0.3)
+            return ProviderTestResult(mcp_server_id=mcp_server_id, success=True, state="ready", duration_ms=1.0)
+
+        with patch("mcp_hangar.server.cli.services.smoke_test._test_single_mcp_server", fake_test):
+            with pytest.raises(KeyboardInterrupt):
+                run_smoke_test(config_path, timeout_s=5.0, console=Console(quiet=True))
+
+        # s0's worker may pick up s3 before the interrupt lands; nothing later
+        assert not {"s4", "s5"} & set(called)
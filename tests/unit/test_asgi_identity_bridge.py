@@ -327,3 +327,40 @@ class TestAuthCombinedAppIdentityBridge:
         assert caller.principal_type == "service"
         assert caller.user_id == "svc-deploy"
         assert caller.tenant_id == "tenant-svc"
+
+
+class TestScopeHeaders:
+    """The header view handed to authenticators decodes on lookup."""
+
+    def _headers(self):
+        from mcp_hangar.fastmcp_server.asgi import _ScopeHeaders
+
+        return _ScopeHeaders(
+            [
+                (b"authorization", b"Bearer abc"),
+                (b"X-API-Key", b"k1"),
+                (b"x-forwarded-for", b"10.0.0.1"),
+                (b"x-forwarded-for", b"10.0.0.2"),
+            ]
+        )
+
+    def test_lookup_is_case_insensitive(self):
+        headers = self._headers()
+        assert headers["Authorization"] == "Bearer abc"
+        assert headers.get("x-api-key") == "k1"
+        assert "X-Api-Key" in headers
+
+    def test_missing_and_unencodable_names_are_absent(self):
+        headers = self._headers()
+        assert headers.get("cookie") is None
+        assert "x-☃" not in headers
+
+    def test_a_repeated_header_keeps_its_last_value(self):
+        assert self._headers()["x-forwarded-for"] == "10.0.0.2"
+
+    def test_it_iterates_as_lowercased_str_names(self):
+        assert dict(self._headers()) == {
+            "authorization": "Bearer abc",
+            "x-api-key": "k1",
+            "x-forwarded-for": "10.0.0.2",
+        }
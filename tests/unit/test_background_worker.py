@@ -18,6 +18,12 @@ def _make_provider(state: ProviderState, health_tracker: HealthTracker | None =
     return provider
 
 
+def _stop_after_one_run(worker: BackgroundWorker) -> None:
+    """Let `worker._loop` run once without waiting, then break out of it."""
+    worker._stop_event = MagicMock()
+    worker._stop_event.wait.side_effect = [False, StopIteration]
+
+
 class TestBackgroundWorkerHealthCheckScheduling:
     """Tests for state-aware health check scheduling in BackgroundWorker."""
 
@@ -137,8 +143,7 @@ class TestBackgroundWorkerHealthCheckScheduling:
         # (not affected by state-aware health check scheduling)
 
     @patch("mcp_hangar.gc.observe_health_check")
-    @patch("mcp_hangar.gc.time.sleep", side_effect=[None, StopIteration])
-    def test_loop_skips_cold_in_health_check_mode(self, mock_sleep, mock_observe):
+    def test_loop_skips_cold_in_health_check_mode(self, mock_observe):
         """Integration: _loop skips COLD providers for health_check task."""
         cold_provider = _make_provider(ProviderState.COLD)
         ready_provider = _make_provider(ProviderState.READY)
@@ -149,6 +154,7 @@ class TestBackgroundWorkerHealthCheckScheduling:
 
         worker = BackgroundWorker(providers, interval_s=1, task="health_check")
         worker.running = True
+        _stop_after_one_run(worker)
 
         try:
             worker._loop()
@@ -159,14 +165,14 @@ class TestBackgroundWorkerHealthCheckScheduling:
         ready_provider.health_check.assert_called_once()
 
     @patch("mcp_hangar.gc.observe_health_check")
-    @patch("mcp_hangar.gc.time.sleep", side_effect=[None, StopIteration])
-    def test_loop_skips_initializing_in_health_check_mode(self, mock_sleep, mock_observe):
+    def test_loop_skips_initializing_in_health_check_mode(self, mock_observe):
         """Integration: _loop skips INITIALIZING providers for health_check task."""
         init_provider = _make_provider(ProviderState.INITIALIZING)
         providers = {"init-one": init_provider}
 
         worker = BackgroundWorker(providers, interval_s=1, task="health_check")
         worker.running = True
+        _stop_after_one_run(worker)
 
         try:
             worker._loop()
@@ -176,14 +182,14 @@ class TestBackgroundWorkerHealthCheckScheduling:
         init_provider.health_check.assert_not_called()
 
     @patch("mcp_hangar.gc.observe_health_check")
-    @patch("mcp_hangar.gc.time.sleep", side_effect=[None, StopIteration])
-    def test_loop_sets_next_check_at_after_health_check(self, mock_sleep, mock_observe):
+    def test_loop_sets_next_check_at_after_health_check(self, mock_observe):
         """Integration: _loop sets _next_check_at after checking a READY provider."""
         provider = _make_provider(ProviderState.READY)
         providers = {"ready-one": provider}
 
         worker = BackgroundWorker(providers, interval_s=10, task="health_check")
         worker.running = True
+        _stop_after_one_run(worker)
 
         try:
             worker._loop()
@@ -194,14 +200,14 @@ class TestBackgroundWorkerHealthCheckScheduling:
         assert worker._next_check_at["ready-one"] > time.time()
 
     @patch("mcp_hangar.gc.observe_health_check")
-    @patch("mcp_hangar.gc.time.sleep", side_effect=[None, StopIteration])
-    def test_loop_respects_next_check_at_timing(self, mock_sleep, mock_observe):
+    def test_loop_respects_next_check_at_timing(self, mock_observe):
         """Integration: _loop skips providers whose next_check_at is in the future."""
         provider = _make_provider(ProviderState.READY)
         providers = {"future-one": provider}
 
         worker = BackgroundWorker(providers, interval_s=10, task="health_check")
         worker.running = True
+        _stop_after_one_run(worker)
         # Set next_check_at far in the future
         worker._next_check_at["future-one"] = time.time() + 3600
 
@@ -211,3 +217,73 @@ class TestBackgroundWorkerHealthCheckScheduling:
             pass
 
         provider.health_check.assert_not_called()
+
+
+class TestBackgroundWorkerGc:
+    """The gc task shuts idle mcp_servers down and records the cycle."""
+
+    @patch("mcp_hangar.gc.record_gc_cycle")
+    @patch("mcp_hangar.gc.record_mcp_server_stop")
+    def test_loop_counts_idle_shutdowns(self, mock_stop, mock_cycle):
+        idle = _make_provider(ProviderState.READY)
+        idle.maybe_shutdown_idle.return_value = True
+        busy = _make_provider(ProviderState.READY)
+        busy.maybe_shutdown_idle.return_value = False
+
+        worker = BackgroundWorker({"idle": idle, "busy": busy}, interval_s=1, task="gc")
+        worker.running = True
+        _stop_after_one_run(worker)
+
+        try:
+            worker._loop()
+        except StopIteration:
+            pass
+
+        mock_stop.assert_called_once_with("idle", "idle")
+        assert mock_cycle.call_args.args[1] == {"idle": 1, "dead": 0}
+        idle.health_check.assert_not_called()
+        busy.collect_events.assert_called_once()
+
+    def test_record_gc_cycle_adds_each_count_once(self):
+        from mcp_hangar import metrics
+
+        counter = metrics.GC_PROVIDERS_COLLECTED_TOTAL
+        with patch.object(counter, "inc", wraps=counter.inc) as inc:
+            metrics.record_gc_cycle(0.01, {"idle": 3, "dead": 0})
+
+        inc.assert_called_once_with(3, reason="idle")
+
+
+class TestBackgroundWorkerStop:
+    """stop() does not wait out the interval."""
+
+    def test_stop_wakes_the_worker(self):
+        worker = BackgroundWorker({}, interval_s=60, task="gc")
+        worker.start()
+
+        worker.stop()
+        worker.thread.join(timeout=2)
+
+        assert not worker.thread.is_alive()
+
+
+class TestBackgroundWorkerSnapshot:
+    """_loop iterates a snapshot, not the live mapping."""
+
+    def test_dict_mutated_during_a_run(self):
+        first = _make_provider(ProviderState.READY)
+        second = _make_provider(ProviderState.READY)
+        providers = {"first": first, "second": second}
+        first.maybe_shutdown_idle.side_effect = lambda: providers.pop("second") and False
+        second.maybe_shutdown_idle.return_value = False
+
+        worker = BackgroundWorker(providers, interval_s=1, task="gc")
+        worker.running = True
+        _stop_after_one_run(worker)
+
+        try:
+            worker._loop()
+        except StopIteration:
+            pass
+
+        second.maybe_shutdown_idle.assert_called_once()
@@ -148,6 +148,66 @@ class TestConfigFileManager:
             assert ".backup." in backup_path.name
             assert backup_path.read_text() == "test content"
 
+    def test_load_reuses_the_parse_until_the_file_changes(self):
+        """Repeated loads should parse once, and see edits made by anyone."""
+        from unittest.mock import patch
+
+        import yaml
+
+        with TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "config.yaml"
+            path.write_text("mcp_servers:\n  a: {}\n")
+            manager = ConfigFileManager(path)
+
+            with patch("yaml.load", wraps=yaml.load) as parse:
+                manager.load()["mcp_servers"]["scribbled"] = {}
+                assert manager.list_mcp_servers() == ["a"]
+                assert parse.call_count == 1
+
+                manager.add_mcp_server(get_provider("fetch"))
+                assert manager.list_mcp_servers() == ["a", "fetch"]
+                assert parse.call_count == 1  # the save primed the cache
+
+                manager.clear_cache()
+                assert manager.list_mcp_servers() == ["a", "fetch"]
+                assert parse.call_count == 2
+
+                path.write_text("mcp_servers:\n  b: {}\n  c: {}\n")
+                assert manager.list_mcp_servers() == ["b", "c"]
+
+    def test_failed_write_leaves_the_old_config_intact(self):
+        """A write that fails part way should not truncate the existing file."""
+        from unittest.mock import patch
+
+        import pytest
+
+        with TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "config.yaml"
+            path.write_text("mcp_servers:\n  kept: {}\n")
+            manager = ConfigFileManager(path)
+
+            with patch("os.fsync", side_effect=OSError("disk full")), pytest.raises(OSError):
+                manager.save({"mcp_servers": {"new": {}}})
+
+            assert manager.list_mcp_servers() == ["kept"]
+            assert [p.name for p in Path(tmpdir).iterdir()] == ["config.yaml"]
+
+    def test_write_keeps_mode_and_symlink(self):
+        """Replacing the config should keep its permissions and write through a symlink."""
+        with TemporaryDirectory() as tmpdir:
+            real = Path(tmpdir) / "dotfiles" / "config.yaml"
+            real.parent.mkdir()
+            real.write_text("mcp_servers: {}\n")
+            real.chmod(0o600)
+            link = Path(tmpdir) / "config.yaml"
+            link.symlink_to(real)
+
+            ConfigFileManager(link).write_initial_config([get_provider("fetch")], {})
+
+            assert link.is_symlink()
+            assert "fetch:" in real.read_text()
+            assert real.stat().st_mode & 0o777 == 0o600
+
     def test_backup_returns_none_for_missing_file(self):
         """Backup should return None if file doesn't exist."""
         manager = ConfigFileManager(Path("/nonexistent/file.yaml"))
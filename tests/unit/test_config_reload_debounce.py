@@ -0,0 +1,59 @@
+"""A burst of config file events reloads once, from one debounce thread."""
+
+import threading
+import time
+
+from mcp_hangar.gc import _Debouncer
+
+
+def _counting_debouncer(delay: float) -> tuple[_Debouncer, list[float], threading.Event]:
+    calls: list[float] = []
+    fired = threading.Event()
+
+    def callback():
+        calls.append(time.monotonic())
+        fired.set()
+
+    return _Debouncer(delay, callback), calls, fired
+
+
+def test_burst_fires_once_after_the_last_touch():
+    debouncer, calls, fired = _counting_debouncer(0.1)
+
+    debouncer.touch()
+    thread = debouncer._thread
+    for _ in range(9):
+        time.sleep(0.01)
+        debouncer.touch()
+    last_touch = time.monotonic()
+
+    assert debouncer._thread is thread
+    assert fired.wait(2)
+    time.sleep(0.2)
+    debouncer.close()
+
+    assert len(calls) == 1
+    assert calls[0] >= last_touch + 0.1 - 0.01
+
+
+def test_touch_after_firing_fires_again():
+    debouncer, calls, fired = _counting_debouncer(0.05)
+
+    debouncer.touch()
+    assert fired.wait(2)
+    fired.clear()
+    debouncer.touch()
+    assert fired.wait(2)
+    debouncer.close()
+
+    assert len(calls) == 2
+
+
+def test_close_drops_a_pending_call():
+    debouncer, calls, _ = _counting_debouncer(0.1)
+
+    debouncer.touch()
+    debouncer.close()
+    time.sleep(0.2)
+
+    assert calls == []
@@ -0,0 +1,82 @@
+"""Config watchers share one watchdog Observer for the life of the process.
+
+Each Observer is an inotify instance plus a thread. Two reload workers used to
+start two; they now register on one, which starts with the first watch and
+stops with the last. Watchdog hands back the same watch for a directory that is
+already watched, so removing one worker must leave the other's handler on it.
+"""
+
+import pytest
+
+from mcp_hangar import gc
+
+
+class _FakeObserver:
+    instances: list["_FakeObserver"] = []
+
+    def __init__(self):
+        self.handlers: dict[str, list] = {}
+        self.started = False
+        self.stopped = False
+        _FakeObserver.instances.append(self)
+
+    def schedule(self, handler, path, recursive=False):
+        self.handlers.setdefault(path, []).append(handler)
+        return path
+
+    def remove_handler_for_watch(self, handler, watch):
+        self.handlers[watch].remove(handler)
+
+    def unschedule(self, watch):
+        del self.handlers[watch]
+
+    def start(self):
+        self.started = True
+
+    def stop(self):
+        self.stopped = True
+
+    def join(self, timeout=None):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def fake_observer(monkeypatch):
+    _FakeObserver.instances = []
+    monkeypatch.setattr(gc, "Observer", _FakeObserver, raising=False)
+    monkeypatch.setattr(gc, "_observer", None)
+    monkeypatch.setattr(gc, "_observer_watches", {})
+
+
+def test_two_directories_share_one_started_observer():
+    gc._watch_directory("a", "/etc/one")
+    gc._watch_directory("b", "/etc/two")
+
+    assert len(_FakeObserver.instances) == 1
+    assert _FakeObserver.instances[0].started
+
+
+def test_same_directory_keeps_the_other_handler():
+    first = gc._watch_directory("a", "/etc/hangar")
+    second = gc._watch_directory("b", "/etc/hangar")
+
+    gc._unwatch_directory("a", first)
+
+    observer = _FakeObserver.instances[0]
+    assert observer.handlers == {"/etc/hangar": ["b"]}
+    assert not observer.stopped
+
+    gc._unwatch_directory("b", second)
+
+    assert observer.handlers == {}
+    assert observer.stopped
+
+
+def test_observer_restarts_after_the_last_watch_is_gone():
+    watch = gc._watch_directory("a", "/etc/hangar")
+    gc._unwatch_directory("a", watch)
+
+    gc._watch_directory("a", "/etc/hangar")
+
+    assert len(_FakeObserver.instances) == 2
+    assert _FakeObserver.instances[1].started
@@ -0,0 +1,107 @@
+"""`publish_nowait()` publishes off the caller's thread, in order, with context.
+
+The reload handler hands its three events over this way so that subscriber
+latency stays out of the reload. That is only safe if the deferred path is the
+same `publish` -- persisted, delivered, ordered -- running somewhere else.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+
+import pytest
+
+from mcp_hangar.domain.contracts.event_bus import HandlerKind, IEventBus
+from mcp_hangar.domain.events import McpServerStarted
+from mcp_hangar.infrastructure.event_bus import EventBus
+
+_marker: contextvars.ContextVar[str] = contextvars.ContextVar("_marker", default="unset")
+
+
+def _event(n: int) -> McpServerStarted:
+    return McpServerStarted(mcp_server_id=f"s{n}", mode="subprocess", tools_count=0, startup_duration_ms=1.0)
+
+
+class TestPublishNowait:
+    def test_handlers_run_off_the_callers_thread(self):
+        bus, threads = EventBus(), []
+        bus.subscribe(McpServerStarted, lambda e: threads.append(threading.current_thread()), kind=HandlerKind.EFFECT)
+
+        bus.publish_nowait(_event(1))
+        bus.flush()
+
+        assert threads and threads[0] is not threading.current_thread()
+
+    def test_events_are_delivered_in_hand_over_order(self):
+        bus, seen = EventBus(), []
+        bus.subscribe(McpServerStarted, lambda e: seen.append(e.mcp_server_id), kind=HandlerKind.EFFECT)
+
+        for n in range(50):
+            bus.publish_nowait(_event(n))
+        bus.flush()
+
+        assert seen == [f"s{n}" for n in range(50)]
+
+    def test_the_callers_context_reaches_the_handler(self):
+        bus, seen = EventBus(), []
+        bus.subscribe(McpServerStarted, lambda e: seen.append(_marker.get()), kind=HandlerKind.EFFECT)
+
+        token = _marker.set("caller")
+        try:
+            bus.publish_nowait(_event(1))
+        finally:
+            _marker.reset(token)
+        bus.flush()
+
+        assert seen == ["caller"]
+
+    def test_a_failing_handler_does_not_stop_the_drain(self):
+        bus, seen = EventBus(), []
+
+        def handler(event):
+            if event.mcp_server_id == "s0":
+                raise RuntimeError("boom")
+            seen.append(event.mcp_server_id)
+
+        bus.subscribe(McpServerStarted, handler, kind=HandlerKind.EFFECT)
+        bus.publish_nowait(_event(0))
+        bus.publish_nowait(_event(1))
+        bus.flush()
+
+        assert seen == ["s1"]
+
+    def test_it_refuses_non_events_on_the_callers_thread(self):
+        with pytest.raises(TypeError):
+            EventBus().publish_nowait([_event(1)])
+
+    def test_no_thread_is_started_until_first_use(self):
+        assert EventBus()._drain_thread is None
+
+    def test_flush_gives_up_after_its_timeout(self):
+        bus, release = EventBus(), threading.Event()
+        bus.subscribe(McpServerStarted, lambda e: release.wait(5), kind=HandlerKind.EFFECT)
+
+        bus.publish_nowait(_event(1))
+        try:
+            assert bus.flush(timeout=0.05) is False
+        finally:
+            release.set()
+        assert bus.flush(timeout=5) is True
+
+
+class TestPortDefault:
+    def test_the_port_default_publishes_inline(self):
+        class Recording(IEventBus):
+            def __init__(self):
+                self.published = []
+
+            def publish(self, event):
+                self.published.append(event)
+
+            def publish_aggregate_events(self, aggregate_type, aggregate_id, events):
+                return 0
+
+        bus, event = Recording(), _event(1)
+        bus.publish_nowait(event)
+        assert bus.published == [event]
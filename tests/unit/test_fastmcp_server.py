@@ -3,6 +3,8 @@
 Tests cover the MCPServerFactory and builder pattern.
 """
 
+import subprocess
+import sys
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -66,6 +68,10 @@ class TestHangarFunctions:
         with pytest.raises(Exception):  # FrozenInstanceError
             mock_registry.list = Mock()
 
+    def test_registry_functions_have_no_instance_dict(self, mock_registry):
+        """HangarFunctions is slotted."""
+        assert not hasattr(mock_registry, "__dict__")
+
     def test_discovery_functions_optional(self):
         """Discovery functions can be None."""
         registry = HangarFunctions(
@@ -194,6 +200,12 @@ class TestMCPServerFactory:
 
         assert callable(app)
 
+    def test_asgi_app_is_cached(self, mock_registry):
+        """create_asgi_app() returns same instance on repeated calls."""
+        factory = MCPServerFactory(mock_registry)
+
+        assert factory.create_asgi_app() is factory.create_asgi_app()
+
     def test_builder_method_returns_builder(self, mock_registry):
         """builder() class method returns MCPServerFactoryBuilder."""
         builder = MCPServerFactory.builder()
@@ -267,6 +279,23 @@ class TestMCPServerFactoryReadinessChecks:
 
         assert checks["hangar_list_ok"] is False
 
+    def test_readiness_checks_non_dict_list_response(self):
+        """A reply that is not a dict fails the check even if it mentions the key."""
+        registry = HangarFunctions(
+            list=Mock(return_value="mcp_servers: unavailable"),
+            start=Mock(),
+            stop=Mock(),
+            invoke=Mock(),
+            tools=Mock(),
+            details=Mock(),
+            health=Mock(return_value={"status": "ok"}),
+        )
+        factory = MCPServerFactory(registry)
+        checks = factory._run_readiness_checks()
+
+        assert checks["hangar_list_ok"] is False
+        assert "hangar_list_error" not in checks
+
     def test_readiness_checks_invalid_health_response(self):
         """Readiness checks detect invalid health response."""
         registry = HangarFunctions(
@@ -293,12 +322,30 @@ class TestMCPServerFactoryMetrics:
 
         with pytest.MonkeyPatch().context() as m:
             mock_update = Mock()
-            m.setattr("mcp_hangar.metrics.update_mcp_server_state", mock_update)
+            m.setattr("mcp_hangar.fastmcp_server.factory.update_mcp_server_state", mock_update)
 
             factory._update_metrics()
 
         mock_registry.list.assert_called()
 
+    def test_update_metrics_prefers_mcp_server_id_then_name(self, mock_registry):
+        """Each entry is keyed by mcp_server_id, falling back to name."""
+        mock_registry.list.return_value = {
+            "mcp_servers": [
+                {"mcp_server_id": "a", "name": "ignored", "state": "ready", "mode": "docker"},
+                {"name": "b"},
+            ]
+        }
+        factory = MCPServerFactory(mock_registry)
+
+        with pytest.MonkeyPatch().context() as m:
+            mock_update = Mock()
+            m.setattr("mcp_hangar.fastmcp_server.factory.update_mcp_server_state", mock_update)
+
+            factory._update_metrics()
+
+        assert [c.args for c in mock_update.call_args_list] == [("a", "ready", "docker"), ("b", "cold", "subprocess")]
+
     def test_update_metrics_handles_error(self, mock_registry):
         """_update_metrics handles exceptions gracefully."""
         mock_registry.list.side_effect = RuntimeError("error")
@@ -308,6 +355,58 @@ class TestMCPServerFactoryMetrics:
         factory._update_metrics()
 
 
+class TestDiscoveryToolsWithoutDiscovery:
+    """Discovery and metrics tools answer with an error when not configured."""
+
+    async def test_unconfigured_discovery_tool_returns_error(self, mock_registry):
+        mcp = MCPServerFactory(mock_registry).create_server()
+
+        result = await mcp.call_tool("hangar_approve", {"mcp_server": "x"})
+
+        # A JSON object on the wire, not the repr of some other mapping type.
+        assert '"error": "Discovery not configured"' in str(result)
+
+    async def test_unconfigured_metrics_tool_returns_error(self, mock_registry):
+        mcp = MCPServerFactory(mock_registry).create_server()
+
+        result = await mcp.call_tool("hangar_metrics", {"format": "summary"})
+
+        assert '"error": "Metrics not available"' in str(result)
+
+    async def test_configured_discovery_tool_calls_through(self, mock_registry_with_discovery):
+        mcp = MCPServerFactory(mock_registry_with_discovery).create_server()
+
+        await mcp.call_tool("hangar_approve", {"mcp_server": "x"})
+
+        mock_registry_with_discovery.approve.assert_awaited_once_with(mcp_server="x")
+
+
+class TestMCPServerFactoryFromParts:
+    """Tests for MCPServerFactory.from_parts()."""
+
+    def test_from_parts_assembles_hangar_functions(self, mock_registry):
+        """from_parts() wires each function and the config through."""
+        discover = AsyncMock()
+        config = ServerConfig(port=9000)
+
+        factory = MCPServerFactory.from_parts(
+            list_fn=mock_registry.list,
+            start_fn=mock_registry.start,
+            stop_fn=mock_registry.stop,
+            invoke_fn=mock_registry.invoke,
+            tools_fn=mock_registry.tools,
+            details_fn=mock_registry.details,
+            health_fn=mock_registry.health,
+            discover_fn=discover,
+            config=config,
+        )
+
+        assert factory.hangar.list is mock_registry.list
+        assert factory.hangar.discover is discover
+        assert factory.hangar.metrics is None
+        assert factory.config is config
+
+
 class TestMCPServerFactoryBuilder:
     """Tests for MCPServerFactoryBuilder class."""
 
@@ -452,6 +551,25 @@ class TestMCPServerFactoryBuilder:
         assert factory.config.sse_path == "/custom-sse"
         assert factory.config.message_path == "/custom-messages/"
 
+    def test_builder_freezes_auth_skip_paths(self, mock_registry):
+        """Builder stores auth skip paths as a frozenset, whatever it was given."""
+        factory = (
+            MCPServerFactory.builder()
+            .with_hangar(
+                mock_registry.list,
+                mock_registry.start,
+                mock_registry.stop,
+                mock_registry.invoke,
+                mock_registry.tools,
+                mock_registry.details,
+                mock_registry.health,
+            )
+            .with_config(auth_skip_paths=["/health", "/livez"])
+            .build()
+        )
+
+        assert factory.config.auth_skip_paths == frozenset({"/health", "/livez"})
+
     def test_builder_chaining(self, mock_registry):
         """Builder methods return self for chaining."""
         builder = MCPServerFactory.builder()
@@ -518,6 +636,27 @@ class TestNoSideEffectsOnImport:
         assert hasattr(mod, "MCPServerFactory")
         assert hasattr(mod, "HangarFunctions")
 
+    def test_package_import_does_not_load_the_http_stack(self):
+        """The package and its asgi module resolve Starlette and the factory lazily."""
+        code = (
+            "import sys\n"
+            "import mcp_hangar.fastmcp_server.config, mcp_hangar.fastmcp_server.asgi\n"
+            "heavy = ('starlette.applications', 'mcp_hangar.fastmcp_server.factory')\n"
+            "print(','.join(m for m in heavy if m in sys.modules))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == ""
+
+    def test_building_a_factory_does_not_load_the_protocols(self):
+        """The signature protocols are annotation-only; no runtime path imports them."""
+        code = (
+            "import sys\n"
+            "import mcp_hangar.fastmcp_server.builder, mcp_hangar.fastmcp_server.factory\n"
+            "print('mcp_hangar.fastmcp_server.protocols' in sys.modules)\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False"
+
     def test_import_doesnt_call_hangar_functions(self, mock_registry):
         """Importing and creating factory doesn't call registry functions."""
         _factory = MCPServerFactory(mock_registry)  # noqa: F841
@@ -2,6 +2,7 @@
 
 import os
 import tempfile
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
@@ -32,7 +33,7 @@ class TestReloadConfigurationHandler:
     def mock_event_bus(self):
         """Create mock event bus."""
         bus = Mock()
-        bus.publish.return_value = None
+        bus.publish_nowait.return_value = None
         return bus
 
     @pytest.fixture
@@ -87,7 +88,7 @@ class TestReloadConfigurationHandler:
             handler.handle(command)
 
         # Check first event published
-        first_call = mock_event_bus.publish.call_args_list[0]
+        first_call = mock_event_bus.publish_nowait.call_args_list[0]
         event = first_call[0][0]
         assert isinstance(event, ConfigurationReloadRequested)
         assert event.config_path == temp_config_file
@@ -109,7 +110,7 @@ class TestReloadConfigurationHandler:
             # Check failed event published
             failed_events = [
                 call[0][0]
-                for call in mock_event_bus.publish.call_args_list
+                for call in mock_event_bus.publish_nowait.call_args_list
                 if isinstance(call[0][0], ConfigurationReloadFailed)
             ]
             assert len(failed_events) == 1
@@ -131,15 +132,15 @@ class TestReloadConfigurationHandler:
         with patch("mcp_hangar.server.config.load_config"):
             result = handler.handle(command)
 
-        assert result["success"] is True
-        assert "test-provider" in result["mcp_servers_added"]
-        assert len(result["mcp_servers_removed"]) == 0
-        assert len(result["mcp_servers_updated"]) == 0
+        assert result.success is True
+        assert "test-provider" in result.mcp_servers_added
+        assert len(result.mcp_servers_removed) == 0
+        assert len(result.mcp_servers_updated) == 0
 
         # Check success event published
         success_events = [
             call[0][0]
-            for call in mock_event_bus.publish.call_args_list
+            for call in mock_event_bus.publish_nowait.call_args_list
             if isinstance(call[0][0], ConfigurationReloaded)
         ]
         assert len(success_events) == 1
@@ -188,8 +189,8 @@ class TestReloadConfigurationHandler:
             with patch("mcp_hangar.server.config.load_config"):
                 result = handler.handle(command)
 
-            assert result["success"] is True
-            assert "old-provider" in result["mcp_servers_removed"]
+            assert result.success is True
+            assert "old-provider" in result.mcp_servers_removed
             existing_provider.shutdown.assert_called_once()
             existing_provider.stop.assert_not_called()
             mock_repository.remove.assert_called_once_with("old-provider")
@@ -248,8 +249,8 @@ class TestReloadConfigurationHandler:
             with patch("mcp_hangar.server.config.load_config"):
                 result = handler.handle(command)
 
-            assert result["success"] is True
-            assert "test-provider" in result["mcp_servers_updated"]
+            assert result.success is True
+            assert "test-provider" in result.mcp_servers_updated
             existing_provider.shutdown.assert_called_once()
             existing_provider.stop.assert_not_called()
 
@@ -306,8 +307,8 @@ class TestReloadConfigurationHandler:
             with patch("mcp_hangar.server.config.load_config"):
                 result = handler.handle(command)
 
-            assert result["success"] is True
-            assert "test-provider" in result["mcp_servers_unchanged"]
+            assert result.success is True
+            assert "test-provider" in result.mcp_servers_unchanged
             existing_provider.stop.assert_not_called()
 
         finally:
@@ -403,7 +404,7 @@ class TestReloadConfigurationHandler:
             load_config.assert_not_called()
             failure_events = [
                 call.args[0]
-                for call in mock_event_bus.publish.call_args_list
+                for call in mock_event_bus.publish_nowait.call_args_list
                 if isinstance(call.args[0], ConfigurationReloadFailed)
             ]
             assert len(failure_events) == 1
@@ -480,3 +481,174 @@ class TestReloadIsAnInputErrorNotAnOutage:
         body = response.body.decode()
         assert bad_config not in body
         assert "mcp_servers" not in body
+
+
+class TestReloadDiff:
+    """The diff reads each aggregate's spec once per reload."""
+
+    def test_spec_is_extracted_once_per_aggregate(self) -> None:
+        handler = ReloadConfigurationHandler(Mock(), Mock(), config_loader=ServerConfigLoader())
+        shared = Mock(spec=McpServer)
+        current = {"a": shared, "b": shared}
+        new_config = {"a": {"mode": "subprocess"}, "b": {"mode": "subprocess"}, "c": {}}
+
+        with (
+            patch.object(handler, "_get_mcp_server_spec", return_value={"mode": "subprocess"}) as get_spec,
+            patch.object(handler, "_config_differs", side_effect=[True, False]),
+        ):
+            added, removed, updated, unchanged = handler._diff_mcp_servers(current, new_config)
+
+        get_spec.assert_called_once_with(shared)
+        assert added == {"c"}
+        assert removed == set()
+        assert sorted(updated + unchanged) == ["a", "b"]
+
+
+class TestReloadStops:
+    """Shutdowns for one reload run concurrently and all of them are attempted."""
+
+    def _handler(self) -> ReloadConfigurationHandler:
+        return ReloadConfigurationHandler(Mock(), Mock(), config_loader=ServerConfigLoader())
+
+    def test_shutdowns_overlap(self) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+        servers = [Mock(spec=McpServer) for _ in range(2)]
+        for server in servers:
+            # Each shutdown only returns once the other has started too.
+            server.shutdown.side_effect = lambda: barrier.wait()
+
+        self._handler()._stop_mcp_servers([("a", servers[0]), ("b", servers[1])], graceful=True)
+
+        for server in servers:
+            server.shutdown.assert_called_once()
+
+    def test_every_shutdown_is_attempted_and_the_first_failure_is_reported(self) -> None:
+        failing = Mock(spec=McpServer)
+        failing.shutdown.side_effect = RuntimeError("process did not exit")
+        healthy = Mock(spec=McpServer)
+
+        with pytest.raises(ConfigurationError, match="Failed to stop mcp_server 'a'"):
+            self._handler()._stop_mcp_servers([("a", failing), ("b", healthy)], graceful=True)
+
+        healthy.shutdown.assert_called_once()
+
+
+class TestReloadResult:
+    """The reload result keeps the shape callers have always serialized."""
+
+    def test_to_dict_keeps_the_historical_keys(self) -> None:
+        from mcp_hangar.application.commands import ReloadResult
+
+        result = ReloadResult(
+            config_path="/etc/hangar.yaml",
+            mcp_servers_added=["a"],
+            mcp_servers_removed=["b"],
+            mcp_servers_updated=["c"],
+            mcp_servers_unchanged=["d"],
+            duration_ms=1.5,
+        )
+
+        assert result.to_dict() == {
+            "success": True,
+            "config_path": "/etc/hangar.yaml",
+            "mcp_servers_added": ["a"],
+            "mcp_servers_removed": ["b"],
+            "mcp_servers_updated": ["c"],
+            "mcp_servers_unchanged": ["d"],
+            "duration_ms": 1.5,
+        }
+
+    def test_the_api_encoder_renders_it_as_that_dict(self) -> None:
+        import json
+
+        from mcp_hangar.application.commands import ReloadResult
+        from mcp_hangar.server.api.serializers import HangarJSONEncoder
+
+        result = ReloadResult("/c.yaml", [], [], [], [], 0.0)
+
+        assert json.loads(json.dumps({"result": result}, cls=HangarJSONEncoder)) == {"result": result.to_dict()}
+
+
+class TestConfigDiffers:
+    """Unset fields compare equal to their defaults; real changes are caught."""
+
+    def _differs(self, old: dict, new: dict) -> bool:
+        handler = ReloadConfigurationHandler(Mock(), Mock(), config_loader=ServerConfigLoader())
+        return handler._config_differs(old, new)
+
+    def test_unset_fields_equal_their_defaults(self) -> None:
+        old = {"mode": "subprocess", "idle_ttl_s": 300, "network": "none", "env": {}, "volumes": []}
+        assert self._differs(old, {"mode": "subprocess"}) is False
+
+    def test_none_and_empty_collections_are_the_same(self) -> None:
+        assert self._differs({"env": None, "command": None}, {"env": {}, "command": []}) is False
+
+    def test_a_changed_key_field_differs(self) -> None:
+        assert self._differs({"mode": "subprocess", "user": "1000"}, {"mode": "subprocess", "user": "0"}) is True
+
+    def test_fields_outside_the_key_set_are_ignored(self) -> None:
+        assert self._differs({"description": "a"}, {"description": "b"}) is False
+
+
+class TestReloadNoop:
+    """Re-applying the config that was last applied restarts nothing."""
+
+    _CONFIG = {"mcp_servers": {"a": {"mode": "subprocess", "command": ["python", "-m", "a"]}}}
+
+    def _handler(self, repository: Mock) -> tuple[ReloadConfigurationHandler, Mock]:
+        loader = Mock()
+        loader.load_from_file.return_value = self._CONFIG
+        return ReloadConfigurationHandler(repository, Mock(), config_loader=loader), loader
+
+    def test_an_identical_config_is_not_applied_again(self) -> None:
+        repository = Mock()
+        repository.get_all.return_value = {}
+        handler, loader = self._handler(repository)
+        handler.handle(ReloadConfigurationCommand(config_path="/c.yaml"))
+        repository.get_all.return_value = {"a": Mock(spec=McpServer)}
+
+        result = handler.handle(ReloadConfigurationCommand(config_path="/c.yaml", requested_by="file_watcher"))
+
+        loader.apply_mcp_servers.assert_called_once()
+        assert result.mcp_servers_unchanged == ["a"]
+        assert result.mcp_servers_added == result.mcp_servers_updated == []
+
+    def test_a_repository_that_drifted_is_reconciled(self) -> None:
+        repository = Mock()
+        repository.get_all.return_value = {}
+        handler, loader = self._handler(repository)
+        handler.handle(ReloadConfigurationCommand(config_path="/c.yaml"))
+
+        # "a" was never registered (or was removed since), so the apply runs.
+        handler.handle(ReloadConfigurationCommand(config_path="/c.yaml", requested_by="file_watcher"))
+
+        assert loader.apply_mcp_servers.call_count == 2
+
+    def test_a_forced_reload_always_applies(self) -> None:
+        repository = Mock()
+        repository.get_all.return_value = {}
+        handler, loader = self._handler(repository)
+        handler.handle(ReloadConfigurationCommand(config_path="/c.yaml"))
+        repository.get_all.return_value = {"a": Mock(spec=McpServer)}
+
+        with patch.object(handler, "_get_mcp_server_spec", return_value=self._CONFIG["mcp_servers"]["a"]):
+            handler.handle(ReloadConfigurationCommand(config_path="/c.yaml", graceful=False))
+
+        assert loader.apply_mcp_servers.call_count == 2
+
+    def test_an_explicit_reload_after_an_in_place_update_restarts_the_server(self) -> None:
+        repository = Mock()
+        repository.get_all.return_value = {}
+        handler, loader = self._handler(repository)
+        handler.handle(ReloadConfigurationCommand(config_path="/c.yaml"))
+        updated = Mock(spec=McpServer)
+        updated.shutdown.return_value = None
+        repository.get_all.return_value = {"a": updated}
+        # Changed through the REST update path since the file was applied
+        drifted = {**self._CONFIG["mcp_servers"]["a"], "idle_ttl_s": 30}
+
+        with patch.object(handler, "_get_mcp_server_spec", return_value=drifted):
+            result = handler.handle(ReloadConfigurationCommand(config_path="/c.yaml", requested_by="sighup"))
+
+        assert result.mcp_servers_updated == ["a"]
+        assert loader.apply_mcp_servers.call_count == 2
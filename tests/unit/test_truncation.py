@@ -3,11 +3,14 @@
 import json
 import threading
 import time
+import zlib
 
 import pytest
+from hypothesis import given, strategies as st
 
 from mcp_hangar.domain.contracts.response_cache import NullResponseCache
 from mcp_hangar.domain.value_objects.truncation import ContinuationId, TruncationConfig
+from mcp_hangar.infrastructure.truncation import memory_cache
 from mcp_hangar.infrastructure.truncation.manager import TruncationManager
 from mcp_hangar.infrastructure.truncation.memory_cache import MemoryResponseCache
 from mcp_hangar.server.tools.batch.models import CallResult
@@ -35,6 +38,15 @@ class TestTruncationConfig:
         assert config.enabled is False
         assert config.max_batch_size_bytes == 900_000
 
+    def test_from_dict_empty_shares_one_default(self):
+        """None and {} both return the same frozen default instance."""
+        assert TruncationConfig.from_dict(None) is TruncationConfig.from_dict({})
+        assert TruncationConfig.from_dict(None) == TruncationConfig()
+
+    def test_config_has_no_instance_dict(self):
+        """Slots: no per-instance __dict__."""
+        assert not hasattr(TruncationConfig(), "__dict__")
+
     def test_from_dict_with_values(self):
         """Test from_dict with custom values."""
         data = {
@@ -203,6 +215,24 @@ class TestMemoryResponseCache:
         assert result.has_more is True
         assert result.complete is False
 
+    def test_pages_reassemble_the_serialized_response(self):
+        """Byte pages concatenate back to the JSON of the stored response."""
+        cache = MemoryResponseCache()
+        data = {"text": "caf\u00e9 " * 100, "n": list(range(50))}
+        cache.store("cont_test_0_abc", data, 300)
+
+        pages = []
+        offset = 0
+        while True:
+            result = cache.retrieve("cont_test_0_abc", offset=offset, limit=128)
+            pages.append(result.data)
+            offset += 128
+            if not result.has_more:
+                break
+
+        assert "".join(pages) == json.dumps(data)
+        assert result.total_size_bytes == len(json.dumps(data))
+
     def test_retrieve_offset_past_end(self):
         """Test retrieve with offset past content."""
         cache = MemoryResponseCache()
@@ -233,6 +263,82 @@ class TestMemoryResponseCache:
         time.sleep(1.1)
         assert cache.retrieve("cont_test_0_abc").found is False
 
+    def test_complete_retrieve_parses_the_stored_json(self):
+        """Test the cache keeps the JSON, not a reference to the response."""
+        cache = MemoryResponseCache()
+        response = {"items": [1, 2]}
+        cache.store("cont_1", response, 300)
+        response["items"].append(3)
+
+        result = cache.retrieve("cont_1")
+
+        assert result.data == {"items": [1, 2]}
+        assert result.data is not response
+
+    def test_large_responses_are_stored_compressed(self):
+        """Test a large response is kept compressed and pages back unchanged."""
+        cache = MemoryResponseCache()
+        data = {"rows": [{"id": i, "name": f"row {i}"} for i in range(10_000)]}
+        serialized = json.dumps(data)
+        cache.store("cont_1", data, 300)
+
+        entry = cache._cache["cont_1"]
+        assert entry.compressed is True
+        assert len(entry.serialized) < len(serialized) // 4
+
+        pages = []
+        offset = 0
+        while True:
+            result = cache.retrieve("cont_1", offset=offset, limit=100_000)
+            assert result.total_size_bytes == len(serialized)
+            pages.append(result.data)
+            offset += 100_000
+            if not result.has_more:
+                break
+        assert "".join(pages) == serialized
+        assert cache.retrieve("cont_1").data == data
+
+    def test_paging_a_compressed_response_inflates_each_chunk_a_bounded_number_of_times(self, monkeypatch):
+        """Test a full paging of a compressed entry costs linear, not quadratic, inflation."""
+        cache = MemoryResponseCache()
+        data = {"rows": [{"id": i, "name": f"row {i}"} for i in range(50_000)]}
+        serialized = json.dumps(data)
+        cache.store("cont_1", data, 300)
+        assert cache._cache["cont_1"].compressed is True
+
+        inflated = 0
+        real_decompress = zlib.decompress
+
+        def counting_decompress(data, *args):
+            nonlocal inflated
+            out = real_decompress(data, *args)
+            inflated += len(out)
+            return out
+
+        pages = []
+        offset, limit = 0, 10_000  # smaller than a chunk and not aligned to one
+        monkeypatch.setattr(zlib, "decompress", counting_decompress)
+        while True:
+            result = cache.retrieve("cont_1", offset=offset, limit=limit)
+            pages.append(result.data)
+            offset += limit
+            if not result.has_more:
+                break
+
+        assert "".join(pages) == serialized
+        # Each page inflates at most the two chunks it can straddle
+        assert inflated <= len(pages) * 2 * 64 * 1024
+
+    def test_ttl_ignores_wall_clock_jumps(self, monkeypatch):
+        """Test a wall clock set forward does not expire entries."""
+        cache = MemoryResponseCache()
+        cache.store("cont_1", {"d": 1}, 300)
+        wall = time.time()
+        monkeypatch.setattr(time, "time", lambda: wall + 3600)
+
+        assert cache.retrieve("cont_1").found is True
+        assert cache.clear_expired() == 0
+
     def test_lru_eviction(self):
         """Test LRU eviction when cache is full."""
         cache = MemoryResponseCache(max_entries=3)
@@ -251,6 +357,119 @@ class TestMemoryResponseCache:
         assert cache.retrieve("cont_3").found is True
         assert cache.retrieve("cont_4").found is True
 
+    def test_eviction_gives_each_read_one_second_chance(self):
+        """Test a read spares an entry from one eviction pass only."""
+        cache = MemoryResponseCache(max_entries=2)
+        cache.store("cont_1", {"d": 1}, 300)
+        cache.store("cont_2", {"d": 2}, 300)
+        cache.retrieve("cont_1")
+
+        cache.store("cont_3", {"d": 3}, 300)  # evicts cont_2, requeues cont_1
+        cache.store("cont_4", {"d": 4}, 300)  # evicts cont_1
+
+        assert cache.retrieve("cont_1").found is False
+        assert cache.retrieve("cont_2").found is False
+        assert cache.retrieve("cont_3").found is True
+        assert cache.retrieve("cont_4").found is True
+
+    def test_a_requeued_entry_is_never_absent(self):
+        """Test the second-chance pass moves a read entry rather than popping it."""
+        from collections import OrderedDict
+
+        removed = []
+
+        class RecordingDict(OrderedDict):
+            def __delitem__(self, key):
+                removed.append(key)
+                super().__delitem__(key)
+
+            def popitem(self, last=True):
+                key, value = super().popitem(last)
+                removed.append(key)
+                return key, value
+
+        cache = MemoryResponseCache(max_entries=2)
+        cache._cache = RecordingDict()
+        cache.store("cont_1", {"d": 1}, 300)
+        cache.store("cont_2", {"d": 2}, 300)
+        cache.retrieve("cont_1")
+
+        cache.store("cont_3", {"d": 3}, 300)
+
+        # A lock-free retrieve of cont_1 at any point of the pass would hit
+        assert removed == ["cont_2"]
+        assert cache.retrieve("cont_1").found is True
+
+    def test_full_cache_reaps_expired_before_evicting(self, monkeypatch):
+        """Test expired entries make room before any live entry is evicted."""
+        cache = MemoryResponseCache(max_entries=3)
+        cache.store("cont_live", {"d": 0}, 300)
+        cache.store("cont_old_1", {"d": 1}, 1)
+        cache.store("cont_old_2", {"d": 2}, 1)
+        later = time.monotonic() + 2
+        monkeypatch.setattr(time, "monotonic", lambda: later)
+
+        cache.store("cont_new", {"d": 3}, 300)
+
+        assert cache.size() == 2
+        assert cache.retrieve("cont_live").found is True
+        assert cache.retrieve("cont_new").found is True
+
+    def test_expiry_heap_stays_bounded_below_capacity(self, monkeypatch):
+        """Test a cache that never fills still drops its stale heap items."""
+        cache = MemoryResponseCache(max_entries=10)
+        clock = [time.monotonic()]
+        monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+
+        for i in range(100):
+            cache.store(f"cont_{i}", {"d": i}, 1)
+            cache.delete(f"cont_{i}")
+            clock[0] += 2
+
+        assert len(cache._expiry_heap) <= 20
+
+    def test_full_cache_evicts_a_batch(self):
+        """Test a full cache evicts down to 95% in one pass."""
+        cache = MemoryResponseCache(max_entries=100)
+        for i in range(100):
+            cache.store(f"cont_{i}", {"d": i}, 300)
+
+        cache.store("cont_new", {"d": 0}, 300)
+
+        assert cache.size() == 96
+        assert cache.retrieve("cont_4").found is False
+        assert cache.retrieve("cont_5").found is True
+
+        for i in range(4):
+            cache.store(f"cont_more_{i}", {"d": i}, 300)
+        assert cache.size() == 100
+
+    def test_hit_takes_no_lock(self):
+        """Test retrieving a live entry does not acquire the cache lock."""
+        cache = MemoryResponseCache()
+        cache.store("cont_1", {"d": 1}, 300)
+        cache._lock = None  # any `with self._lock` would raise
+
+        assert cache.retrieve("cont_1").data == {"d": 1}
+
+    def test_logs_outside_the_lock(self, monkeypatch):
+        """Test no log call is made while the cache lock is held."""
+        cache = MemoryResponseCache(max_entries=1)
+        held = []
+
+        def record(*_args, **_kwargs):
+            held.append(cache._lock.locked())
+
+        monkeypatch.setattr(memory_cache.logger, "debug", record)
+        monkeypatch.setattr(memory_cache.logger, "info", record)
+
+        cache.store("cont_1", {"d": 1}, 300)
+        cache.store("cont_2", {"d": 2}, 300)
+        cache.delete("cont_2")
+        cache.clear()
+
+        assert held and not any(held)
+
     def test_clear_expired(self):
         """Test clear_expired removes expired entries."""
         cache = MemoryResponseCache(default_ttl_s=1)
@@ -307,6 +526,166 @@ class TestMemoryResponseCache:
         assert cache.size() <= 100
 
 
+class _FakeRedis:
+    """The slice of redis.Redis the response cache uses, returning bytes like the real client."""
+
+    def __init__(self):
+        self.data: dict[str, bytes] = {}
+        self.gets = 0
+
+    def setex(self, key, ttl_s, value):
+        self.data[key] = value.encode("utf-8") if isinstance(value, str) else value
+
+    def get(self, key):
+        self.gets += 1
+        return self.data.get(key)
+
+    def strlen(self, key):
+        return len(self.data.get(key, b""))
+
+    def getrange(self, key, start, end):
+        value = self.data.get(key, b"")
+        return value[start:] if end == -1 else value[start : end + 1]
+
+    def scan(self, cursor, match, count):
+        prefix = match.rstrip("*")
+        return 0, [key for key in self.data if key.startswith(prefix)]
+
+    def unlink(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def strlen(self, key):
+        self.calls.append(lambda: self.client.strlen(key))
+
+    def getrange(self, key, start, end):
+        self.calls.append(lambda: self.client.getrange(key, start, end))
+
+    def unlink(self, *keys):
+        self.calls.append(lambda: self.client.unlink(*keys))
+
+    def execute(self):
+        return [call() for call in self.calls]
+
+
+class TestRedisResponseCache:
+    """RedisResponseCache against a client that returns raw bytes."""
+
+    @pytest.fixture
+    def cache(self, monkeypatch):
+        import sys
+        import types
+
+        from_url_calls = []
+        client = _FakeRedis()
+
+        def from_url(url, **kwargs):
+            from_url_calls.append(kwargs)
+            return client
+
+        monkeypatch.setitem(sys.modules, "redis", types.SimpleNamespace(from_url=from_url, Redis=_FakeRedis))
+        from mcp_hangar.infrastructure.truncation.redis_cache import RedisResponseCache
+
+        cache = RedisResponseCache("redis://localhost:6379")
+        assert from_url_calls == [{"decode_responses": False}]
+        return cache
+
+    def test_complete_retrieve_decodes_json(self, cache):
+        data = {"key": "caf\u00e9", "n": [1, 2]}
+        cache.store("cont_test_0_abc", data, 300)
+
+        result = cache.retrieve("cont_test_0_abc")
+
+        assert result.complete is True
+        assert result.data == data
+        assert result.total_size_bytes == len(json.dumps(data))
+
+    def test_partial_retrieve_returns_text(self, cache):
+        data = {"large": "x" * 1000}
+        cache.store("cont_test_0_abc", data, 300)
+
+        result = cache.retrieve("cont_test_0_abc", offset=0, limit=100)
+
+        assert result.has_more is True
+        assert result.data == json.dumps(data)[:100]
+
+    def test_pages_are_read_with_getrange(self, cache):
+        data = {"large": "x" * 1000}
+        serialized = json.dumps(data)
+        cache.store("cont_test_0_abc", data, 300)
+        client = cache._client
+
+        pages = []
+        offset = 0
+        while True:
+            result = cache.retrieve("cont_test_0_abc", offset=offset, limit=300)
+            assert result.total_size_bytes == len(serialized)
+            pages.append(result.data)
+            offset += 300
+            if not result.has_more:
+                break
+
+        assert "".join(pages) == serialized
+        assert client.gets == 0
+        assert cache.retrieve("cont_test_0_abc", offset=0, limit=5000).data == data
+        assert cache.retrieve("cont_missing", offset=300, limit=300).found is False
+
+    def test_an_empty_page_reads_only_the_length(self, cache):
+        data = {"large": "x" * 1000}
+        cache.store("cont_test_0_abc", data, 300)
+        client = cache._client
+
+        result = cache.retrieve("cont_test_0_abc", offset=10, limit=0)
+
+        assert result.found is True
+        assert result.data == ""
+        assert result.total_size_bytes == len(json.dumps(data))
+        assert client.gets == 0
+        assert cache.retrieve("cont_missing", offset=0, limit=0).found is False
+
+    def test_clear_unlinks_only_continuations(self, cache):
+        cache.store("cont_test_0_abc", {"d": 1}, 300)
+        cache.store("cont_test_1_abc", {"d": 2}, 300)
+        cache._client.data["other"] = b"kept"
+
+        assert cache.clear() == 2
+        assert cache._client.data == {"other": b"kept"}
+
+
+class TestJsonSize:
+    """_json_size counts UTF-8 bytes without encoding."""
+
+    @pytest.mark.parametrize("data", [{"k": "plain"}, {"k": "\u00e9\u4e2d\U0001f600"}, ["\u00e9", 1, None]])
+    def test_matches_the_encoded_length(self, data):
+        from mcp_hangar.infrastructure.truncation.manager import _json_size
+
+        assert _json_size(data) == len(json.dumps(data).encode("utf-8"))
+
+
+class TestJsonStrLen:
+    """_json_str_len agrees with json.dumps, shortcut or not."""
+
+    @given(text=st.text())
+    def test_matches_json_dumps(self, text):
+        from mcp_hangar.infrastructure.truncation.manager import _json_str_len
+
+        assert _json_str_len(text) == len(json.dumps(text))
+
+    @pytest.mark.parametrize("text", ["", "plain_key", 'say "hi"', "back\\slash", "tab\there", "del\x7f", "caf\u00e9"])
+    def test_escaping_cases(self, text):
+        from mcp_hangar.infrastructure.truncation.manager import _json_str_len
+
+        assert _json_str_len(text) == len(json.dumps(text))
+
+
 class TestTruncationManager:
     """Tests for TruncationManager."""
 
@@ -360,6 +739,55 @@ class TestTruncationManager:
         assert processed[1].truncated is False
         assert processed[0].continuation_id is None
 
+    def test_process_batch_skips_measuring_when_bound_fits(self, monkeypatch):
+        """A batch provably under the limit is never serialized to measure it."""
+        from mcp_hangar.infrastructure.truncation import manager as manager_module
+
+        manager = self.create_manager(max_batch_size_bytes=10000)
+        monkeypatch.setattr(manager_module, "_json_size", pytest.fail)
+
+        results = [self.create_result(0, {"text": "x" * 1000})]
+
+        assert manager.process_batch("batch1", results) is results
+
+    def test_truncate_dict_keeps_small_values_without_measuring(self, monkeypatch):
+        """Values that provably fit their share are kept without serializing them."""
+        from mcp_hangar.infrastructure.truncation import manager as manager_module
+
+        manager = self.create_manager()
+        monkeypatch.setattr(manager_module, "_json_size", pytest.fail)
+
+        data = {"a": "short", "b": [1, 2, 3], "c": {"d": None}}
+
+        assert manager._truncate_dict(data, 200) == data
+
+    def test_cached_size_matches_reported_original_size(self):
+        """A client sees the same byte count in the result and in the cache."""
+        manager = self.create_manager(max_batch_size_bytes=500, min_per_response_bytes=50)
+
+        processed = manager.process_batch("batch1", [self.create_result(0, {"data": "caf\u00e9" * 200})])
+
+        cached = manager._cache.retrieve(processed[0].continuation_id)
+        assert cached.total_size_bytes == processed[0].original_size_bytes
+
+    def test_cache_stores_the_text_the_batch_measured(self, monkeypatch):
+        """Each truncated result is serialized once, for both sizing and the cache."""
+        manager = self.create_manager(max_batch_size_bytes=500, min_per_response_bytes=50)
+        data = {"data": "x" * 1000}
+        dumps = []
+        real_dumps = json.dumps
+
+        def counting_dumps(obj, *args, **kwargs):
+            if obj is data:
+                dumps.append(obj)
+            return real_dumps(obj, *args, **kwargs)
+
+        monkeypatch.setattr(json, "dumps", counting_dumps)
+        processed = manager.process_batch("batch1", [self.create_result(0, data)])
+
+        assert len(dumps) == 1
+        assert manager._cache.retrieve(processed[0].continuation_id).data == data
+
     def test_process_batch_truncates_large_responses(self):
         """Test process_batch truncates when total exceeds limit."""
         manager = self.create_manager(max_batch_size_bytes=500, min_per_response_bytes=50)
@@ -399,6 +827,15 @@ class TestTruncationManager:
         assert cached.found is True
         assert cached.data == original_data
 
+    def test_original_size_is_the_measured_size(self):
+        """The reported original size is the result's serialized size."""
+        manager = self.create_manager(max_batch_size_bytes=200, min_per_response_bytes=50)
+        data = {"data": "\u00e9" * 200}
+
+        processed = manager.process_batch("batch1", [self.create_result(0, data)])
+
+        assert processed[0].original_size_bytes == len(json.dumps(data).encode("utf-8"))
+
     def test_budget_allocation_proportional(self):
         """Test budget is allocated proportionally."""
         manager = self.create_manager(max_batch_size_bytes=1000, min_per_response_bytes=100)
@@ -484,6 +921,93 @@ class TestTruncationManager:
         assert processed[0].truncated is False
 
 
+def _linear_truncate_list(items: list, max_bytes: int) -> list:
+    """The one-length-at-a-time search `_truncate_list` replaced."""
+    for end_index in range(len(items), 0, -1):
+        truncated = items[:end_index]
+        if end_index < len(items):
+            truncated.append(f"[{len(items) - end_index} more items truncated]")
+        if len(json.dumps(truncated).encode("utf-8")) <= max_bytes:
+            return truncated
+    return ["[truncated]"]
+
+
+def _encode_all_truncate_string(text: str, max_bytes: int) -> str:
+    """The full-encode `_truncate_string` replaced, line boundaries off."""
+    available = max_bytes - len(json.dumps("... [truncated]"))
+    if available <= 0:
+        return "[truncated]"
+    text_bytes = text.encode("utf-8")
+    if len(text_bytes) <= available:
+        return text
+    return text_bytes[:available].decode("utf-8", errors="ignore") + "... [truncated]"
+
+
+class TestTruncateStringPrefix:
+    """Encoding only the head cuts at the same byte the full encode did."""
+
+    @given(
+        text=st.text(st.characters(blacklist_categories=("Cs",)), max_size=80),
+        max_bytes=st.integers(min_value=0, max_value=120),
+    )
+    def test_matches_encoding_everything(self, text, max_bytes):
+        manager = TruncationManager(TruncationConfig(truncate_on_line_boundary=False), NullResponseCache())
+
+        assert manager._truncate_string(text, max_bytes) == _encode_all_truncate_string(text, max_bytes)
+
+
+class TestTruncateListSearch:
+    """The binary search keeps exactly the prefix the linear scan kept."""
+
+    _json_values = st.one_of(
+        st.none(),
+        st.integers(),
+        st.text(max_size=20),
+        st.lists(st.integers(), max_size=3),
+        st.dictionaries(st.text(max_size=3), st.text(max_size=5), max_size=2),
+    )
+
+    @given(items=st.lists(_json_values, max_size=60), max_bytes=st.integers(min_value=0, max_value=600))
+    def test_matches_the_linear_scan(self, items, max_bytes):
+        manager = TruncationManager(TruncationConfig(), NullResponseCache())
+
+        assert manager._truncate_list(items, max_bytes) == _linear_truncate_list(items, max_bytes)
+
+    @given(items=st.lists(_json_values, max_size=60), max_bytes=st.integers(min_value=0, max_value=600))
+    def test_known_size_matches_measuring(self, items, max_bytes):
+        from mcp_hangar.infrastructure.truncation.manager import _json_size
+
+        manager = TruncationManager(TruncationConfig(), NullResponseCache())
+
+        assert manager._truncate_list(items, max_bytes, size=_json_size(items)) == manager._truncate_list(
+            items, max_bytes
+        )
+
+
+class TestFitsByUpperBound:
+    """_fits_by_upper_bound never claims a fit that json.dumps would break."""
+
+    _json_values = st.recursive(
+        st.none() | st.booleans() | st.integers() | st.floats() | st.text(),
+        lambda children: st.lists(children, max_size=4) | st.dictionaries(st.text(max_size=5), children, max_size=4),
+        max_leaves=30,
+    )
+
+    @given(values=st.lists(_json_values, max_size=4), limit=st.integers(min_value=0, max_value=2000))
+    def test_bound_is_sound(self, values, limit):
+        from mcp_hangar.infrastructure.truncation.manager import _fits_by_upper_bound
+
+        if _fits_by_upper_bound(values, limit):
+            assert sum(len(json.dumps(v)) for v in values) <= limit
+
+    def test_unmodelled_types_are_not_proven(self):
+        from mcp_hangar.infrastructure.truncation.manager import _fits_by_upper_bound
+
+        assert _fits_by_upper_bound([{"ok": [1, 2.5, None, True]}], 1000) is True
+        assert _fits_by_upper_bound([{1: "int key"}], 1000) is False
+        assert _fits_by_upper_bound([{"set": {1, 2}}], 1000) is False
+
+
 class TestCallResultContinuationId:
     """Tests for continuation_id field on CallResult."""
 